@@ -17,6 +17,23 @@ class Bincount(Benchmark):
         np.bincount(self.d, weights=self.e)
 
 
+class Histogram(Benchmark):
+    params = [[100, 100001]]
+    param_names = ['edges']
+
+    def setup(self, edges):
+        np.random.seed(0)
+        self.d = np.random.lognormal(size=10**6)
+        self.w = np.random.rand(10**6)
+        self.edges = np.logspace(-3, 2, edges)
+
+    def time_edges(self, edges):
+        np.histogram(self.d, self.edges)
+
+    def time_edges_weights(self, edges):
+        np.histogram(self.d, self.edges, weights=self.w)
+
+
 class Median(Benchmark):
     def setup(self):
         self.e = np.arange(10000, dtype=np.float32)
@@ -96,3 +113,18 @@ class Where(Benchmark):
 
     def time_2_broadcast(self):
         np.where(self.cond, self.d, 0)
+
+
+class Vectorize(Benchmark):
+    def setup(self):
+        self.d = np.arange(10**5, dtype=np.float64)
+        self.f = np.vectorize(lambda x: x + 1, otypes='d')
+        self.g = np.vectorize(lambda x: x[::-1].cumsum(),
+                              signature='(n)->(n)')
+        self.e = self.d.reshape(-1, 10)
+
+    def time_otypes(self):
+        self.f(self.d)
+
+    def time_signature(self):
+        self.g(self.e)
@@ -62,3 +62,32 @@ class Savez(Benchmark):
 
     def time_vb_savez_squares(self):
         np.savez('tmp.npz', self.squares)
+
+
+class SavezLarge(Benchmark):
+    params = [False, True]
+    param_names = ['compressed']
+    timeout = 120
+
+    def setup(self, compressed):
+        # Several members of 32 MB each, large enough for the staging of
+        # every member through a file on disk to show up.
+        self.arrays = [np.arange(4 * 1024 ** 2, dtype=np.float64)
+                       for i in range(4)]
+
+    def time_savez_large(self, compressed):
+        if compressed:
+            np.savez_compressed('tmp.npz', *self.arrays)
+        else:
+            np.savez('tmp.npz', *self.arrays)
+
+
+class Savetxt(Benchmark):
+    params = ['float64', 'complex128', 'int64']
+    param_names = ['type']
+
+    def setup(self, typename):
+        self.data = np.arange(20000 * 20, dtype=typename).reshape(20000, 20)
+
+    def time_savetxt(self, typename):
+        np.savetxt('tmp.txt', self.data)
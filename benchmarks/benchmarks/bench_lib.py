@@ -0,0 +1,59 @@
+from __future__ import absolute_import, division, print_function
+
+from .common import Benchmark
+
+import numpy as np
+
+
+class Unique(Benchmark):
+    params = [['small', 'large']]
+    param_names = ['range']
+
+    def setup(self, range_):
+        np.random.seed(0)
+        high = 1000 if range_ == 'small' else 2**40
+        self.d = np.random.randint(0, high, 10**6)
+
+    def time_unique(self, range_):
+        np.unique(self.d)
+
+    def time_unique_all(self, range_):
+        np.unique(self.d, return_index=True, return_inverse=True,
+                  return_counts=True)
+
+
+class UniqueRows(Benchmark):
+    params = [['small int', 'large int', 'float'], ['axis', 'void']]
+    param_names = ['values', 'method']
+
+    def setup(self, values, method):
+        np.random.seed(0)
+        if values == 'small int':
+            d = np.random.randint(0, 100, (10**6, 3))
+        elif values == 'large int':
+            d = np.random.randint(0, 2**40, (10**6, 3))
+        else:
+            d = np.random.randint(0, 100, (10**6, 3)) * 0.5
+        if method == 'void':
+            # The usual trick of viewing the rows as opaque items
+            d = np.ascontiguousarray(d).view(
+                np.dtype((np.void, d.dtype.itemsize * d.shape[1])))
+        self.d = d
+        self.method = method
+
+    def time_unique_rows(self, values, method):
+        if self.method == 'axis':
+            np.unique(self.d, return_inverse=True, axis=0)
+        else:
+            np.unique(self.d, return_inverse=True)
+
+
+class ApplyAlongAxis(Benchmark):
+    def setup(self):
+        self.d = np.ones((10**5, 4))
+
+    def time_scalar(self):
+        np.apply_along_axis(lambda x: x[0], 1, self.d)
+
+    def time_vector(self):
+        np.apply_along_axis(lambda x: x[:2], 1, self.d)
@@ -1,5 +1,8 @@
 from __future__ import division, absolute_import, print_function
 
+import sys
+import warnings
+
 import numpy as np
 from .numeric import uint8, ndarray, dtype
 from numpy.compat import long, basestring
@@ -17,6 +20,53 @@ mode_equivalents = {
     "write":"w+"
     }
 
+# Names of the mmap constants of the access hints of memmap.advise
+valid_advices = {
+    "normal": "MADV_NORMAL",
+    "sequential": "MADV_SEQUENTIAL",
+    "random": "MADV_RANDOM",
+    "willneed": "MADV_WILLNEED",
+    "dontneed": "MADV_DONTNEED",
+    }
+
+# Values of the madvise advices, for calling madvise through ctypes where
+# the mmap module has no madvise method (before Python 3.8).  The first five
+# are the same on Linux, the BSDs and OS X, MADV_HUGEPAGE is Linux only.
+_madvise_values = {
+    "MADV_NORMAL": 0,
+    "MADV_RANDOM": 1,
+    "MADV_SEQUENTIAL": 2,
+    "MADV_WILLNEED": 3,
+    "MADV_DONTNEED": 4,
+    }
+_linux_madvise_values = {"MADV_HUGEPAGE": 14}
+
+# The MAP_POPULATE flag of mmap on Linux, only exported by the mmap module
+# since Python 3.10.
+_linux_map_populate = 0x8000
+
+_libc_madvise = []
+
+
+def _get_libc_madvise():
+    """Return the madvise function of the C library, or None."""
+    if not _libc_madvise:
+        import os
+        madvise = None
+        if os.name == 'posix':
+            import ctypes
+            try:
+                madvise = ctypes.CDLL(None, use_errno=True).madvise
+            except (OSError, AttributeError):
+                pass
+            else:
+                madvise.argtypes = [ctypes.c_void_p, ctypes.c_size_t,
+                                    ctypes.c_int]
+                madvise.restype = ctypes.c_int
+        _libc_madvise.append(madvise)
+    return _libc_madvise[0]
+
+
 class memmap(ndarray):
     """Create a memory-map to an array stored in a *binary* file on disk.
 
@@ -79,6 +129,26 @@ class memmap(ndarray):
         :term:`row-major`, C-style or :term:`column-major`,
         Fortran-style.  This only has an effect if the shape is
         greater than 1-D.  The default order is 'C'.
+    advise : {None, 'normal', 'sequential', 'random', 'willneed', \
+              'dontneed'}, optional
+        Give the kernel a hint about how the array will be accessed, see
+        `memmap.advise`.  Default is None, which gives no hint.
+
+        .. versionadded:: 1.12.0
+    populate : bool, optional
+        If True, all the pages of the array are read into memory when it is
+        created, with the ``MAP_POPULATE`` flag of ``mmap`` on Linux, or by
+        `memmap.prefault` elsewhere.  Default is False.
+
+        .. versionadded:: 1.12.0
+    hugepages : bool, optional
+        If True, give the ``MADV_HUGEPAGE`` hint for the array on Linux.
+        The kernel only backs file mappings with transparent huge pages on
+        file systems that support them, such as tmpfs, or when it is built
+        with read-only huge pages for files; otherwise the hint has no
+        effect or is rejected.  Default is False.
+
+        .. versionadded:: 1.12.0
 
     Attributes
     ----------
@@ -95,6 +165,13 @@ class memmap(ndarray):
         Flush any changes in memory to file on disk.
         When you delete a memmap object, flush is called first to write
         changes to disk before removing the object.
+    start_flusher, stop_flusher
+        Start and stop flushing the changes periodically on a background
+        thread.
+    advise
+        Give the kernel a hint about how the array will be accessed.
+    prefault
+        Read all the pages of the array into memory.
 
 
     Notes
@@ -199,7 +276,8 @@ class memmap(ndarray):
     __array_priority__ = -100.0
 
     def __new__(subtype, filename, dtype=uint8, mode='r+', offset=0,
-                shape=None, order='C'):
+                shape=None, order='C', advise=None, populate=False,
+                hugepages=False):
         # Import here to minimize 'import numpy' overhead
         import mmap
         import os.path
@@ -209,6 +287,9 @@ class memmap(ndarray):
             if mode not in valid_filemodes:
                 raise ValueError("mode must be one of %s" %
                                  (valid_filemodes + list(mode_equivalents.keys())))
+        if advise is not None and advise not in valid_advices:
+            raise ValueError("advise must be one of %s" %
+                             (list(valid_advices.keys()),))
 
         if hasattr(filename, 'read'):
             fid = filename
@@ -257,7 +338,26 @@ class memmap(ndarray):
         start = offset - offset % mmap.ALLOCATIONGRANULARITY
         bytes -= start
         offset -= start
-        mm = mmap.mmap(fid.fileno(), bytes, access=acc, offset=start)
+        map_populate = getattr(mmap, 'MAP_POPULATE', None)
+        if map_populate is None and sys.platform.startswith('linux'):
+            map_populate = _linux_map_populate
+        if populate and map_populate is not None:
+            # The access argument cannot be combined with flags
+            if mode == 'c':
+                flags = mmap.MAP_PRIVATE
+                prot = mmap.PROT_READ | mmap.PROT_WRITE
+            elif mode == 'r':
+                flags = mmap.MAP_SHARED
+                prot = mmap.PROT_READ
+            else:
+                flags = mmap.MAP_SHARED
+                prot = mmap.PROT_READ | mmap.PROT_WRITE
+            flags |= map_populate
+            mm = mmap.mmap(fid.fileno(), bytes, flags=flags, prot=prot,
+                           offset=start)
+            populate = False
+        else:
+            mm = mmap.mmap(fid.fileno(), bytes, access=acc, offset=start)
 
         self = ndarray.__new__(subtype, shape, dtype=descr, buffer=mm,
             offset=offset, order=order)
@@ -278,6 +378,13 @@ class memmap(ndarray):
         if own_file:
             fid.close()
 
+        if hugepages:
+            self._madvise('MADV_HUGEPAGE')
+        if advise is not None:
+            self.advise(advise)
+        if populate:
+            self.prefault()
+
         return self
 
     def __array_finalize__(self, obj):
@@ -292,7 +399,7 @@ class memmap(ndarray):
             self.offset = None
             self.mode = None
 
-    def flush(self):
+    def flush(self, start=None, stop=None, wait=True):
         """
         Write any changes in the array to the file on disk.
 
@@ -300,12 +407,206 @@ class memmap(ndarray):
 
         Parameters
         ----------
-        None
+        start, stop : int, optional
+            Only write the changes in the rows ``start:stop`` of the array,
+            that is its items along the first axis, by syncing only the
+            pages of the memory map that they span.  Default is to write
+            the whole array.
+
+            .. versionadded:: 1.12.0
+        wait : bool, optional
+            If False, the changes are written on a background thread and
+            the method returns immediately.  Default: True.
+
+            .. versionadded:: 1.12.0
+
+        See Also
+        --------
+        memmap, start_flusher
+
+        """
+        if start is None and stop is None:
+            if wait:
+                if self.base is not None and hasattr(self.base, 'flush'):
+                    self.base.flush()
+                return
+            part = self
+        elif self.ndim == 0:
+            raise ValueError("cannot flush a range of rows of a 0-d memmap")
+        else:
+            part = self[start:stop]
+        if self._mmap is None or part.size == 0:
+            return
+        offset, end = part._mmap_region()
+        if wait:
+            self._mmap.flush(offset, end - offset)
+        else:
+            import threading
+            thread = threading.Thread(target=self._mmap.flush,
+                                      args=(offset, end - offset))
+            thread.daemon = True
+            thread.start()
+
+    def start_flusher(self, interval=1.0):
+        """
+        Flush the array periodically on a background thread.
+
+        The thread writes the changes in the array to the file on disk
+        every `interval` seconds, until `stop_flusher` is called or the
+        array is deleted.  A flusher already running for the array is
+        stopped first.
+
+        .. versionadded:: 1.12.0
+
+        Parameters
+        ----------
+        interval : float, optional
+            The time between two flushes, in seconds.  Default: 1.
+
+        See Also
+        --------
+        flush, stop_flusher
+
+        """
+        import threading
+        import weakref
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        self.stop_flusher()
+        stopped = threading.Event()
+        ref = weakref.ref(self)
+
+        def flusher():
+            while not stopped.wait(interval):
+                # Do not keep the array alive between two flushes
+                obj = ref()
+                if obj is None:
+                    return
+                obj.flush()
+                del obj
+
+        thread = threading.Thread(target=flusher)
+        thread.daemon = True
+        self._flusher = (thread, stopped)
+        thread.start()
+
+    def stop_flusher(self):
+        """
+        Stop the thread started by `start_flusher`, and flush the array a
+        last time.
+
+        .. versionadded:: 1.12.0
+
+        See Also
+        --------
+        flush, start_flusher
+
+        """
+        flusher = getattr(self, '_flusher', None)
+        if flusher is None:
+            return
+        thread, stopped = flusher
+        stopped.set()
+        thread.join()
+        self._flusher = None
+        self.flush()
+
+    def advise(self, advice):
+        """
+        Give the kernel a hint about how the array will be accessed.
+
+        This calls ``madvise`` on the pages spanned by the array, which
+        may be a view of a larger memory map.  A RuntimeWarning is given
+        if the hint cannot be given, for instance on Windows.
+
+        .. versionadded:: 1.12.0
+
+        Parameters
+        ----------
+        advice : {'normal', 'sequential', 'random', 'willneed', 'dontneed'}
+            'sequential' and 'random' tune the read-ahead of the kernel to
+            the access pattern, 'willneed' starts reading the pages in the
+            background and 'dontneed' lets the kernel free them.  With a
+            copy-on-write memmap, 'dontneed' discards the changes.
+
+        See Also
+        --------
+        memmap
+
+        """
+        try:
+            name = valid_advices[advice]
+        except KeyError:
+            raise ValueError("advice must be one of %s" %
+                             (list(valid_advices.keys()),))
+        self._madvise(name)
+
+    def prefault(self):
+        """
+        Read all the pages of the array into memory.
+
+        This avoids the page faults, and the latency of the storage, on the
+        first access to each part of the array.
+
+        .. versionadded:: 1.12.0
 
         See Also
         --------
         memmap
 
         """
-        if self.base is not None and hasattr(self.base, 'flush'):
-            self.base.flush()
+        import mmap
+        if self._mmap is None or self.size == 0:
+            return
+        self._madvise('MADV_WILLNEED', warn=False)
+        start, stop = self._mmap_region()
+        # Touch one byte of each page
+        np.frombuffer(self._mmap, dtype=uint8)[start:stop:mmap.PAGESIZE].max()
+
+    def _mmap_region(self):
+        """
+        Return the page aligned range of bytes of the memory map spanned by
+        the array.
+        """
+        import mmap
+        base = np.frombuffer(self._mmap, dtype=uint8).ctypes.data
+        low, high = np.byte_bounds(self)
+        start = low - base
+        start -= start % mmap.PAGESIZE
+        return start, high - base
+
+    def _madvise(self, name, warn=True):
+        """
+        Call madvise with the advice `name` on the pages of the array.
+
+        Returns whether the kernel accepted the advice.  If it did not, or
+        madvise is not available, a RuntimeWarning is given if `warn`.
+        """
+        import mmap
+        if self._mmap is None or self.size == 0:
+            return True
+        start, stop = self._mmap_region()
+        if hasattr(self._mmap, 'madvise') and hasattr(mmap, name):
+            try:
+                self._mmap.madvise(getattr(mmap, name), start, stop - start)
+                return True
+            except (OSError, ValueError) as e:
+                reason = str(e)
+        else:
+            madvise = _get_libc_madvise()
+            value = _madvise_values.get(name)
+            if value is None and sys.platform.startswith('linux'):
+                value = _linux_madvise_values.get(name)
+            if madvise is None or value is None:
+                reason = "not supported on this platform"
+            else:
+                import ctypes
+                import os
+                base = np.frombuffer(self._mmap, dtype=uint8).ctypes.data
+                if madvise(base + start, stop - start, value) == 0:
+                    return True
+                reason = os.strerror(ctypes.get_errno())
+        if warn:
+            warnings.warn("the memory map hint %s could not be given: %s"
+                          % (name, reason), RuntimeWarning, stacklevel=3)
+        return False
@@ -719,12 +719,21 @@ def get_remaining_size(fd):
     return size
 
 def fromfile(fd, dtype=None, shape=None, offset=0, formats=None,
-             names=None, titles=None, aligned=False, byteorder=None):
+             names=None, titles=None, aligned=False, byteorder=None,
+             mmap_mode=None):
     """Create an array from binary file data
 
     If file is a string then that file is opened, else it is assumed
     to be a file object.
 
+    If `mmap_mode` is one of 'r', 'r+' or 'c', the file is memory-mapped
+    with that mode (see `numpy.memmap`) instead of being read, and the
+    returned recarray is a view of the `memmap`.  Accessing a few fields
+    then only reads the corresponding bytes of the file from disk.
+
+    .. versionadded:: 1.12.0
+       The `mmap_mode` argument.
+
     >>> from tempfile import TemporaryFile
     >>> a = np.empty(10,dtype='f8,i4,a5')
     >>> a[5] = (0.5,10,'abcde')
@@ -742,6 +751,9 @@ def fromfile(fd, dtype=None, shape=None, offset=0, formats=None,
     (10,)
     """
 
+    if mmap_mode is not None and mmap_mode not in ('r', 'r+', 'c'):
+        raise ValueError("mmap_mode must be one of 'r', 'r+' or 'c'")
+
     if (shape is None or shape == 0):
         shape = (-1,)
     elif isinstance(shape, (int, long)):
@@ -750,7 +762,7 @@ def fromfile(fd, dtype=None, shape=None, offset=0, formats=None,
     name = 0
     if isinstance(fd, str):
         name = 1
-        fd = open(fd, 'rb')
+        fd = open(fd, 'r+b' if mmap_mode == 'r+' else 'rb')
     if (offset > 0):
         fd.seek(offset, 1)
     size = get_remaining_size(fd)
@@ -766,7 +778,7 @@ def fromfile(fd, dtype=None, shape=None, offset=0, formats=None,
     shapesize = shapeprod * itemsize
     if shapesize < 0:
         shape = list(shape)
-        shape[shape.index(-1)] = size / -shapesize
+        shape[shape.index(-1)] = size // -shapesize
         shape = tuple(shape)
         shapeprod = sb.array(shape).prod()
 
@@ -776,6 +788,21 @@ def fromfile(fd, dtype=None, shape=None, offset=0, formats=None,
         raise ValueError(
                 "Not enough bytes left in file for specified shape and type")
 
+    if mmap_mode is not None and nbytes > 0:
+        # The mapping stays valid once the file is closed
+        from .memmap import memmap
+        start = fd.tell()
+        try:
+            _array = memmap(fd, dtype=descr, mode=mmap_mode,
+                            offset=start, shape=tuple(shape))
+        finally:
+            if name:
+                fd.close()
+            else:
+                # Leave the file positioned after the data, as when reading
+                fd.seek(start + int(nbytes))
+        return _array.view(recarray)
+
     # create the array
     _array = recarray(shape, descr)
     nbytesread = fd.readinto(_array.data)
@@ -787,8 +814,15 @@ def fromfile(fd, dtype=None, shape=None, offset=0, formats=None,
     return _array
 
 def array(obj, dtype=None, shape=None, offset=0, strides=None, formats=None,
-          names=None, titles=None, aligned=False, byteorder=None, copy=True):
+          names=None, titles=None, aligned=False, byteorder=None, copy=True,
+          mmap_mode=None):
     """Construct a record array from a wide-variety of objects.
+
+    If `mmap_mode` is given, `obj` must be a filename or an open file, which
+    is memory-mapped with that mode, see `fromfile`.
+
+    .. versionadded:: 1.12.0
+       The `mmap_mode` argument.
     """
 
     if ((isinstance(obj, (type(None), str)) or isfileobj(obj)) and
@@ -810,6 +844,13 @@ def array(obj, dtype=None, shape=None, offset=0, strides=None, formats=None,
                 'byteorder': byteorder
                 }
 
+    if mmap_mode is not None:
+        if not (isinstance(obj, str) or isfileobj(obj)):
+            raise ValueError("mmap_mode can only be given for a filename or "
+                             "an open file")
+        return fromfile(obj, dtype=dtype, shape=shape, offset=offset,
+                        mmap_mode=mmap_mode, **kwds)
+
     if obj is None:
         if shape is None:
             raise ValueError("Must define a shape if obj is None")
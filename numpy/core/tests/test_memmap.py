@@ -2,6 +2,7 @@ from __future__ import division, absolute_import, print_function
 
 import sys
 import os
+import warnings
 import shutil
 from tempfile import NamedTemporaryFile, TemporaryFile, mktemp, mkdtemp
 
@@ -9,7 +10,7 @@ from numpy import memmap
 from numpy import arange, allclose, asarray
 from numpy.testing import (
     TestCase, run_module_suite, assert_, assert_equal, assert_array_equal,
-    dec
+    assert_raises, assert_no_warnings, dec
 )
 
 class TestMemmap(TestCase):
@@ -126,5 +127,83 @@ class TestMemmap(TestCase):
         new_array = asarray(fp)
         assert_(new_array.base is fp)
 
+    def test_advise_prefault(self):
+        data = arange(5000, dtype=self.dtype)
+        for mode in ['w+', 'r+', 'r', 'c']:
+            for kwargs in [dict(advise='sequential'), dict(populate=True),
+                           dict(hugepages=True, advise='random')]:
+                with warnings.catch_warnings():
+                    # The kernel may reject MADV_HUGEPAGE for the file
+                    warnings.simplefilter('ignore', RuntimeWarning)
+                    fp = memmap(self.tmpfp, dtype=self.dtype, mode=mode,
+                                shape=data.shape, offset=12, **kwargs)
+                if mode == 'w+':
+                    fp[:] = data
+                    fp.flush()
+                assert_array_equal(fp, data)
+                assert_equal(fp.flags.writeable, mode != 'r')
+                for advice in ['normal', 'willneed', 'random']:
+                    fp.advise(advice)
+                    fp[1000:3000:3].advise(advice)
+                fp.prefault()
+                fp[100:].prefault()
+                assert_array_equal(fp, data)
+                if mode == 'c':
+                    fp[0] = -1
+                del fp
+
+        fp = memmap(self.tmpfp, dtype=self.dtype, mode='r')
+        assert_equal(fp[0], 0)
+        assert_raises(ValueError, fp.advise, 'never')
+        assert_raises(ValueError, memmap, self.tmpfp, dtype=self.dtype,
+                      mode='r', advise='never')
+
+    @dec.skipif(not sys.platform.startswith('linux'),
+                "madvise is only known to be available on Linux")
+    def test_advise_applied(self):
+        from numpy.core.memmap import _get_libc_madvise
+        assert_(_get_libc_madvise() is not None)
+        fp = memmap(self.tmpfp, dtype=self.dtype, mode='w+', shape=(5000,),
+                    offset=12)
+        for name in ['MADV_NORMAL', 'MADV_SEQUENTIAL', 'MADV_RANDOM',
+                     'MADV_WILLNEED']:
+            assert_(fp._madvise(name))
+            assert_(fp[1000:3000:3]._madvise(name))
+        assert_no_warnings(fp.advise, 'sequential')
+        del fp
+        fp = memmap(self.tmpfp, dtype=self.dtype, mode='r', populate=True)
+        assert_equal(fp.shape, (5003,))
+        del fp
+
+    def test_flush_range(self):
+        data = arange(20000, dtype=self.dtype).reshape(-1, 4)
+        fp = memmap(self.tmpfp, dtype=self.dtype, mode='w+',
+                    shape=data.shape, offset=12)
+        fp[:] = data
+        fp.flush(100, 4000)
+        fp.flush(start=4000)
+        fp.flush(stop=10)
+        fp.flush(7, 7)
+        fp[10:20].flush()
+        fp.flush(wait=False)
+        fp.flush(0, 10, wait=False)
+        fp.start_flusher(interval=0.01)
+        fp.start_flusher(interval=0.01)
+        fp[0] = -1
+        fp.stop_flusher()
+        fp.stop_flusher()
+        assert_raises(ValueError, fp.start_flusher, 0)
+        fp.start_flusher(interval=0.01)
+        del fp
+
+        data[0] = -1
+        fp = memmap(self.tmpfp, dtype=self.dtype, mode='r',
+                    shape=data.shape, offset=12)
+        assert_array_equal(fp, data)
+        fp.flush(0, 10)
+        assert_raises(ValueError, memmap(self.tmpfp, dtype=self.dtype,
+                                         mode='r', shape=(), offset=12).flush,
+                      0, 1)
+
 if __name__ == "__main__":
     run_module_suite()
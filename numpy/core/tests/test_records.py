@@ -61,6 +61,42 @@ class TestFromrecords(TestCase):
         fd.close()
         assert_equal(r1, r2)
 
+    def test_recarray_fromfile_mmap(self):
+        data_dir = path.join(path.dirname(__file__), 'data')
+        filename = path.join(data_dir, 'recarray_from_file.fits')
+        fd = open(filename, 'rb')
+        fd.seek(2880 * 2)
+        r1 = np.rec.fromfile(fd, formats='f8,i4,a5', shape=3, byteorder='big')
+        fd.seek(2880 * 2)
+        r2 = np.rec.fromfile(fd, formats='f8,i4,a5', shape=3, byteorder='big',
+                             mmap_mode='r')
+        assert_equal(fd.tell(), 2880 * 2 + 3 * 17)
+        fd.close()
+        assert_(isinstance(r2, np.recarray))
+        assert_(isinstance(r2.base, np.memmap))
+        assert_(not r2.flags.writeable)
+        assert_equal(r1, r2)
+        assert_equal(r1.f1, r2.f1)
+
+        for mode in ['r', 'c']:
+            r3 = np.rec.array(filename, formats='f8,i4,a5', shape=3,
+                              byteorder='big', offset=2880 * 2,
+                              mmap_mode=mode)
+            assert_(isinstance(r3.base, np.memmap))
+            assert_equal(r1, r3)
+        r3.f1 = 0
+
+        # Nothing left to map
+        r4 = np.rec.fromfile(filename, formats='f8,i4,a5', mmap_mode='r',
+                             offset=path.getsize(filename))
+        assert_(isinstance(r4, np.recarray))
+        assert_equal(r4.shape, (0,))
+
+        assert_raises(ValueError, np.rec.fromfile, filename,
+                      formats='f8,i4,a5', mmap_mode='w+')
+        assert_raises(ValueError, np.rec.array, [(1, 2)], formats='i4,i4',
+                      mmap_mode='r')
+
     def test_recarray_from_obj(self):
         count = 10
         a = np.zeros(count, dtype='O')
@@ -115,7 +115,7 @@ class _FileOpeners(object):
 
 _file_openers = _FileOpeners()
 
-def open(path, mode='r', destpath=os.curdir):
+def open(path, mode='r', destpath=os.curdir, cache=None):
     """
     Open `path` with `mode` and return the file object.
 
@@ -134,6 +134,11 @@ def open(path, mode='r', destpath=os.curdir):
         Path to the directory where the source file gets downloaded to for
         use.  If `destpath` is None, a temporary directory will be created.
         The default path is the current directory.
+    cache : DecompressedCache, optional
+        If given, a compressed file opened for reading is decompressed
+        into this cache and opened from there.
+
+        .. versionadded:: 1.12.0
 
     Returns
     -------
@@ -148,7 +153,259 @@ def open(path, mode='r', destpath=os.curdir):
     """
 
     ds = DataSource(destpath)
-    return ds.open(path, mode)
+    return ds.open(path, mode, cache=cache)
+
+
+class _LockFile(object):
+    """
+    Context manager holding an exclusive lock file.
+
+    The lock is taken by creating `path` exclusively, which is atomic on
+    local file systems, so that several processes can share a directory.
+    A lock file older than `timeout` seconds is assumed to be left over by
+    a process that died and is broken.
+
+    """
+
+    def __init__(self, path, timeout=600., poll=0.05):
+        self.path = path
+        self.timeout = timeout
+        self.poll = poll
+
+    def __enter__(self):
+        import errno
+        import time
+        while True:
+            try:
+                fd = os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except OSError as e:
+                if e.errno != errno.EEXIST:
+                    raise
+                try:
+                    age = time.time() - os.path.getmtime(self.path)
+                except OSError:
+                    # Released in the meantime
+                    continue
+                if age > self.timeout:
+                    try:
+                        os.remove(self.path)
+                    except OSError:
+                        pass
+                else:
+                    time.sleep(self.poll)
+            else:
+                os.close(fd)
+                return self
+
+    def __exit__(self, *exc_info):
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+
+class DecompressedCache(object):
+    """
+    DecompressedCache(cachedir=None, maxsize=2**30)
+
+    A size-bounded cache of decompressed files.
+
+    Opening a compressed file through the cache decompresses it once into
+    `cachedir`; later opens of the same file read the decompressed copy
+    directly.  Entries are keyed on the absolute path, modification time
+    and size of the compressed file, so a modified file is decompressed
+    again.  When the total size of the cache exceeds `maxsize`, the least
+    recently used entries are removed.
+
+    The cache can be shared by several processes: entries are filled and
+    evicted under lock files and are renamed into place only once
+    complete.
+
+    .. versionadded:: 1.12.0
+
+    Parameters
+    ----------
+    cachedir : str or None, optional
+        Directory holding the decompressed files.  If None, a temporary
+        directory is created, which is deleted with the cache.
+    maxsize : int, optional
+        Maximum total size of the cache in bytes.  The most recently used
+        entry is always kept, even if it is larger.  Default: 1 GiB.
+
+    See Also
+    --------
+    loadtxt, genfromtxt, load : Accept a cache with their `cache` argument.
+
+    Examples
+    --------
+    ::
+
+        >>> cache = np.DecompressedCache('/tmp/npcache', maxsize=2**32)
+        >>> a = np.loadtxt('data.csv.gz', delimiter=',', cache=cache)
+        >>> b = np.loadtxt('data.csv.gz', delimiter=',', cache=cache)  # fast
+
+    """
+
+    _suffix = '.data'
+
+    def __init__(self, cachedir=None, maxsize=2**30):
+        if maxsize < 0:
+            raise ValueError("maxsize must be non-negative")
+        if cachedir:
+            self._cachedir = os.path.abspath(cachedir)
+            self._istmpdir = False
+            if not os.path.isdir(self._cachedir):
+                try:
+                    os.makedirs(self._cachedir)
+                except OSError:
+                    # Created concurrently by another process
+                    if not os.path.isdir(self._cachedir):
+                        raise
+        else:
+            import tempfile  # deferring import to improve startup time
+            self._cachedir = tempfile.mkdtemp()
+            self._istmpdir = True
+        self.maxsize = maxsize
+
+    def __del__(self):
+        if getattr(self, '_istmpdir', False):
+            shutil.rmtree(self._cachedir, ignore_errors=True)
+
+    @property
+    def cachedir(self):
+        """The directory holding the decompressed files."""
+        return self._cachedir
+
+    def _entries(self):
+        """Return (mtime, size, path) for every entry of the cache."""
+        entries = []
+        for name in os.listdir(self._cachedir):
+            if not name.endswith(self._suffix):
+                continue
+            name = os.path.join(self._cachedir, name)
+            try:
+                st = os.stat(name)
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, name))
+        return entries
+
+    def _entry(self, path):
+        """Return the name of the cache entry of the file `path`."""
+        import hashlib
+        st = os.stat(path)
+        key = repr((os.path.abspath(path), st.st_mtime, st.st_size))
+        digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+        return os.path.join(self._cachedir, digest + self._suffix)
+
+    def _fill(self, path, entry):
+        """Decompress `path` into `entry` unless it is already there."""
+        with _LockFile(entry + '.lock'):
+            if os.path.exists(entry):
+                return
+            _fname, ext = os.path.splitext(path)
+            tmp = '%s.%d.tmp' % (entry, os.getpid())
+            try:
+                src = _file_openers[ext](path, 'rb')
+                try:
+                    dst = _open(tmp, 'wb')
+                    try:
+                        shutil.copyfileobj(src, dst, 2**20)
+                    finally:
+                        dst.close()
+                finally:
+                    src.close()
+                # Readers must never see a partially written entry
+                os.rename(tmp, entry)
+            except:
+                if os.path.exists(tmp):
+                    os.remove(tmp)
+                raise
+
+    def _evict(self, keep):
+        """Remove the least recently used entries beyond `maxsize`."""
+        with _LockFile(os.path.join(self._cachedir, '.lock')):
+            entries = sorted(self._entries())
+            total = sum(size for mtime, size, name in entries)
+            for mtime, size, name in entries:
+                if total <= self.maxsize:
+                    break
+                if name == keep:
+                    continue
+                try:
+                    os.remove(name)
+                except OSError:
+                    # Open on Windows or removed by another process
+                    continue
+                total -= size
+
+    def path(self, path):
+        """
+        Return the path of the decompressed copy of a file.
+
+        The file is decompressed into the cache if it is not there yet.
+        Files that are not compressed are returned unchanged.
+
+        Parameters
+        ----------
+        path : str
+            Path of a local, possibly compressed, file.
+
+        Returns
+        -------
+        out : str
+            Path of the decompressed file.
+
+        """
+        _fname, ext = os.path.splitext(path)
+        if not ext or ext not in _file_openers.keys():
+            return path
+        entry = self._entry(path)
+        try:
+            # Mark the entry as most recently used
+            os.utime(entry, None)
+        except OSError:
+            self._fill(path, entry)
+            self._evict(keep=entry)
+        return entry
+
+    def open(self, path, mode='r'):
+        """
+        Open the decompressed copy of a file.
+
+        Parameters
+        ----------
+        path : str
+            Path of a local, possibly compressed, file.
+        mode : str, optional
+            Mode to open the decompressed file with, it must be a read
+            mode.  Default is 'r'.
+
+        Returns
+        -------
+        out : file object
+            The opened file.
+
+        """
+        if any(c in mode for c in 'wa+'):
+            raise ValueError("the cache can only be opened for reading")
+        for attempt in range(2):
+            name = self.path(path)
+            try:
+                return _open(name, mode)
+            except IOError:
+                # Evicted by another process in the meantime
+                if attempt or name == path:
+                    raise
+
+    def clear(self):
+        """Remove all the entries of the cache."""
+        with _LockFile(os.path.join(self._cachedir, '.lock')):
+            for mtime, size, name in self._entries():
+                try:
+                    os.remove(name)
+                except OSError:
+                    pass
 
 
 class DataSource (object):
@@ -458,7 +715,7 @@ class DataSource (object):
                 return False
         return False
 
-    def open(self, path, mode='r'):
+    def open(self, path, mode='r', cache=None):
         """
         Open and return file-like object.
 
@@ -473,6 +730,11 @@ class DataSource (object):
             Mode to open `path`.  Mode 'r' for reading, 'w' for writing,
             'a' to append. Available modes depend on the type of object
             specified by `path`. Default is 'r'.
+        cache : DecompressedCache, optional
+            If given, a compressed file opened for reading is decompressed
+            into this cache and opened from there.
+
+            .. versionadded:: 1.12.0
 
         Returns
         -------
@@ -494,6 +756,9 @@ class DataSource (object):
         found = self._findfile(path)
         if found:
             _fname, ext = self._splitzipext(found)
+            if cache is not None and ext and not self._iswritemode(mode) \
+                    and 'a' not in mode:
+                return cache.open(found, mode)
             if ext == 'bz2':
                 mode.replace("+", "")
             return _file_openers[ext](found, mode=mode)
@@ -619,7 +884,7 @@ class Repository (DataSource):
         """
         return DataSource.exists(self, self._fullpath(path))
 
-    def open(self, path, mode='r'):
+    def open(self, path, mode='r', cache=None):
         """
         Open and return file-like object prepending Repository base URL.
 
@@ -636,6 +901,11 @@ class Repository (DataSource):
             Mode to open `path`.  Mode 'r' for reading, 'w' for writing,
             'a' to append. Available modes depend on the type of object
             specified by `path`. Default is 'r'.
+        cache : DecompressedCache, optional
+            If given, a compressed file opened for reading is decompressed
+            into this cache and opened from there.
+
+            .. versionadded:: 1.12.0
 
         Returns
         -------
@@ -643,7 +913,7 @@ class Repository (DataSource):
             File object.
 
         """
-        return DataSource.open(self, self._fullpath(path), mode)
+        return DataSource.open(self, self._fullpath(path), mode, cache=cache)
 
     def listdir(self):
         """
@@ -724,6 +724,70 @@ class StringConverter(object):
         return self._callingfunction(value)
     #
 
+    def iterconvert(self, values, loose=True):
+        """
+        Convert a sequence of strings.
+
+        The result is the same as calling `_loose_call` (or `_strict_call`
+        if `loose` is False) on each string, but the conversion function is
+        mapped over the whole sequence at once, and the missing values are
+        replaced by the default through a mask, which avoids most of the
+        per-value overhead.
+
+        Parameters
+        ----------
+        values : iterable of str
+            The strings to convert.
+        loose : bool, optional
+            Whether the strings that cannot be converted are replaced by the
+            default (True, the default) or raise a ValueError, unless they
+            are missing values.
+
+        Returns
+        -------
+        out : list
+            The converted values.
+
+        """
+        values = list(values)
+        try:
+            return self._map(values, loose)
+        except (ValueError, OverflowError):
+            pass
+        # Mask the missing values that the function cannot convert
+        missing = set()
+        for value in self.missing_values:
+            try:
+                self.func(value)
+            except ValueError:
+                missing.add(value)
+        ismissing = [value.strip() in missing for value in values]
+        if missing and any(ismissing):
+            if not loose and not self._status:
+                self._checked = False
+            try:
+                converted = iter(self._map(
+                    [v for (v, m) in zip(values, ismissing) if not m], loose))
+            except (ValueError, OverflowError):
+                pass
+            else:
+                default = self.default
+                return [default if m else next(converted) for m in ismissing]
+        # Some values are invalid: convert them one at a time
+        if loose:
+            return [self._loose_call(value) for value in values]
+        return [self._strict_call(value) for value in values]
+    #
+
+    def _map(self, values, loose):
+        """Map the conversion function over `values`, without fallback."""
+        out = list(map(self.func, values))
+        if not loose and self.func is int:
+            # Check for overflows as _strict_call does
+            np.array(out, dtype=self.type)
+        return out
+    #
+
     def upgrade(self, value):
         """
         Find the best converter for a given string, and return the result.
@@ -773,10 +837,8 @@ class StringConverter(object):
         self._checked = True
         if not hasattr(value, '__iter__'):
             value = (value,)
-        _strict_call = self._strict_call
         try:
-            for _m in value:
-                _strict_call(_m)
+            self.iterconvert(value, loose=False)
         except ValueError:
             # Raise an exception if we locked the converter...
             if self._locked:
@@ -19,6 +19,9 @@ Speed could be gained in some operations by an implementation of
 sort(), that can provide directly the permutation vectors, avoiding
 thus calls to argsort().
 
+Membership tests on boolean, integer and floating point arrays use a hash
+table instead of sorting, see `in1d`.
+
 To do: Optionally return indices analogously to unique for all functions.
 
 :Author: Robert Cimrman
@@ -93,7 +96,8 @@ def ediff1d(ary, to_end=None, to_begin=None):
 
     return ed
 
-def unique(ar, return_index=False, return_inverse=False, return_counts=False):
+def unique(ar, return_index=False, return_inverse=False, return_counts=False,
+           axis=None):
     """
     Find the unique elements of an array.
 
@@ -106,7 +110,8 @@ def unique(ar, return_index=False, return_inverse=False, return_counts=False):
     Parameters
     ----------
     ar : array_like
-        Input array. This will be flattened if it is not already 1-D.
+        Input array. Unless `axis` is specified, this will be flattened if it
+        is not already 1-D.
     return_index : bool, optional
         If True, also return the indices of `ar` that result in the unique
         array.
@@ -118,17 +123,26 @@ def unique(ar, return_index=False, return_inverse=False, return_counts=False):
         in `ar`.
 
         .. versionadded:: 1.9.0
+    axis : int or None, optional
+        The axis to operate on. If None, `ar` will be flattened. Otherwise,
+        the unique subarrays indexed by the given axis are found, e.g. the
+        unique rows of a 2-D array for ``axis=0``, sorted in lexicographic
+        order.
+
+        .. versionadded:: 1.12.0
 
     Returns
     -------
     unique : ndarray
-        The sorted unique values.
+        The sorted unique values, or subarrays along `axis`.
     unique_indices : ndarray, optional
         The indices of the first occurrences of the unique values in the
-        (flattened) original array. Only provided if `return_index` is True.
+        original array, flattened or along `axis`. Only provided if
+        `return_index` is True.
     unique_inverse : ndarray, optional
-        The indices to reconstruct the (flattened) original array from the
-        unique array. Only provided if `return_inverse` is True.
+        The indices to reconstruct the original array, flattened or along
+        `axis`, from the unique array. Only provided if `return_inverse` is
+        True.
     unique_counts : ndarray, optional
         The number of times each of the unique values comes up in the
         original array. Only provided if `return_counts` is True.
@@ -172,7 +186,30 @@ def unique(ar, return_index=False, return_inverse=False, return_counts=False):
     >>> u[indices]
     array([1, 2, 6, 4, 2, 3, 2])
 
+    Return the unique rows of a 2D array:
+
+    >>> a = np.array([[1, 0, 0], [1, 0, 0], [2, 3, 4]])
+    >>> np.unique(a, axis=0)
+    array([[1, 0, 0],
+           [2, 3, 4]])
+
+    Notes
+    -----
+    When `ar` is an integer array whose values span a range no larger than
+    its size, the unique values are found by counting the occurrences of
+    each value of the range instead of sorting, in linear time.  The
+    results are the same.
+
+    The subarrays along `axis`, and the items of structured arrays with
+    scalar numeric fields, are compared as rows of values.  Rows of
+    integers are packed into a single integer when their ranges allow it,
+    and are otherwise sorted with `lexsort` over their columns.
+
     """
+    if axis is not None:
+        return _unique_axis(ar, axis, return_index, return_inverse,
+                            return_counts)
+
     ar = np.asanyarray(ar).flatten()
 
     optional_indices = return_index or return_inverse
@@ -191,6 +228,24 @@ def unique(ar, return_index=False, return_inverse=False, return_counts=False):
                 ret += (np.empty(0, np.intp),)
         return ret
 
+    if ar.dtype.names is not None and all(
+            ar.dtype[name].kind in 'biuf' and ar.dtype[name].shape == ()
+            for name in ar.dtype.names):
+        # Compare the fields of the items instead of their bytes
+        columns = [ar[name] for name in ar.dtype.names]
+        ret = _unique_rows(columns, ar.size, return_inverse, return_counts)
+        ret = (ar[ret[0]],) + (ret if return_index else ret[1:])
+        return ret if optional_returns else ret[0]
+
+    if (type(ar) is np.ndarray and ar.dtype.kind in 'iu' and
+            ar.dtype.isnative):
+        # A cheap pass to select counting instead of sorting
+        lo, hi = ar.min(), ar.max()
+        if int(hi) - int(lo) < ar.size:
+            return _unique_counting(ar, lo, int(hi) - int(lo) + 1,
+                                    return_index, return_inverse,
+                                    return_counts)
+
     if optional_indices:
         perm = ar.argsort(kind='mergesort' if return_index else 'quicksort')
         aux = ar[perm]
@@ -215,7 +270,183 @@ def unique(ar, return_index=False, return_inverse=False, return_counts=False):
             ret += (np.diff(idx),)
     return ret
 
-def intersect1d(ar1, ar2, assume_unique=False):
+def _unique_counting(ar, lo, span, return_index, return_inverse,
+                     return_counts):
+    """
+    Implementation of `unique` for a 1-D integer array with values in the
+    range ``lo:lo + span``, based on counting the values.
+
+    """
+    # The differences to lo wrap around for signed types, but are right
+    # when read as unsigned
+    udt = 'u%d' % ar.dtype.itemsize
+    offsets = (ar - lo).view(udt).astype(np.intp)
+    counts = np.bincount(offsets, minlength=span)
+    present = np.flatnonzero(counts)
+    # Adding lo wraps around back to the values
+    ret = (present.astype(ar.dtype) + lo,)
+    if return_index:
+        # np.put assigns in order, so that the first occurrence of each
+        # value is assigned last when going backwards
+        first = np.empty(span, dtype=np.intp)
+        np.put(first, offsets[::-1], np.arange(ar.size - 1, -1, -1))
+        ret += (first[present],)
+    if return_inverse:
+        rank = np.empty(span, dtype=np.intp)
+        rank[present] = np.arange(present.size)
+        ret += (rank[offsets],)
+    if return_counts:
+        ret += (counts[present],)
+    if len(ret) == 1:
+        return ret[0]
+    return ret
+
+
+def _unique_axis(ar, axis, return_index, return_inverse, return_counts):
+    """Implementation of `unique` along an axis."""
+    ar = np.asanyarray(ar)
+    if not -ar.ndim <= axis < ar.ndim:
+        raise ValueError("axis %d is out of bounds for an array of "
+                         "dimension %d" % (axis, ar.ndim))
+    axis %= ar.ndim
+    # The subarrays along axis are the rows of a 2-D table
+    rows = np.moveaxis(ar, axis, 0)
+    rows = rows.reshape(rows.shape[0], int(np.prod(rows.shape[1:])))
+    columns = list(np.ascontiguousarray(rows.T))
+    ret = _unique_rows(columns, len(rows), return_inverse, return_counts)
+    ret = (ar.take(ret[0], axis=axis),) + (ret if return_index else ret[1:])
+    if not (return_index or return_inverse or return_counts):
+        return ret[0]
+    return ret
+
+
+def _pack_columns(columns):
+    """
+    Pack the integer columns of a table in a single int64 key per row,
+    ordered as the rows.  Returns None if the ranges of the columns are too
+    large or the columns are not integer.
+
+    """
+    if not columns or len(columns[0]) == 0:
+        return None
+    ranges = []
+    total = 1
+    for column in columns:
+        if column.dtype.kind not in 'biu':
+            return None
+        if column.dtype.kind == 'b':
+            column = column.view(np.uint8)
+        elif not column.dtype.isnative:
+            column = column.astype(column.dtype.newbyteorder('='))
+        lo, hi = column.min(), column.max()
+        span = int(hi) - int(lo) + 1
+        total *= span
+        if total >= 2**63:
+            return None
+        ranges.append((column, lo, span))
+    keys = np.zeros(len(columns[0]), dtype=np.int64)
+    for column, lo, span in ranges:
+        # The differences to lo wrap around for signed types, but are
+        # right when read as unsigned
+        keys *= span
+        offsets = (column - lo).view('u%d' % column.dtype.itemsize)
+        keys += offsets.astype(np.int64)
+    return keys
+
+
+def _unique_rows(columns, size, return_inverse, return_counts):
+    """
+    Find the unique rows of a table of `size` rows given as a list of 1-D
+    columns.
+
+    Returns a tuple with the indices of the first occurrences of the unique
+    rows, in lexicographic order, followed by the inverse and the counts if
+    requested.
+
+    """
+    keys = _pack_columns(columns)
+    if keys is not None:
+        return unique(keys, True, return_inverse, return_counts)[1:]
+
+    if columns:
+        # lexsort is stable, and sorts on its last key first
+        perm = np.lexsort(columns[::-1])
+    else:
+        perm = np.arange(size)
+    flag = np.zeros(size, dtype=bool)
+    flag[:1] = True
+    for column in columns:
+        column = column[perm]
+        flag[1:] |= column[1:] != column[:-1]
+
+    ret = (perm[flag],)
+    if return_inverse:
+        inv_idx = np.empty(size, dtype=np.intp)
+        inv_idx[perm] = np.cumsum(flag) - 1
+        ret += (inv_idx,)
+    if return_counts:
+        idx = np.concatenate(np.nonzero(flag) + ([size],))
+        ret += (np.diff(idx),)
+    return ret
+
+
+def _sorted_unique(ar):
+    """Return the unique values of a sorted 1-D array."""
+    if ar.size == 0:
+        return ar
+    return ar[np.concatenate(([True], ar[1:] != ar[:-1]))]
+
+
+def _search_sorted(ar1, ar2):
+    """
+    Look the values of the sorted array `ar2` up in the sorted array `ar1`,
+    whose values are unique.
+
+    Returns the indices where the values of `ar2` would be inserted in
+    `ar1`, and a boolean mask of the values that are in `ar1`.  The binary
+    searches of `searchsorted` are cheap for sorted keys, so that looking a
+    small array up in a large one costs little more than a pass over the
+    small one.
+
+    """
+    idx = np.searchsorted(ar1, ar2)
+    if ar1.size == 0:
+        return idx, np.zeros(ar2.size, dtype=bool)
+    return idx, ar1[np.minimum(idx, ar1.size - 1)] == ar2
+
+
+def _in_sorted(ar1, ar2):
+    """
+    Return a boolean mask of the values of the sorted array `ar1`, whose
+    values are unique, that are in the sorted array `ar2`.  The values of
+    the smaller array are looked up in the larger one.
+
+    """
+    if ar1.size <= ar2.size:
+        return _search_sorted(ar2, ar1)[1]
+    idx, found = _search_sorted(ar1, ar2)
+    mask = np.zeros(ar1.size, dtype=bool)
+    mask[idx[found]] = True
+    return mask
+
+
+def _insert_sorted(ar1, ar2, idx, dtype):
+    """
+    Insert the values of the sorted array `ar2` in the sorted array `ar1`
+    at the indices `idx` given by `searchsorted`.
+
+    """
+    # Positions of the values of ar2 in the output
+    pos = idx + np.arange(ar2.size)
+    ret = np.empty(ar1.size + ar2.size, dtype=dtype)
+    ret[pos] = ar2
+    mask = np.ones(ret.size, dtype=bool)
+    mask[pos] = False
+    ret[mask] = ar1
+    return ret
+
+
+def intersect1d(ar1, ar2, assume_unique=False, assume_sorted=False):
     """
     Find the intersection of two arrays.
 
@@ -228,6 +459,13 @@ def intersect1d(ar1, ar2, assume_unique=False):
     assume_unique : bool
         If True, the input arrays are both assumed to be unique, which
         can speed up the calculation.  Default is False.
+    assume_sorted : bool, optional
+        If True, the input arrays are both assumed to be sorted, and the
+        result is found by looking the values of the smaller array up in the
+        larger one with binary searches, instead of sorting their
+        concatenation.  Default is False.
+
+        .. versionadded:: 1.12.0
 
     Returns
     -------
@@ -250,6 +488,24 @@ def intersect1d(ar1, ar2, assume_unique=False):
     >>> reduce(np.intersect1d, ([1, 3, 4, 3], [3, 1, 2, 1], [6, 3, 4, 2]))
     array([3])
     """
+    ar1 = np.asarray(ar1).ravel()
+    ar2 = np.asarray(ar2).ravel()
+    if assume_sorted:
+        # Only the values of the smaller array need to be unique
+        dt = np.result_type(ar1, ar2)
+        if ar1.size > ar2.size:
+            ar1, ar2 = ar2, ar1
+        if not assume_unique:
+            ar1 = _sorted_unique(ar1)
+        return ar1[_in_sorted(ar1, ar2)].astype(dt, copy=False)
+    if _in1d_kind(ar1, ar2) == 'hash':
+        # Only sort the smaller array, and look its values up in a hash
+        # table of the larger one
+        dt = np.result_type(ar1, ar2)
+        if ar1.size > ar2.size:
+            ar1, ar2 = ar2, ar1
+        ar1 = np.sort(ar1) if assume_unique else unique(ar1)
+        return ar1[_in1d_hash(ar1, ar2, False)].astype(dt, copy=False)
     if not assume_unique:
         # Might be faster than unique( intersect1d( ar1, ar2 ) )?
         ar1 = unique(ar1)
@@ -258,7 +514,7 @@ def intersect1d(ar1, ar2, assume_unique=False):
     aux.sort()
     return aux[:-1][aux[1:] == aux[:-1]]
 
-def setxor1d(ar1, ar2, assume_unique=False):
+def setxor1d(ar1, ar2, assume_unique=False, assume_sorted=False):
     """
     Find the set exclusive-or of two arrays.
 
@@ -272,6 +528,13 @@ def setxor1d(ar1, ar2, assume_unique=False):
     assume_unique : bool
         If True, the input arrays are both assumed to be unique, which
         can speed up the calculation.  Default is False.
+    assume_sorted : bool, optional
+        If True, the input arrays are both assumed to be sorted, and the
+        result is found by looking the values of the smaller array up in the
+        larger one with binary searches, instead of sorting their
+        concatenation.  Default is False.
+
+        .. versionadded:: 1.12.0
 
     Returns
     -------
@@ -287,6 +550,26 @@ def setxor1d(ar1, ar2, assume_unique=False):
     array([1, 4, 5, 7])
 
     """
+    if assume_sorted:
+        ar1 = np.asarray(ar1).ravel()
+        ar2 = np.asarray(ar2).ravel()
+        if not assume_unique:
+            ar1 = _sorted_unique(ar1)
+            ar2 = _sorted_unique(ar2)
+        dt = np.result_type(ar1, ar2)
+        if ar1.size < ar2.size:
+            ar1, ar2 = ar2, ar1
+        # Look the smaller array up in the larger one, and remove the
+        # common values from both
+        idx, found = _search_sorted(ar1, ar2)
+        common = np.zeros(ar1.size, dtype=bool)
+        common[idx[found]] = True
+        idx = idx[~found]
+        # Shift the insertion indices by the removed values before them
+        removed = np.cumsum(common)
+        idx -= removed[idx - 1] * (idx > 0)
+        return _insert_sorted(ar1[~common], ar2[~found], idx, dt)
+
     if not assume_unique:
         ar1 = unique(ar1)
         ar2 = unique(ar2)
@@ -302,7 +585,156 @@ def setxor1d(ar1, ar2, assume_unique=False):
     flag2 = flag[1:] == flag[:-1]
     return aux[flag2]
 
-def in1d(ar1, ar2, assume_unique=False, invert=False):
+# Number of values of the first array looked up at once in the hash based
+# membership test, which bounds the size of its temporaries
+_hash_chunksize = 2**16
+
+# Multiplier of the Fibonacci hashing of the keys, 2**64 / golden ratio
+_hash_multiplier = np.uint64(0x9E3779B97F4A7C15)
+
+
+def _hash_dtype(ar1, ar2):
+    """
+    Return the native type both arrays are compared in by the hash based
+    membership test, or None if their types are not supported.
+
+    """
+    try:
+        dt = np.result_type(ar1, ar2)
+    except TypeError:
+        return None
+    if dt.kind not in 'biuf' or dt.itemsize not in (1, 2, 4, 8):
+        return None
+    if dt.kind == 'b':
+        # Booleans cannot be subtracted by the direct-address table
+        dt = np.dtype(np.uint8)
+    return dt.newbyteorder('=')
+
+
+def _in1d_kind(ar1, ar2):
+    """Select the algorithm used by `in1d` for two 1-D arrays."""
+    if len(ar2) < 10 * len(ar1) ** 0.145:
+        return 'loop'
+    if _hash_dtype(ar1, ar2) is not None:
+        return 'hash'
+    return 'sort'
+
+
+def _hash_keys(ar):
+    """Return the values of a 1-D array as uint64 keys of the hash table."""
+    ar = np.ascontiguousarray(ar)
+    keys = ar.view('u%d' % ar.dtype.itemsize).astype(np.uint64)
+    if ar.dtype.kind == 'f':
+        # Make -0.0, which only has the sign bit set, the same key as 0.0
+        keys[keys == np.uint64(1 << (8 * ar.dtype.itemsize - 1))] = 0
+    return keys
+
+
+def _hash_table(keys):
+    """
+    Build an open addressing hash table of uint64 keys.
+
+    Returns the table, a boolean mask of its used slots and the shift giving
+    the slot of a hashed key.  The table has at least four times as many slots
+    as there are keys, and collisions are resolved by linear probing.  The
+    keys are inserted in vectorized rounds: in each round, every pending key
+    tries the next slot of its probe sequence and gives up on it if it is
+    used by another key.
+
+    """
+    bits = max(3, (4 * len(keys) - 1).bit_length())
+    shift = np.uint64(64 - bits)
+    table = np.zeros(2**bits, dtype=np.uint64)
+    used = np.zeros(2**bits, dtype=bool)
+    slots = _hash_slots(keys, shift)
+    while keys.size:
+        free = ~used[slots]
+        # Among the keys trying the same free slot, the last one wins
+        table[slots[free]] = keys[free]
+        used[slots[free]] = True
+        # Placed keys and duplicates of keys already in the table are done
+        pending = table[slots] != keys
+        keys = keys[pending]
+        slots = (slots[pending] + 1) & (len(table) - 1)
+    return table, used, shift
+
+
+def _hash_slots(keys, shift):
+    """Return the first slots of the probe sequences of uint64 keys."""
+    hashes = keys * _hash_multiplier
+    np.right_shift(hashes, shift, out=hashes)
+    return hashes.astype(np.intp)
+
+
+def _hash_lookup(table, used, shift, keys):
+    """Return a boolean mask of the uint64 keys found in a hash table."""
+    slots = _hash_slots(keys, shift)
+    occupied = used[slots]
+    found = occupied & (table[slots] == keys)
+    # The keys whose slot holds another key probe the following slots,
+    # until they find their key or an unused slot
+    index = np.flatnonzero(occupied & ~found)
+    keys = keys[index]
+    slots = slots[index]
+    while index.size:
+        slots = (slots + 1) & (len(table) - 1)
+        occupied = used[slots]
+        hit = occupied & (table[slots] == keys)
+        found[index[hit]] = True
+        pending = occupied & ~hit
+        index = index[pending]
+        keys = keys[pending]
+        slots = slots[pending]
+    return found
+
+
+def _in1d_hash(ar1, ar2, invert):
+    """Implementation of `in1d` with a hash table of the values of `ar2`."""
+    dt = _hash_dtype(ar1, ar2)
+    ar2 = ar2.astype(dt)
+    if dt.kind == 'f':
+        # NaN is not equal to itself
+        ar2 = ar2[~np.isnan(ar2)]
+    ret = np.empty(len(ar1), dtype=bool)
+    if ar2.size == 0:
+        ret.fill(invert)
+        return ret
+
+    lo, hi = ar2.min(), ar2.max()
+    if (dt.kind in 'iu' and
+            int(hi) - int(lo) < max(len(ar1) + len(ar2), 2**16)):
+        # The values span a small range: use their offsets from lo as
+        # indices in a table.  The offsets wrap around, but read as
+        # unsigned they are only in the range of the table for values
+        # between lo and hi; the others are clipped to a last False entry.
+        udt = np.dtype('u%d' % dt.itemsize)
+        span = int(hi) - int(lo) + 1
+        table = np.zeros(span + 1, dtype=bool)
+        table[(ar2 - lo).view(udt)] = True
+        # No clipping is needed if ar2 spans all the values of the type
+        clip = udt.type(span) if span < 2**(8 * dt.itemsize) else None
+
+        def lookup(chunk):
+            offsets = (chunk - lo).view(udt)
+            if clip is not None:
+                np.minimum(offsets, clip, out=offsets)
+            return table[offsets]
+    else:
+        table, used, shift = _hash_table(_hash_keys(ar2))
+
+        def lookup(chunk):
+            return _hash_lookup(table, used, shift, _hash_keys(chunk))
+
+    for start in range(0, len(ar1), _hash_chunksize):
+        chunk = ar1[start:start + _hash_chunksize].astype(dt)
+        found = lookup(chunk)
+        if invert:
+            np.logical_not(found, out=found)
+        ret[start:start + _hash_chunksize] = found
+    return ret
+
+
+def in1d(ar1, ar2, assume_unique=False, invert=False, kind=None):
     """
     Test whether each element of a 1-D array is also present in a second array.
 
@@ -325,6 +757,15 @@ def in1d(ar1, ar2, assume_unique=False, invert=False):
         to (but is faster than) ``np.invert(in1d(a, b))``.
 
         .. versionadded:: 1.8.0
+    kind : {None, 'sort', 'hash'}, optional
+        The algorithm to use. 'sort' sorts the concatenation of both arrays,
+        'hash' looks up the values of `ar1` in a hash table of the values of
+        `ar2`, which takes linear time and only allocates the table and the
+        output beside small temporaries. 'hash' is only available for
+        boolean, integer and floating point arrays. The default, None,
+        selects an algorithm from the sizes and types of the arrays.
+
+        .. versionadded:: 1.12.0
 
     Returns
     -------
@@ -346,6 +787,13 @@ def in1d(ar1, ar2, assume_unique=False, invert=False):
     ``asarray(ar2)`` is an object array rather than the expected array of
     contained values.
 
+    The hash table of 'hash' is a direct-address table when the integer
+    values of `ar2` span a small range, and uses open addressing with
+    linear probing otherwise.  Values are compared by their bits after
+    casting both arrays to a common type, so that the results agree with
+    ``==``: ``-0.0`` and ``0.0`` are considered equal, and NaN is never
+    found.
+
     .. versionadded:: 1.4.0
 
     Examples
@@ -367,8 +815,18 @@ def in1d(ar1, ar2, assume_unique=False, invert=False):
     ar1 = np.asarray(ar1).ravel()
     ar2 = np.asarray(ar2).ravel()
 
+    if kind not in (None, 'sort', 'hash'):
+        raise ValueError("kind must be None, 'sort' or 'hash'")
+    if kind is None:
+        kind = _in1d_kind(ar1, ar2)
+    if kind == 'hash':
+        if _hash_dtype(ar1, ar2) is None:
+            raise TypeError("kind='hash' is not supported for arrays of "
+                            "types %s and %s" % (ar1.dtype, ar2.dtype))
+        return _in1d_hash(ar1, ar2, invert)
+
     # This code is significantly faster when the condition is satisfied.
-    if len(ar2) < 10 * len(ar1) ** 0.145:
+    if kind == 'loop':
         if invert:
             mask = np.ones(len(ar1), dtype=np.bool)
             for a in ar2:
@@ -403,7 +861,7 @@ def in1d(ar1, ar2, assume_unique=False, invert=False):
     else:
         return ret[rev_idx]
 
-def union1d(ar1, ar2):
+def union1d(ar1, ar2, assume_sorted=False):
     """
     Find the union of two arrays.
 
@@ -414,6 +872,13 @@ def union1d(ar1, ar2):
     ----------
     ar1, ar2 : array_like
         Input arrays. They are flattened if they are not already 1D.
+    assume_sorted : bool, optional
+        If True, the input arrays are both assumed to be sorted, and the
+        result is found by looking the values of the smaller array up in the
+        larger one with binary searches, instead of sorting their
+        concatenation.  Default is False.
+
+        .. versionadded:: 1.12.0
 
     Returns
     -------
@@ -436,9 +901,18 @@ def union1d(ar1, ar2):
     >>> reduce(np.union1d, ([1, 3, 4, 3], [3, 1, 2, 1], [6, 3, 4, 2]))
     array([1, 2, 3, 4, 6])
     """
+    if assume_sorted:
+        ar1 = _sorted_unique(np.asarray(ar1).ravel())
+        ar2 = _sorted_unique(np.asarray(ar2).ravel())
+        dt = np.result_type(ar1, ar2)
+        if ar1.size < ar2.size:
+            ar1, ar2 = ar2, ar1
+        # Insert the values of the smaller array missing from the larger one
+        idx, found = _search_sorted(ar1, ar2)
+        return _insert_sorted(ar1, ar2[~found], idx[~found], dt)
     return unique(np.concatenate((ar1, ar2)))
 
-def setdiff1d(ar1, ar2, assume_unique=False):
+def setdiff1d(ar1, ar2, assume_unique=False, assume_sorted=False):
     """
     Find the set difference of two arrays.
 
@@ -453,6 +927,13 @@ def setdiff1d(ar1, ar2, assume_unique=False):
     assume_unique : bool
         If True, the input arrays are both assumed to be unique, which
         can speed up the calculation.  Default is False.
+    assume_sorted : bool, optional
+        If True, the input arrays are both assumed to be sorted, and the
+        result is found by looking the values of the smaller array up in the
+        larger one with binary searches, instead of sorting their
+        concatenation.  Default is False.
+
+        .. versionadded:: 1.12.0
 
     Returns
     -------
@@ -472,9 +953,17 @@ def setdiff1d(ar1, ar2, assume_unique=False):
     array([1, 2])
 
     """
+    if assume_sorted:
+        ar1 = np.asarray(ar1).ravel()
+        if not assume_unique:
+            ar1 = _sorted_unique(ar1)
+        return ar1[~_in_sorted(ar1, np.asarray(ar2).ravel())]
     if assume_unique:
         ar1 = np.asarray(ar1).ravel()
     else:
         ar1 = unique(ar1)
-        ar2 = unique(ar2)
+        ar2 = np.asarray(ar2).ravel()
+        # The hash table does not need the values of ar2 to be unique
+        if _in1d_kind(ar1, ar2) != 'hash':
+            ar2 = unique(ar2)
     return ar1[in1d(ar1, ar2, assume_unique=True, invert=True)]
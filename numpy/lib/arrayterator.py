@@ -9,11 +9,20 @@ a user-specified number of elements.
 """
 from __future__ import division, absolute_import, print_function
 
+import sys
+import time
+import threading
 from operator import mul
 from functools import reduce
 
+import numpy as np
 from numpy.compat import long
 
+if sys.version_info[0] >= 3:
+    import queue
+else:
+    import Queue as queue
+
 __all__ = ['Arrayterator']
 
 
@@ -39,16 +48,40 @@ class Arrayterator(object):
         data that will be read into memory is `buf_size` elements.
         Default is None, which will read as many element as possible
         into memory.
+    prefetch : int, optional
+        The number of blocks read ahead on a background thread while the
+        current one is being processed, so that reading and computing
+        overlap.  Blocks that are views of the object, like slices of a
+        `memmap`, are then copied into memory by the thread.  Default is 0,
+        which reads each block when it is requested.
+
+        .. versionadded:: 1.12.0
+    order : {'C', 'F', 'A'}, optional
+        The memory layout of the object.  The blocks are made contiguous in
+        that layout: with 'F', they are extracted along the first dimensions
+        and iterated over with the first index varying fastest.  'A' means
+        'F' if the object is a Fortran contiguous array, 'C' otherwise.
+        Default is 'C'.
+
+        .. versionadded:: 1.12.0
 
     Attributes
     ----------
     var
     buf_size
+    prefetch
+    order
     start
     stop
     step
     shape
     flat
+    bytes_read : int
+        The number of bytes of all the blocks read so far.
+    wait_time : float
+        The time, in seconds, spent waiting for the blocks to be read.
+        Together with `bytes_read`, this helps to tune `buf_size` and
+        `prefetch`.
 
     See Also
     --------
@@ -65,7 +98,8 @@ class Arrayterator(object):
     ``d1 < buf_size < d1*d2`` the second dimension will be used, and so on.
     Blocks are extracted along this dimension, and when the last block is
     returned the process continues from the next dimension, until all
-    elements have been read.
+    elements have been read.  With ``order='F'``, the dimensions are
+    considered in the reverse order, ``(dn, ..., d2, d1)``.
 
     Examples
     --------
@@ -86,9 +120,23 @@ class Arrayterator(object):
 
     """
 
-    def __init__(self, var, buf_size=None):
+    def __init__(self, var, buf_size=None, prefetch=0, order='C'):
+        if order not in ('C', 'F', 'A'):
+            raise ValueError("order must be one of 'C', 'F' or 'A'")
+        if prefetch < 0:
+            raise ValueError("prefetch must be non-negative")
+        if order == 'A':
+            flags = getattr(var, 'flags', None)
+            if flags is not None and flags.f_contiguous:
+                order = 'F'
+            else:
+                order = 'C'
         self.var = var
         self.buf_size = buf_size
+        self.prefetch = prefetch
+        self.order = order
+        self.bytes_read = 0
+        self.wait_time = 0.
 
         self.start = [0 for dim in var.shape]
         self.stop = [dim for dim in var.shape]
@@ -120,7 +168,8 @@ class Arrayterator(object):
             index += (slice(None),) * (dims-len(index))
 
         # Return a new arrayterator object.
-        out = self.__class__(self.var, self.buf_size)
+        out = self.__class__(self.var, self.buf_size, self.prefetch,
+                             self.order)
         for i, (start, stop, step, slice_) in enumerate(
                 zip(self.start, self.stop, self.step, index)):
             out.start[i] = start + (slice_.start or 0)
@@ -164,6 +213,8 @@ class Arrayterator(object):
 
         """
         for block in self:
+            if self.order == 'F':
+                block = block.T
             for value in block.flat:
                 yield value
 
@@ -179,6 +230,74 @@ class Arrayterator(object):
                 zip(self.start, self.stop, self.step))
 
     def __iter__(self):
+        if self.prefetch:
+            return self._prefetched_blocks()
+        return self._read_blocks()
+
+    def _read(self, slice_):
+        """Read a block, and count its size."""
+        block = self.var[slice_]
+        self.bytes_read += getattr(block, 'nbytes', 0)
+        return block
+
+    def _read_blocks(self):
+        """Generate the blocks, reading each one when it is requested."""
+        for slice_ in self._slices():
+            t0 = time.time()
+            block = self._read(slice_)
+            self.wait_time += time.time() - t0
+            yield block
+
+    def _prefetched_blocks(self):
+        """Generate the blocks, read ahead on a background thread."""
+        blocks = queue.Queue(self.prefetch)
+        stopped = threading.Event()
+        done = object()
+
+        def put(item):
+            # Give up when the consumer has stopped iterating
+            while not stopped.is_set():
+                try:
+                    blocks.put(item, timeout=0.05)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def reader():
+            try:
+                for slice_ in self._slices():
+                    block = self._read(slice_)
+                    if (isinstance(block, np.ndarray) and
+                            not block.flags.owndata):
+                        # Make sure that the data is actually read
+                        block = block.copy(order='K')
+                    if not put((block, None)):
+                        return
+            except Exception as e:
+                put((None, e))
+            else:
+                put((done, None))
+
+        thread = threading.Thread(target=reader)
+        thread.daemon = True
+        thread.start()
+        try:
+            while True:
+                t0 = time.time()
+                block, error = blocks.get()
+                self.wait_time += time.time() - t0
+                if error is not None:
+                    raise error
+                if block is done:
+                    return
+                yield block
+        finally:
+            stopped.set()
+            thread.join()
+
+    def _slices(self):
+        """Generate the index of each block."""
         # Skip arrays with degenerate dimensions
         if [dim for dim in self.shape if dim <= 0]:
             return
@@ -187,6 +306,11 @@ class Arrayterator(object):
         stop = self.stop[:]
         step = self.step[:]
         ndims = len(self.var.shape)
+        # The dimensions, from the fastest to the slowest varying
+        if self.order == 'F':
+            dims = list(range(ndims))
+        else:
+            dims = list(range(ndims-1, -1, -1))
 
         while True:
             count = self.buf_size or reduce(mul, self.shape)
@@ -194,8 +318,8 @@ class Arrayterator(object):
             # iterate over each dimension, looking for the
             # running dimension (ie, the dimension along which
             # the blocks will be built from)
-            rundim = 0
-            for i in range(ndims-1, -1, -1):
+            rundim = dims[-1]
+            for i in dims:
                 # if count is zero we ran out of elements to read
                 # along higher dimensions, so we read only a single position
                 if count == 0:
@@ -210,16 +334,15 @@ class Arrayterator(object):
                 stop[i] = min(self.stop[i], stop[i])
                 count = count//self.shape[i]
 
-            # yield a block
-            slice_ = tuple(slice(*t) for t in zip(start, stop, step))
-            yield self.var[slice_]
+            # yield the index of a block
+            yield tuple(slice(*t) for t in zip(start, stop, step))
 
             # Update start position, taking care of overflow to
             # other dimensions
             start[rundim] = stop[rundim]  # start where we stopped
-            for i in range(ndims-1, 0, -1):
+            for i, j in zip(dims[:-1], dims[1:]):
                 if start[i] >= self.stop[i]:
                     start[i] = self.start[i]
-                    start[i-1] += self.step[i-1]
-            if start[0] >= self.stop[0]:
+                    start[j] += self.step[j]
+            if start[dims[-1]] >= self.stop[dims[-1]]:
                 return
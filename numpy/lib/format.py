@@ -151,6 +151,7 @@ from __future__ import division, absolute_import, print_function
 
 import numpy
 import sys
+import os
 import io
 import warnings
 from numpy.lib.utils import safe_eval
@@ -279,7 +280,7 @@ def header_data_from_array_1_0(array):
     d['descr'] = dtype_to_descr(array.dtype)
     return d
 
-def _write_array_header(fp, d, version=None):
+def _write_array_header(fp, d, version=None, header_len=None):
     """ Write the header for an array and returns the version used
 
     Parameters
@@ -292,6 +293,11 @@ def _write_array_header(fp, d, version=None):
         None means use oldest that works
         explicit version will raise a ValueError if the format does not
         allow saving this data.  Default: None
+    header_len: int or None
+        If given, the header is padded so that the magic string, the header
+        length and the header take exactly this number of bytes, instead of
+        being aligned on a 16-byte boundary.  A ValueError is raised if the
+        header does not fit.  Default: None
     Returns
     -------
     version : tuple of int
@@ -304,14 +310,22 @@ def _write_array_header(fp, d, version=None):
         header.append("'%s': %s, " % (key, repr(value)))
     header.append("}")
     header = "".join(header)
-    # Pad the header with spaces and a final newline such that the magic
-    # string, the header-length short and the header are aligned on a
-    # 16-byte boundary.  Hopefully, some system, possibly memory-mapping,
-    # can take advantage of our premature optimization.
-    current_header_len = MAGIC_LEN + 2 + len(header) + 1  # 1 for the newline
-    topad = 16 - (current_header_len % 16)
-    header = header + ' '*topad + '\n'
-    header = asbytes(_filter_header(header))
+    if header_len is None:
+        # Pad the header with spaces and a final newline such that the magic
+        # string, the header-length short and the header are aligned on a
+        # 16-byte boundary.  Hopefully, some system, possibly memory-mapping,
+        # can take advantage of our premature optimization.
+        current_header_len = MAGIC_LEN + 2 + len(header) + 1  # 1 for newline
+        topad = 16 - (current_header_len % 16)
+        header = header + ' '*topad + '\n'
+        header = asbytes(_filter_header(header))
+    else:
+        header = asbytes(_filter_header(header))
+        prefix_len = MAGIC_LEN + (4 if version == (2, 0) else 2)
+        topad = header_len - prefix_len - len(header) - 1
+        if topad < 0:
+            raise ValueError("Header does not fit in %d bytes" % header_len)
+        header = header + asbytes(' '*topad + '\n')
 
     hlen = len(header)
     if hlen < 256*256 and version in (None, (1, 0)):
@@ -422,6 +436,64 @@ def read_array_header_2_0(fp):
     return _read_array_header(fp, version=(2, 0))
 
 
+def read_header(filename):
+    """
+    Read the metadata of a .npy file without reading the array data.
+
+    .. versionadded:: 1.12.0
+
+    Parameters
+    ----------
+    filename : str or file_like object
+        The name of the file on disk, or a file object located at the
+        beginning of the .npy data.  A file object is left located just
+        after the header.
+
+    Returns
+    -------
+    header : dict
+        A dictionary with the keys:
+
+        version : tuple of int
+            The version of the file format.
+        shape : tuple of int
+            The shape of the array.
+        fortran_order : bool
+            Whether the array data is stored in Fortran order.
+        dtype : dtype
+            The dtype of the array.
+        offset : int
+            The position of the array data, relative to the beginning of
+            the .npy data.
+
+    Raises
+    ------
+    ValueError
+        If the data is not a valid .npy header.
+
+    See Also
+    --------
+    numpy.lib.npyio.NpzFile.info
+
+    """
+    own_fp = False
+    if isinstance(filename, basestring):
+        fp = open(filename, 'rb')
+        own_fp = True
+    else:
+        fp = filename
+    try:
+        version = read_magic(fp)
+        _check_version(version)
+        shape, fortran_order, dtype, offset = _read_array_header(
+            fp, version, return_size=True)
+    finally:
+        if own_fp:
+            fp.close()
+    return dict(version=version, shape=shape, fortran_order=fortran_order,
+                dtype=dtype, offset=offset)
+
+
 def _filter_header(s):
     """Clean up 'L' in npz header ints.
 
@@ -460,9 +532,12 @@ def _filter_header(s):
     return tokenize.untokenize(tokens)
 
 
-def _read_array_header(fp, version):
+def _read_array_header(fp, version, return_size=False):
     """
     see read_array_header_1_0
+
+    If `return_size` is True, the total size in bytes of the magic string
+    and the header is returned as a fourth item.
     """
     # Read an unsigned, little-endian short int which has the length of the
     # header.
@@ -512,6 +587,9 @@ def _read_array_header(fp, version):
         msg = "descr is not a valid dtype descriptor: %r"
         raise ValueError(msg % (d['descr'],))
 
+    if return_size:
+        header_size = MAGIC_LEN + len(hlength_str) + header_length
+        return d['shape'], d['fortran_order'], dtype, header_size
     return d['shape'], d['fortran_order'], dtype
 
 def write_array(fp, array, version=None, allow_pickle=True, pickle_kwargs=None):
@@ -589,7 +667,8 @@ def write_array(fp, array, version=None, allow_pickle=True, pickle_kwargs=None):
                 fp.write(chunk.tobytes('C'))
 
 
-def read_array(fp, allow_pickle=True, pickle_kwargs=None):
+def read_array(fp, allow_pickle=True, pickle_kwargs=None, rows=None,
+               fields=None):
     """
     Read an array from an NPY file.
 
@@ -604,6 +683,18 @@ def read_array(fp, allow_pickle=True, pickle_kwargs=None):
         Additional keyword arguments to pass to pickle.load. These are only
         useful when loading object arrays saved on Python 2 when using
         Python 3.
+    rows : int, slice or sequence of ints, optional
+        Only read these items along the first axis of the array, as if the
+        array was indexed with ``array[rows]``.  The file object must then
+        support ``seek()``.  Only the bytes holding the requested rows are
+        read, with one read for each run of consecutive rows, or, for
+        Fortran-ordered arrays, one read for each run and each column.
+
+        .. versionadded:: 1.12.0
+    fields : str or sequence of str, optional
+        For arrays with a structured dtype, only return these fields.
+
+        .. versionadded:: 1.12.0
 
     Returns
     -------
@@ -615,11 +706,17 @@ def read_array(fp, allow_pickle=True, pickle_kwargs=None):
     ValueError
         If the data is invalid, or allow_pickle=False and the file contains
         an object array.
+    IndexError
+        If `rows` is out of bounds.
 
     """
     version = read_magic(fp)
     _check_version(version)
     shape, fortran_order, dtype = _read_array_header(fp, version)
+    selected = rows is not None or fields is not None
+    if selected and not dtype.hasobject:
+        return _read_array_subset(fp, shape, fortran_order, dtype,
+                                  rows, fields)
     if len(shape) == 0:
         count = 1
     else:
@@ -671,11 +768,116 @@ def read_array(fp, allow_pickle=True, pickle_kwargs=None):
         else:
             array.shape = shape
 
+    if rows is not None:
+        array = array[rows]
+    if fields is not None:
+        array = array[fields]
+    return array
+
+
+def _read_array_subset(fp, shape, fortran_order, dtype, rows, fields):
+    """
+    Read some rows and fields of the array data starting at the current
+    position of `fp`, using only seeks and reads.
+
+    See read_array for the meaning of `rows` and `fields`.
+    """
+    if len(shape) == 0:
+        raise ValueError("rows cannot be selected in a 0-d array")
+    nrows = shape[0]
+    if rows is None:
+        rows = slice(None)
+    if isinstance(rows, slice):
+        index = numpy.arange(*rows.indices(nrows), dtype=numpy.intp)
+    else:
+        index = numpy.array(rows, ndmin=1)
+        if index.ndim != 1:
+            raise ValueError("rows must be an integer, a slice or a 1-d "
+                             "sequence of integers or booleans")
+        if index.dtype == bool:
+            if len(index) != nrows:
+                raise IndexError("boolean rows must have the length of "
+                                 "axis 0, %d" % nrows)
+            index = numpy.nonzero(index)[0]
+        index = index.astype(numpy.intp)
+        index[index < 0] += nrows
+        if len(index) and (index.min() < 0 or index.max() >= nrows):
+            raise IndexError("rows out of bounds for axis 0 with size %d"
+                             % nrows)
+
+    if fields is None:
+        names = None
+        out_dtype = dtype
+    else:
+        if dtype.names is None:
+            raise ValueError("fields can only be selected in structured "
+                             "arrays")
+        names = [fields] if isinstance(fields, basestring) else list(fields)
+        for name in names:
+            if name not in dtype.fields:
+                raise ValueError("no field of name %s" % name)
+        out_dtype = numpy.dtype([(name, dtype.fields[name][0])
+                                 for name in names])
+
+    rowsize = 1
+    for n in shape[1:]:
+        rowsize *= n
+    itemsize = dtype.itemsize
+    offset = fp.tell()
+
+    # Split the index in runs of consecutive rows, read each of them in
+    # pieces of at most BUFFER_SIZE bytes.
+    breaks = numpy.nonzero(numpy.diff(index) != 1)[0] + 1
+    starts = [0] + breaks.tolist()
+    stops = breaks.tolist() + [len(index)]
+
+    def read_into(out, pos, count):
+        fp.seek(pos * itemsize + offset)
+        data = _read_bytes(fp, count * itemsize, "array data")
+        chunk = numpy.frombuffer(data, dtype=dtype).reshape(out.shape)
+        if names is None:
+            out[...] = chunk
+        else:
+            for name in names:
+                out[name] = chunk[name]
+
+    if fortran_order:
+        # The rows are strided, but each column of a run is contiguous.
+        out = numpy.empty((rowsize, len(index)), dtype=out_dtype)
+        step = max(1, BUFFER_SIZE // max(itemsize, 1))
+        for start, stop in zip(starts, stops):
+            if start == stop:
+                continue
+            first = index[start]
+            for col in range(rowsize):
+                for i in range(start, stop, step):
+                    n = min(step, stop - i)
+                    read_into(out[col, i:i+n],
+                              col * nrows + first + i - start, n)
+        array = out.reshape(shape[:0:-1] + (len(index),)).transpose()
+    else:
+        out = numpy.empty((len(index), rowsize), dtype=out_dtype)
+        step = max(1, BUFFER_SIZE // max(rowsize * itemsize, 1))
+        for start, stop in zip(starts, stops):
+            if start == stop:
+                continue
+            first = index[start]
+            for i in range(start, stop, step):
+                n = min(step, stop - i)
+                read_into(out[i:i+n], (first + i - start) * rowsize,
+                          n * rowsize)
+        array = out.reshape((len(index),) + shape[1:])
+
+    if numpy.ndim(rows) == 0 and not isinstance(rows, slice):
+        array = array[0]
+    if isinstance(fields, basestring):
+        array = array[fields]
     return array
 
 
 def open_memmap(filename, mode='r+', dtype=None, shape=None,
-                fortran_order=False, version=None):
+                fortran_order=False, version=None, advise=None,
+                populate=False, hugepages=False):
     """
     Open a .npy file as a memory-mapped array.
 
@@ -706,6 +908,20 @@ def open_memmap(filename, mode='r+', dtype=None, shape=None,
         If the mode is a "write" mode, then this is the version of the file
         format used to create the file.  None means use the oldest
         supported version that is able to store the data.  Default: None
+    advise : str, optional
+        An access hint for the kernel, see `numpy.memmap.advise`.
+        Default: None
+
+        .. versionadded:: 1.12.0
+    populate : bool, optional
+        Whether to read all the pages of the array into memory up front.
+        Default: False
+
+        .. versionadded:: 1.12.0
+    hugepages : bool, optional
+        Whether to give the ``MADV_HUGEPAGE`` hint, on Linux.  Default: False
+
+        .. versionadded:: 1.12.0
 
     Returns
     -------
@@ -780,11 +996,183 @@ def open_memmap(filename, mode='r+', dtype=None, shape=None,
         mode = 'r+'
 
     marray = numpy.memmap(filename, dtype=dtype, shape=shape, order=order,
-        mode=mode, offset=offset)
+        mode=mode, offset=offset, advise=advise, populate=populate,
+        hugepages=hugepages)
 
     return marray
 
 
+class NpyAppender(object):
+    """
+    Write a .npy file incrementally, by appending rows along its first axis.
+
+    Room is reserved in the header of the file, so that only the length of
+    the first axis needs to be rewritten when rows are appended.  The
+    header is updated by `flush` and `close`, after the data has been
+    written to disk, so that after a crash the file holds a valid array
+    made of the rows appended before the last flush.
+
+    .. versionadded:: 1.12.0
+
+    Parameters
+    ----------
+    filename : str
+        The name of the file on disk.
+    dtype : data-type, optional
+        The data type of the array when creating a new file.  The default
+        value is None, which results in a data-type of `float64`.
+    shape : tuple of int, optional
+        The shape of the rows, that is the shape of the array without its
+        first axis, when creating a new file.  Default: ().
+    mode : {'w', 'a'}, optional
+        'w' creates a new file, 'a' appends to an existing C-ordered
+        file, whose header must have room for the growing shape, as the
+        files written by NpyAppender do.  In that mode, `dtype` and `shape`
+        are read from the file.  Default: 'w'.
+    version : tuple of int (major, minor) or None
+        The version of the file format used when creating a new file.  None
+        means use the oldest supported version that is able to store the
+        data.  Default: None
+
+    Attributes
+    ----------
+    dtype : dtype
+        The data type of the array.
+    shape : tuple of int
+        The shape of the array written so far.
+
+    See Also
+    --------
+    open_memmap
+
+    Examples
+    --------
+    >>> from numpy.lib.format import NpyAppender
+    >>> with NpyAppender('/tmp/rows.npy', dtype=int, shape=(3,)) as f:
+    ...     f.append([[1, 2, 3], [4, 5, 6]])
+    ...     f.append([7, 8, 9])
+    >>> np.load('/tmp/rows.npy')
+    array([[1, 2, 3],
+           [4, 5, 6],
+           [7, 8, 9]])
+
+    """
+
+    def __init__(self, filename, dtype=None, shape=(), mode='w',
+                 version=None):
+        if mode not in ('w', 'a'):
+            raise ValueError("mode must be 'w' or 'a'")
+        if mode == 'w':
+            _check_version(version)
+            dtype = numpy.dtype(dtype)
+            if dtype.hasobject:
+                raise ValueError("Rows cannot be appended to object arrays")
+            self.dtype = dtype
+            self._rowshape = tuple(shape)
+            self._nrows = 0
+            # Reserve room for the largest possible length of the first axis
+            s = io.BytesIO()
+            self._version = _write_array_header(
+                s, self._header_data(2**63 - 1), version)
+            self._header_len = len(s.getvalue())
+            self._fp = open(filename, 'wb')
+        else:
+            self._fp = open(filename, 'r+b')
+            try:
+                self._version = read_magic(self._fp)
+                _check_version(self._version)
+                shape, fortran_order, dtype = _read_array_header(
+                    self._fp, self._version)
+                if len(shape) == 0 or (fortran_order and len(shape) > 1):
+                    raise ValueError("Rows can only be appended to C-ordered "
+                                     "arrays of at least one dimension")
+                if dtype.hasobject:
+                    raise ValueError("Rows cannot be appended to object "
+                                     "arrays")
+                self.dtype = dtype
+                self._rowshape = shape[1:]
+                self._nrows = shape[0]
+                self._header_len = self._fp.tell()
+                # Check that the header can hold any length
+                _write_array_header(io.BytesIO(),
+                                    self._header_data(2**63 - 1),
+                                    self._version, self._header_len)
+                # Drop the data written after the last flush
+                self._fp.seek(self._header_len +
+                              self._nrows * self._rowbytes)
+                self._fp.truncate()
+            except:
+                self._fp.close()
+                raise
+        self._write_header()
+
+    @property
+    def shape(self):
+        return (self._nrows,) + self._rowshape
+
+    @property
+    def _rowbytes(self):
+        size = self.dtype.itemsize
+        for n in self._rowshape:
+            size *= n
+        return size
+
+    def _header_data(self, nrows):
+        return dict(descr=dtype_to_descr(self.dtype), fortran_order=False,
+                    shape=(nrows,) + self._rowshape)
+
+    def _write_header(self):
+        self._fp.seek(0)
+        _write_array_header(self._fp, self._header_data(self._nrows),
+                            self._version, self._header_len)
+        self._fp.flush()
+        self._fp.seek(0, 2)
+
+    def append(self, rows):
+        """
+        Append rows to the file.
+
+        Parameters
+        ----------
+        rows : array_like
+            The rows to append, of shape ``(n,) + shape[1:]``, or a single
+            row of shape ``shape[1:]``.  They are cast to `dtype`.
+
+        """
+        rows = numpy.asarray(rows, dtype=self.dtype)
+        if rows.shape == self._rowshape:
+            rows = rows.reshape((1,) + self._rowshape)
+        if rows.shape[1:] != self._rowshape:
+            raise ValueError("Rows of shape %s cannot be appended to an "
+                             "array of shape %s" % (rows.shape, self.shape))
+        self._fp.write(numpy.ascontiguousarray(rows).tobytes())
+        self._nrows += rows.shape[0]
+
+    def flush(self):
+        """
+        Write the data to disk and update the header of the file.
+        """
+        self._fp.flush()
+        os.fsync(self._fp.fileno())
+        self._write_header()
+
+    def close(self):
+        """
+        Flush and close the file.
+        """
+        if not self._fp.closed:
+            try:
+                self.flush()
+            finally:
+                self._fp.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
 def _read_bytes(fp, size, error_template="ran out of data"):
     """
     Read from file-like object until size bytes are read.
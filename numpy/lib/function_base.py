@@ -4,6 +4,7 @@ import warnings
 import sys
 import collections
 import operator
+import re
 
 import numpy as np
 import numpy.core.numeric as _nx
@@ -22,6 +23,7 @@ from numpy.core.fromnumeric import (
     )
 from numpy.core.numerictypes import typecodes, number
 from numpy.lib.twodim_base import diag
+from numpy.lib.stride_tricks import _broadcast_shape, as_strided, broadcast_to
 from .utils import deprecate
 from numpy.core.multiarray import _insert, add_docstring
 from numpy.core.multiarray import digitize, bincount, interp as compiled_interp
@@ -38,10 +40,11 @@ __all__ = [
     'select', 'piecewise', 'trim_zeros', 'copy', 'iterable', 'percentile',
     'diff', 'gradient', 'angle', 'unwrap', 'sort_complex', 'disp',
     'extract', 'place', 'vectorize', 'asarray_chkfinite', 'average',
-    'histogram', 'histogramdd', 'bincount', 'digitize', 'cov', 'corrcoef',
-    'msort', 'median', 'sinc', 'hamming', 'hanning', 'bartlett',
-    'blackman', 'kaiser', 'trapz', 'i0', 'add_newdoc', 'add_docstring',
-    'meshgrid', 'delete', 'insert', 'append', 'interp', 'add_newdoc_ufunc'
+    'histogram', 'histogramdd', 'HistogramAccumulator', 'bincount',
+    'digitize', 'cov', 'corrcoef', 'msort', 'median', 'sinc', 'hamming',
+    'hanning', 'bartlett', 'blackman', 'kaiser', 'trapz', 'i0', 'add_newdoc',
+    'add_docstring', 'meshgrid', 'delete', 'insert', 'append', 'interp',
+    'add_newdoc_ufunc'
     ]
 
 
@@ -262,6 +265,91 @@ _hist_bin_selectors = {'auto': _hist_bin_auto,
                        'sqrt': _hist_bin_sqrt,
                        'sturges': _hist_bin_sturges}
 
+# We set a block size, as this allows us to iterate over chunks when
+# computing histograms, to minimize memory usage.
+_HIST_BLOCK = 65536
+
+
+def _hist_uniform_block(n, a, w, mn, mx, norm):
+    """
+    Add the (weighted) counts of the values of `a` to `n`, which holds
+    the histogram of ``len(n)`` bins of equal width between `mn` and
+    `mx`. `norm` is the number of bins per unit of `a`.
+    """
+    bins = len(n)
+    # Only include values in the right range
+    keep = (a >= mn)
+    keep &= (a <= mx)
+    if not np.logical_and.reduce(keep):
+        a = a[keep]
+        if w is not None:
+            w = w[keep]
+    a = a.astype(float)
+    a -= mn
+    a *= norm
+
+    # Compute the bin indices, and for values that lie exactly on mx we
+    # need to subtract one
+    indices = a.astype(np.intp)
+    indices[indices == bins] -= 1
+
+    # We now compute the histogram using bincount
+    if w is None:
+        n += np.bincount(indices, minlength=bins).astype(n.dtype)
+    elif n.dtype.kind == 'c':
+        n.real += np.bincount(indices, weights=w.real, minlength=bins)
+        n.imag += np.bincount(indices, weights=w.imag, minlength=bins)
+    else:
+        n += np.bincount(indices, weights=w, minlength=bins).astype(n.dtype)
+
+
+def _hist_edges_block(n, a, w, bins):
+    """
+    Add the (weighted) counts of the values of `a` to `n`, which holds
+    the histogram of the bins with the edges `bins`.
+    """
+    if len(bins) <= _HIST_BLOCK and (w is None or
+                                     np.can_cast(w.dtype, np.double) or
+                                     np.can_cast(w.dtype, np.complex)):
+        # Find the bin of each value with a binary search in the edges,
+        # which is cheaper than sorting the block unless there are more
+        # edges than values in a block. The values that lie exactly on
+        # the last edge belong to the last bin.
+        indices = bins.searchsorted(a, 'right')
+        indices[a == bins[-1]] -= 1
+
+        # Only include values in the right range
+        keep = (indices > 0)
+        keep &= (indices < len(bins))
+        if not np.logical_and.reduce(keep):
+            indices = indices[keep]
+            if w is not None:
+                w = w[keep]
+        indices -= 1
+
+        nbins = len(n)
+        if w is None:
+            n += np.bincount(indices, minlength=nbins).astype(n.dtype)
+        elif n.dtype.kind == 'c':
+            n.real += np.bincount(indices, weights=w.real, minlength=nbins)
+            n.imag += np.bincount(indices, weights=w.imag, minlength=nbins)
+        else:
+            n += np.bincount(indices, weights=w,
+                             minlength=nbins).astype(n.dtype)
+    elif w is None:
+        sa = sort(a)
+        n += np.diff(np.r_[sa.searchsorted(bins[:-1], 'left'),
+                           sa.searchsorted(bins[-1], 'right')])
+    else:
+        zero = array(0, dtype=n.dtype)
+        sorting_index = np.argsort(a)
+        sa = a[sorting_index]
+        sw = w[sorting_index]
+        cw = np.concatenate(([zero, ], sw.cumsum()))
+        bin_index = np.r_[sa.searchsorted(bins[:-1], 'left'),
+                          sa.searchsorted(bins[-1], 'right')]
+        n += np.diff(cw[bin_index])
+
 
 def histogram(a, bins=10, range=None, normed=False, weights=None,
               density=None):
@@ -513,10 +601,6 @@ def histogram(a, bins=10, range=None, normed=False, weights=None,
     else:
         ntype = weights.dtype
 
-    # We set a block size, as this allows us to iterate over chunks when
-    # computing histograms, to minimize memory usage.
-    BLOCK = 65536
-
     if not iterable(bins):
         if np.isscalar(bins) and bins < 1:
             raise ValueError(
@@ -550,35 +634,12 @@ def histogram(a, bins=10, range=None, normed=False, weights=None,
         # large arrays, it is actually faster (for example for a 10^8 array it
         # is 2x as fast) and it results in a memory footprint 3x lower in the
         # limit of large arrays.
-        for i in arange(0, len(a), BLOCK):
-            tmp_a = a[i:i+BLOCK]
+        for i in arange(0, len(a), _HIST_BLOCK):
             if weights is None:
                 tmp_w = None
             else:
-                tmp_w = weights[i:i + BLOCK]
-
-            # Only include values in the right range
-            keep = (tmp_a >= mn)
-            keep &= (tmp_a <= mx)
-            if not np.logical_and.reduce(keep):
-                tmp_a = tmp_a[keep]
-                if tmp_w is not None:
-                    tmp_w = tmp_w[keep]
-            tmp_a = tmp_a.astype(float)
-            tmp_a -= mn
-            tmp_a *= norm
-
-            # Compute the bin indices, and for values that lie exactly on mx we
-            # need to subtract one
-            indices = tmp_a.astype(np.intp)
-            indices[indices == bins] -= 1
-
-            # We now compute the histogram using bincount
-            if ntype.kind == 'c':
-                n.real += np.bincount(indices, weights=tmp_w.real, minlength=bins)
-                n.imag += np.bincount(indices, weights=tmp_w.imag, minlength=bins)
-            else:
-                n += np.bincount(indices, weights=tmp_w, minlength=bins).astype(ntype)
+                tmp_w = weights[i:i + _HIST_BLOCK]
+            _hist_uniform_block(n, a[i:i + _HIST_BLOCK], tmp_w, mn, mx, norm)
 
         # We now compute the bin edges since these are returned
         bins = linspace(mn, mx, bins + 1, endpoint=True)
@@ -589,28 +650,14 @@ def histogram(a, bins=10, range=None, normed=False, weights=None,
                 'bins must increase monotonically.')
 
         # Initialize empty histogram
-        n = np.zeros(bins.shape, ntype)
-
-        if weights is None:
-            for i in arange(0, len(a), BLOCK):
-                sa = sort(a[i:i+BLOCK])
-                n += np.r_[sa.searchsorted(bins[:-1], 'left'),
-                           sa.searchsorted(bins[-1], 'right')]
-        else:
-            zero = array(0, dtype=ntype)
-            for i in arange(0, len(a), BLOCK):
-                tmp_a = a[i:i+BLOCK]
-                tmp_w = weights[i:i+BLOCK]
-                sorting_index = np.argsort(tmp_a)
-                sa = tmp_a[sorting_index]
-                sw = tmp_w[sorting_index]
-                cw = np.concatenate(([zero, ], sw.cumsum()))
-                bin_index = np.r_[sa.searchsorted(bins[:-1], 'left'),
-                                  sa.searchsorted(bins[-1], 'right')]
-                n += cw[bin_index]
-
+        n = np.zeros(len(bins) - 1, ntype)
 
-        n = np.diff(n)
+        for i in arange(0, len(a), _HIST_BLOCK):
+            if weights is None:
+                tmp_w = None
+            else:
+                tmp_w = weights[i:i + _HIST_BLOCK]
+            _hist_edges_block(n, a[i:i + _HIST_BLOCK], tmp_w, bins)
 
     if density is not None:
         if density:
@@ -627,6 +674,229 @@ def histogram(a, bins=10, range=None, normed=False, weights=None,
             return n, bins
 
 
+class HistogramAccumulator(object):
+    """
+    HistogramAccumulator(bins=10, range=None, weights_dtype=None)
+
+    Accumulate a histogram over a stream of data.
+
+    The data are added chunk by chunk with `update`, so that the
+    histogram of data that do not fit in memory can be computed, and
+    the partial histograms of several accumulators with the same bins,
+    e.g. computed by different processes, can be combined with `merge`.
+    The counts are computed in the same way as by `histogram`, and the
+    result is the same as the histogram of all the chunks at once.
+
+    .. versionadded:: 1.12.0
+
+    Parameters
+    ----------
+    bins : int or sequence of scalars, optional
+        If `bins` is an int, it defines the number of equal-width bins
+        in `range` (10, by default). If `bins` is a sequence, it defines
+        the bin edges, including the rightmost edge, allowing for
+        non-uniform bin widths.
+    range : (float, float), optional
+        The lower and upper range of the bins. It is required if `bins`
+        is an int, as it cannot be computed from data that have not been
+        seen yet. Values outside the range are ignored.
+    weights_dtype : data-type, optional
+        The data type of the weights passed to `update`, which is also
+        the data type of the histogram. By default, the histogram counts
+        the values and no weights can be given.
+
+    Attributes
+    ----------
+    bin_edges : ndarray
+        The bin edges ``(length(hist)+1)``.
+
+    See Also
+    --------
+    histogram
+
+    Examples
+    --------
+    >>> acc = np.HistogramAccumulator(bins=4, range=(0, 4))
+    >>> acc.update([0, 1, 1])
+    >>> acc.update(np.array([3.5, 2, 7]))
+    >>> acc.result()
+    (array([1, 2, 1, 1]), array([ 0.,  1.,  2.,  3.,  4.]))
+
+    Partial histograms can be merged:
+
+    >>> other = np.HistogramAccumulator(bins=4, range=(0, 4))
+    >>> other.update([3, 3])
+    >>> acc.merge(other)
+    >>> acc.result()
+    (array([1, 2, 1, 3]), array([ 0.,  1.,  2.,  3.,  4.]))
+
+    """
+
+    def __init__(self, bins=10, range=None, weights_dtype=None):
+        if isinstance(bins, basestring):
+            raise TypeError("Automated estimation of the number of bins "
+                            "is not supported for streamed data")
+        if weights_dtype is None:
+            self._ntype = np.dtype(np.intp)
+            self._weighted = False
+        else:
+            self._ntype = np.dtype(weights_dtype)
+            self._weighted = True
+
+        if not iterable(bins):
+            if bins < 1:
+                raise ValueError(
+                    '`bins` should be a positive integer.')
+            if range is None:
+                raise ValueError(
+                    '`range` must be given for a number of bins.')
+            mn, mx = range
+            if (mn > mx):
+                raise ValueError(
+                    'max must be larger than min in range parameter.')
+            if not np.all(np.isfinite([mn, mx])):
+                raise ValueError(
+                    'range parameter must be finite.')
+            mn, mx = [mi + 0.0 for mi in range]
+            if mn == mx:
+                mn -= 0.5
+                mx += 0.5
+            self.bin_edges = linspace(mn, mx, bins + 1, endpoint=True)
+            # Same as in `histogram`, the weights that are not integer,
+            # floating point, or complex use the slow algorithm.
+            if (np.can_cast(self._ntype, np.double) or
+                    np.can_cast(self._ntype, np.complex)):
+                self._uniform = (mn, mx, bins / (mx - mn))
+                self._n = np.zeros(bins, self._ntype)
+                return
+        else:
+            self.bin_edges = asarray(bins)
+            if (np.diff(self.bin_edges) < 0).any():
+                raise ValueError(
+                    'bins must increase monotonically.')
+        self._uniform = None
+        self._n = np.zeros(len(self.bin_edges) - 1, self._ntype)
+
+    def update(self, a, weights=None):
+        """
+        Add the values of a chunk of data to the histogram.
+
+        Parameters
+        ----------
+        a : array_like
+            Input data. The values of the flattened array are added.
+        weights : array_like, optional
+            An array of weights, of the same shape as `a`, which can
+            only be given if `weights_dtype` was. Each value in `a` only
+            contributes its associated weight towards the bin count
+            (instead of 1).
+        """
+        a = asarray(a)
+        if weights is not None:
+            if not self._weighted:
+                raise ValueError(
+                    'weights require the weights_dtype argument.')
+            weights = asarray(weights, dtype=self._ntype)
+            if np.any(weights.shape != a.shape):
+                raise ValueError(
+                    'weights should have the same shape as a.')
+            weights = weights.ravel()
+        a = a.ravel()
+
+        for i in arange(0, len(a), _HIST_BLOCK):
+            if weights is None:
+                tmp_w = None
+            else:
+                tmp_w = weights[i:i + _HIST_BLOCK]
+            if self._uniform is None:
+                _hist_edges_block(self._n, a[i:i + _HIST_BLOCK], tmp_w,
+                                  self.bin_edges)
+            else:
+                _hist_uniform_block(self._n, a[i:i + _HIST_BLOCK], tmp_w,
+                                    *self._uniform)
+
+    def merge(self, other):
+        """
+        Add the histogram of another accumulator to this one.
+
+        Parameters
+        ----------
+        other : HistogramAccumulator
+            An accumulator with the same bins and weights data type.
+            It is not modified.
+        """
+        if not isinstance(other, HistogramAccumulator):
+            raise TypeError('can only merge a HistogramAccumulator.')
+        if (self._ntype != other._ntype or
+                self._uniform != other._uniform or
+                not np.array_equal(self.bin_edges, other.bin_edges)):
+            raise ValueError(
+                'histograms with different bins or weights cannot be '
+                'merged.')
+        self._n += other._n
+
+    def result(self, density=False):
+        """
+        Return the histogram of the data added so far.
+
+        Parameters
+        ----------
+        density : bool, optional
+            If ``False``, the result will contain the number of samples
+            in each bin. If ``True``, the result is the value of the
+            probability *density* function at the bin, as with
+            `histogram`.
+
+        Returns
+        -------
+        hist : array
+            The values of the histogram.
+        bin_edges : array
+            The bin edges ``(length(hist)+1)``.
+        """
+        n = self._n.copy()
+        bins = self.bin_edges.copy()
+        if density:
+            db = array(np.diff(bins), float)
+            return n/db/n.sum(), bins
+        return n, bins
+
+
+def _histdd_bin_index(x, edges, norm, decimal):
+    """
+    Return the index of the bin of each value of `x`, in the bins with
+    the `edges`, and the mask of the values in the bins.
+
+    The bins are of equal width if `norm`, their number per unit of `x`,
+    is given. Values on the rightmost edge up to `decimal` decimals are
+    in the last bin.
+    """
+    nbins = len(edges) - 1
+    if norm is None:
+        # Same as digitize
+        index = edges.searchsorted(x, 'right')
+        index -= 1
+    else:
+        # Compute the bin indices, clipped for the outliers, and correct
+        # them for the rounding errors with the edges of their bins.
+        index = ((x - edges[0]) * norm).astype(intp)
+        np.clip(index, 0, nbins - 1, out=index)
+        index -= (x < edges[index])
+        index += (x >= edges[index + 1])
+
+    # Only include values in the right range
+    keep = (x >= edges[0])
+    keep &= (x < edges[-1])
+    if decimal is not None:
+        # Find which points are on the rightmost edge.
+        on_edge = np.flatnonzero(x >= edges[-1])
+        on_edge = on_edge[around(x[on_edge], decimal) ==
+                          around(edges[-1], decimal)]
+        index[on_edge] = nbins - 1
+        keep[on_edge] = True
+    return index, keep
+
+
 def histogramdd(sample, bins=10, range=None, normed=False, weights=None):
     """
     Compute the multidimensional histogram of some data.
@@ -682,10 +952,22 @@ def histogramdd(sample, bins=10, range=None, normed=False, weights=None):
     try:
         # Sample is an ND-array.
         N, D = sample.shape
+        columns = [sample[:, i] for i in arange(D)]
+        sample_dt = sample.dtype
     except (AttributeError, ValueError):
-        # Sample is a sequence of 1D arrays.
-        sample = atleast_2d(sample).T
-        N, D = sample.shape
+        # Sample is a sequence of 1D arrays, which are histogrammed as they
+        # are instead of being stacked in a new array.
+        columns = [asarray(x) for x in sample]
+        if (columns and
+                all(x.ndim == 1 and len(x) == len(columns[0])
+                    for x in columns)):
+            N, D = len(columns[0]), len(columns)
+            sample_dt = np.result_type(*columns)
+        else:
+            sample = atleast_2d(sample).T
+            N, D = sample.shape
+            columns = [sample[:, i] for i in arange(D)]
+            sample_dt = sample.dtype
 
     nbin = empty(D, int)
     edges = D*[None]
@@ -711,8 +993,8 @@ def histogramdd(sample, bins=10, range=None, normed=False, weights=None):
             smin = zeros(D)
             smax = ones(D)
         else:
-            smin = atleast_1d(array(sample.min(0), float))
-            smax = atleast_1d(array(sample.max(0), float))
+            smin = array([x.min() for x in columns], float)
+            smax = array([x.max() for x in columns], float)
     else:
         if not np.all(np.isfinite(range)):
             raise ValueError(
@@ -729,98 +1011,81 @@ def histogramdd(sample, bins=10, range=None, normed=False, weights=None):
             smax[i] = smax[i] + .5
 
     # avoid rounding issues for comparisons when dealing with inexact types
-    if np.issubdtype(sample.dtype, np.inexact):
-        edge_dt = sample.dtype
+    if np.issubdtype(sample_dt, np.inexact):
+        edge_dt = sample_dt
     else:
         edge_dt = float
-    # Create edge arrays
+    # Create edge arrays, and the number of bins per unit for equal-width
+    # bins, which allows to compute the bin indices without searching.
+    norm = D*[None]
     for i in arange(D):
         if isscalar(bins[i]):
             if bins[i] < 1:
                 raise ValueError(
                     "Element at index %s in `bins` should be a positive "
                     "integer." % i)
-            nbin[i] = bins[i] + 2  # +2 for outlier bins
-            edges[i] = linspace(smin[i], smax[i], nbin[i]-1, dtype=edge_dt)
+            nbin[i] = bins[i]
+            edges[i] = linspace(smin[i], smax[i], nbin[i]+1, dtype=edge_dt)
+            norm[i] = nbin[i] / (edges[i][-1] - edges[i][0])
         else:
             edges[i] = asarray(bins[i], edge_dt)
-            nbin[i] = len(edges[i]) + 1  # +1 for outlier bins
+            nbin[i] = len(edges[i]) - 1
         dedges[i] = diff(edges[i])
         if np.any(np.asarray(dedges[i]) <= 0):
             raise ValueError(
                 "Found bin edge of size <= 0. Did you specify `bins` with"
                 "non-monotonic sequence?")
 
-    nbin = asarray(nbin)
-
     # Handle empty input.
     if N == 0:
-        return np.zeros(nbin-2), edges
-
-    # Compute the bin number each sample falls into.
-    Ncount = {}
-    for i in arange(D):
-        Ncount[i] = digitize(sample[:, i], edges[i])
+        return np.zeros(nbin), edges
 
-    # Using digitize, values that fall on an edge are put in the right bin.
-    # For the rightmost bin, we want values equal to the right edge to be
-    # counted in the last bin, and not as an outlier.
+    # For the rightmost bin, we want values equal to the right edge up to a
+    # rounding precision to be counted in the last bin, and not as outliers.
+    decimal = D*[None]
     for i in arange(D):
-        # Rounding precision
         mindiff = dedges[i].min()
         if not np.isinf(mindiff):
-            decimal = int(-log10(mindiff)) + 6
-            # Find which points are on the rightmost edge.
-            not_smaller_than_edge = (sample[:, i] >= edges[i][-1])
-            on_edge = (around(sample[:, i], decimal) ==
-                       around(edges[i][-1], decimal))
-            # Shift these points one bin to the left.
-            Ncount[i][where(on_edge & not_smaller_than_edge)[0]] -= 1
-
-    # Flattened histogram matrix (1D)
-    # Reshape is used so that overlarge arrays
-    # will raise an error.
-    hist = zeros(nbin, float).reshape(-1)
-
-    # Compute the sample indices in the flattened histogram matrix.
-    ni = nbin.argsort()
-    xy = zeros(N, int)
-    for i in arange(0, D-1):
-        xy += Ncount[ni[i]] * nbin[ni[i+1:]].prod()
-    xy += Ncount[ni[-1]]
-
-    # Compute the number of repetitions in xy and assign it to the
-    # flattened histmat.
-    if len(xy) == 0:
-        return zeros(nbin-2, int), edges
-
-    flatcount = bincount(xy, weights)
-    a = arange(len(flatcount))
-    hist[a] = flatcount
-
-    # Shape into a proper matrix
-    hist = hist.reshape(sort(nbin))
-    for i in arange(nbin.size):
-        j = ni.argsort()[i]
-        hist = hist.swapaxes(i, j)
-        ni[i], ni[j] = ni[j], ni[i]
-
-    # Remove outliers (indices 0 and -1 for each dimension).
-    core = D*[slice(1, -1)]
-    hist = hist[core]
+            decimal[i] = int(-log10(mindiff)) + 6
+
+    hist = zeros(nbin, float)
+    flathist = hist.reshape(-1)
+
+    # Compute the sample indices in the flattened histogram matrix, and the
+    # number of samples in each bin, by blocks of samples to bound the
+    # memory used for large samples. Each block is at least as large as
+    # the histogram, since counting the bins of a block scans it.
+    block = max(_HIST_BLOCK, hist.size)
+    for start in arange(0, N, block):
+        for i in arange(D):
+            index, keep_i = _histdd_bin_index(columns[i][start:start+block],
+                                              edges[i], norm[i], decimal[i])
+            if i == 0:
+                xy = index
+                keep = keep_i
+            else:
+                xy *= nbin[i]
+                xy += index
+                keep &= keep_i
+        if weights is None:
+            w = None
+        else:
+            w = weights[start:start+block]
+        if not np.logical_and.reduce(keep):
+            xy = xy[keep]
+            if w is not None:
+                w = w[keep]
+        flathist += bincount(xy, w, minlength=hist.size)
 
     # Normalize if normed is True
     if normed:
         s = hist.sum()
         for i in arange(D):
             shape = ones(D, int)
-            shape[i] = nbin[i] - 2
+            shape[i] = nbin[i]
             hist = hist / dedges[i].reshape(shape)
         hist /= s
 
-    if (hist.shape != nbin - 2).any():
-        raise RuntimeError(
-            "Internal Shape Error")
     return hist, edges
 
 
@@ -2018,9 +2283,64 @@ def disp(mesg, device=None, linefeed=True):
     return
 
 
+# The signature of a generalized ufunc, e.g. ``(m,n),(n,p)->(m,p)``, see
+# http://docs.scipy.org/doc/numpy/reference/c-api.generalized-ufuncs.html
+_DIMENSION_NAME = r'\w+'
+_CORE_DIMENSION_LIST = '(?:%s(?:,%s)*)?' % (_DIMENSION_NAME, _DIMENSION_NAME)
+_ARGUMENT = r'\(%s\)' % _CORE_DIMENSION_LIST
+_ARGUMENT_LIST = '%s(?:,%s)*' % (_ARGUMENT, _ARGUMENT)
+_SIGNATURE = '^%s->%s$' % (_ARGUMENT_LIST, _ARGUMENT_LIST)
+
+
+def _parse_gufunc_signature(signature):
+    """
+    Parse a generalized ufunc signature.
+
+    Returns the lists of the core dimension names of the inputs and of the
+    outputs, e.g. ``[('m', 'n'), ('n', 'p')], [('m', 'p')]`` for
+    ``(m,n),(n,p)->(m,p)``.
+    """
+    if not re.match(_SIGNATURE, signature.replace(' ', '')):
+        raise ValueError(
+            'not a valid gufunc signature: %s' % (signature,))
+    return tuple([tuple(re.findall(_DIMENSION_NAME, arg))
+                  for arg in re.findall(_ARGUMENT, arg_list)]
+                 for arg_list in signature.replace(' ', '').split('->'))
+
+
+def _update_dim_sizes(dim_sizes, arg, core_dims):
+    """
+    Add the sizes of the core dimensions `core_dims` of the array `arg` to
+    the dict `dim_sizes`, checking that they match the known sizes.
+    """
+    if not core_dims:
+        return
+    num_core_dims = len(core_dims)
+    if arg.ndim < num_core_dims:
+        raise ValueError(
+            '%d-dimensional argument does not have enough dimensions for '
+            'all core dimensions %r' % (arg.ndim, core_dims))
+    core_shape = arg.shape[-num_core_dims:]
+    for dim, size in zip(core_dims, core_shape):
+        if dim in dim_sizes:
+            if size != dim_sizes[dim]:
+                raise ValueError(
+                    'inconsistent size for core dimension %r: %r vs %r'
+                    % (dim, size, dim_sizes[dim]))
+        else:
+            dim_sizes[dim] = size
+
+
+def _core_shapes(broadcast_shape, dim_sizes, list_of_core_dims):
+    """Return the full shapes of arguments with the given core dimensions."""
+    return [broadcast_shape + tuple(dim_sizes[dim] for dim in core_dims)
+            for core_dims in list_of_core_dims]
+
+
 class vectorize(object):
     """
-    vectorize(pyfunc, otypes='', doc=None, excluded=None, cache=False)
+    vectorize(pyfunc, otypes='', doc=None, excluded=None, cache=False,
+              signature=None)
 
     Generalized function class.
 
@@ -2058,6 +2378,16 @@ class vectorize(object):
 
         .. versionadded:: 1.7.0
 
+    signature : string, optional
+        Generalized universal function signature, e.g., ``(m,n),(n)->(m)``
+        for vectorized matrix-vector multiplication. If provided, `pyfunc`
+        is called with (and expected to return) arrays whose last dimensions
+        are the core dimensions of the signature, and is broadcast over the
+        other dimensions. By default, `pyfunc` is assumed to take scalars
+        as input and output.
+
+        .. versionadded:: 1.12.0
+
     Returns
     -------
     vectorized : callable
@@ -2116,6 +2446,16 @@ class vectorize(object):
     >>> vpolyval([1, 2, 3], x=[0, 1])
     array([3, 6])
 
+    The `signature` argument allows for vectorizing functions that act on
+    non-scalar arrays, for example a convolution of each row of an array:
+
+    >>> convolve = np.vectorize(np.convolve, signature='(n),(m)->(k)')
+    >>> convolve(np.eye(4), [1, 2, 1])
+    array([[ 1.,  2.,  1.,  0.,  0.,  0.],
+           [ 0.,  1.,  2.,  1.,  0.,  0.],
+           [ 0.,  0.,  1.,  2.,  1.,  0.],
+           [ 0.,  0.,  0.,  1.,  2.,  1.]])
+
     Notes
     -----
     The `vectorize` function is provided primarily for convenience, not for
@@ -2131,10 +2471,14 @@ class vectorize(object):
     The new keyword argument interface and `excluded` argument support
     further degrades performance.
 
+    When `otypes` is given and the arguments are numeric arrays, the
+    elements are converted to and from Python objects by chunks as they are
+    passed to and returned by `pyfunc`, instead of converting the whole
+    arrays to and from object arrays.
     """
 
     def __init__(self, pyfunc, otypes='', doc=None, excluded=None,
-                 cache=False):
+                 cache=False, signature=None):
         self.pyfunc = pyfunc
         self.cache = cache
         self._ufunc = None    # Caching to improve default performance
@@ -2161,6 +2505,17 @@ class vectorize(object):
             excluded = set()
         self.excluded = set(excluded)
 
+        if signature is not None:
+            self._in_and_out_core_dims = _parse_gufunc_signature(signature)
+            if (self.otypes and
+                    len(self.otypes) != len(self._in_and_out_core_dims[1])):
+                raise ValueError(
+                    "the number of otypes does not match the number of "
+                    "outputs of the signature")
+        else:
+            self._in_and_out_core_dims = None
+        self.signature = signature
+
     def __call__(self, *args, **kwargs):
         """
         Return arrays with the results of `pyfunc` broadcast (vectorized) over
@@ -2189,6 +2544,8 @@ class vectorize(object):
             vargs = [args[_i] for _i in inds]
             vargs.extend([kwargs[_n] for _n in names])
 
+        if self.signature is not None:
+            return self._vectorize_call_with_signature(func=func, args=vargs)
         return self._vectorize_call(func=func, args=vargs)
 
     def _get_ufunc_and_otypes(self, func, args):
@@ -2254,9 +2611,23 @@ class vectorize(object):
         else:
             ufunc, otypes = self._get_ufunc_and_otypes(func=func, args=args)
 
+            inputs = [asanyarray(_a) for _a in args]
+            if (self.otypes and
+                    all(_nx.dtype(_t).kind in 'biufcO' for _t in otypes) and
+                    all(type(_a) is ndarray and _a.dtype.kind in 'biufcO'
+                        for _a in inputs)):
+                # Let the ufunc convert the numeric inputs to objects and the
+                # results to `otypes` chunk by chunk, as it iterates.
+                shape = _broadcast_shape(*inputs)
+                outputs = [empty(shape, _t) for _t in otypes]
+                ufunc(*(inputs + outputs), casting='unsafe')
+                if ufunc.nout == 1:
+                    return outputs[0]
+                return tuple(outputs)
+
             # Convert args to object arrays first
             inputs = [array(_a, copy=False, subok=True, dtype=object)
-                      for _a in args]
+                      for _a in inputs]
 
             outputs = ufunc(*inputs)
 
@@ -2268,6 +2639,79 @@ class vectorize(object):
                               for _x, _t in zip(outputs, otypes)])
         return _res
 
+    def _vectorize_call_with_signature(self, func, args):
+        """Vectorized call over positional arguments with a signature."""
+        input_core_dims, output_core_dims = self._in_and_out_core_dims
+
+        if len(args) != len(input_core_dims):
+            raise TypeError('wrong number of positional arguments: '
+                            'expected %r, got %r'
+                            % (len(input_core_dims), len(args)))
+        args = tuple(asanyarray(arg) for arg in args)
+
+        # Broadcast the loop dimensions of the arguments, i.e. those before
+        # their core dimensions.
+        dim_sizes = {}
+        loop_args = []
+        for arg, core_dims in zip(args, input_core_dims):
+            _update_dim_sizes(dim_sizes, arg, core_dims)
+            loop_shape = arg.shape[:arg.ndim - len(core_dims)]
+            loop_args.append(as_strided(0, loop_shape))
+        broadcast_shape = _broadcast_shape(*loop_args)
+        input_shapes = _core_shapes(broadcast_shape, dim_sizes,
+                                    input_core_dims)
+        args = [broadcast_to(arg, shape, subok=True)
+                for arg, shape in zip(args, input_shapes)]
+
+        outputs = None
+        otypes = self.otypes
+        nout = len(output_core_dims)
+
+        for index in np.ndindex(*broadcast_shape):
+            results = func(*(arg[index] for arg in args))
+
+            n_results = len(results) if isinstance(results, tuple) else 1
+            if nout != n_results:
+                raise ValueError(
+                    'wrong number of outputs from pyfunc: expected %r, got %r'
+                    % (nout, n_results))
+            if nout == 1:
+                results = (results,)
+
+            if outputs is None:
+                # The sizes of new output core dimensions and the output
+                # types are found from the first results.
+                for result, core_dims in zip(results, output_core_dims):
+                    _update_dim_sizes(dim_sizes, asarray(result), core_dims)
+                if not otypes:
+                    otypes = [asarray(result).dtype for result in results]
+                outputs = [empty(shape, dtype=dtype) for shape, dtype in
+                           zip(_core_shapes(broadcast_shape, dim_sizes,
+                                            output_core_dims), otypes)]
+
+            for output, result in zip(outputs, results):
+                output[index] = result
+
+        if outputs is None:
+            # The function was not called even once
+            if not otypes:
+                raise ValueError('cannot call `vectorize` on size 0 inputs '
+                                 'unless `otypes` is set')
+            for core_dims in output_core_dims:
+                for dim in core_dims:
+                    if dim not in dim_sizes:
+                        raise ValueError(
+                            'cannot call `vectorize` with a signature '
+                            'including new output dimensions on size 0 '
+                            'inputs')
+            outputs = [empty(shape, dtype=dtype) for shape, dtype in
+                       zip(_core_shapes(broadcast_shape, dim_sizes,
+                                        output_core_dims), otypes)]
+
+        if nout == 1:
+            return outputs[0]
+        return tuple(outputs)
+
 
 def cov(m, y=None, rowvar=True, bias=False, ddof=None, fweights=None,
         aweights=None):
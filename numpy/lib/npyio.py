@@ -10,7 +10,7 @@ from operator import itemgetter, index as opindex
 
 import numpy as np
 from . import format
-from ._datasource import DataSource
+from ._datasource import DataSource, DecompressedCache
 from numpy.core.multiarray import packbits, unpackbits
 from ._iotools import (
     LineSplitter, NameValidator, StringConverter, ConverterError,
@@ -19,7 +19,7 @@ from ._iotools import (
     )
 
 from numpy.compat import (
-    asbytes, asstr, asbytes_nested, bytes, basestring, unicode
+    asbytes, asstr, asbytes_nested, bytes, basestring, unicode, long
     )
 
 if sys.version_info[0] >= 3:
@@ -33,7 +33,8 @@ loads = pickle.loads
 __all__ = [
     'savetxt', 'loadtxt', 'genfromtxt', 'ndfromtxt', 'mafromtxt',
     'recfromtxt', 'recfromcsv', 'load', 'loads', 'save', 'savez',
-    'savez_compressed', 'packbits', 'unpackbits', 'fromregex', 'DataSource'
+    'savez_compressed', 'packbits', 'unpackbits', 'fromregex', 'DataSource',
+    'iter_loadtxt', 'iter_genfromtxt', 'iter_fromregex', 'DecompressedCache'
     ]
 
 
@@ -124,6 +125,15 @@ class NpzFile(object):
         Additional keyword arguments to pass on to pickle.load.
         These are only useful when loading object arrays saved on
         Python 2 when using Python 3.
+    mmap_mode : {None, 'r', 'c'}, optional
+        If not None, memory-map the arrays stored without compression,
+        using the given mode (see `numpy.memmap`).  Arrays that can not be
+        memory-mapped, because they are compressed, contain Python objects
+        or are in an archive that is not a file on disk, are read into
+        memory.  Writable modes are not supported: a warning is given and
+        all the arrays are read into memory.  Default: None
+
+        .. versionadded:: 1.12.0
 
     Parameters
     ----------
@@ -156,7 +166,13 @@ class NpzFile(object):
     """
 
     def __init__(self, fid, own_fid=False, allow_pickle=True,
-                 pickle_kwargs=None):
+                 pickle_kwargs=None, mmap_mode=None):
+        if mmap_mode not in (None, 'r', 'c', 'readonly', 'copyonwrite'):
+            # The members of an archive can not be mapped writable
+            warnings.warn("mmap_mode %r is not supported for .npz files, "
+                          "the arrays are read into memory" % (mmap_mode,),
+                          stacklevel=2)
+            mmap_mode = None
         # Import is postponed to here since zipfile depends on gzip, an
         # optional component of the so-called standard library.
         _zip = zipfile_factory(fid)
@@ -164,6 +180,7 @@ class NpzFile(object):
         self.files = []
         self.allow_pickle = allow_pickle
         self.pickle_kwargs = pickle_kwargs
+        self.mmap_mode = mmap_mode
         for x in self._files:
             if x.endswith('.npy'):
                 self.files.append(x[:-4])
@@ -218,6 +235,10 @@ class NpzFile(object):
             magic = bytes.read(len(format.MAGIC_PREFIX))
             bytes.close()
             if magic == format.MAGIC_PREFIX:
+                if self.mmap_mode:
+                    array = self._memmap_member(self.zip.getinfo(key))
+                    if array is not None:
+                        return array
                 bytes = self.zip.open(key)
                 return format.read_array(bytes,
                                          allow_pickle=self.allow_pickle,
@@ -227,6 +248,79 @@ class NpzFile(object):
         else:
             raise KeyError("%s is not a file in the archive" % key)
 
+    def _memmap_member(self, info):
+        """
+        Memory-map the array of an uncompressed member of the archive.
+
+        Returns None if the member can not be memory-mapped.
+
+        """
+        import zipfile
+        import struct
+
+        if info.compress_type != zipfile.ZIP_STORED:
+            return None
+        fp = self.zip.fp
+        try:
+            fp.fileno()
+        except (AttributeError, IOError, ValueError):
+            # Not a file on disk
+            return None
+        # The lengths of the name and extra field of the local header may
+        # differ from the ones of the central directory.
+        fp.seek(info.header_offset)
+        fheader = struct.unpack(zipfile.structFileHeader,
+                                fp.read(zipfile.sizeFileHeader))
+        start = (info.header_offset + zipfile.sizeFileHeader +
+                 fheader[zipfile._FH_FILENAME_LENGTH] +
+                 fheader[zipfile._FH_EXTRA_FIELD_LENGTH])
+        fp.seek(start)
+        header = format.read_header(fp)
+        if header['dtype'].hasobject:
+            return None
+        order = 'F' if header['fortran_order'] else 'C'
+        return np.memmap(fp, dtype=header['dtype'], shape=header['shape'],
+                         order=order, mode=self.mmap_mode,
+                         offset=start + header['offset'])
+
+    def info(self):
+        """
+        Return the metadata of the arrays in the archive.
+
+        Only the headers of the ``.npy`` files are read, so that this is
+        fast even for large compressed archives.  Files of the archive
+        that are not ``.npy`` files are skipped.
+
+        .. versionadded:: 1.12.0
+
+        Returns
+        -------
+        info : dict
+            A dictionary mapping the names of the arrays to dictionaries
+            holding the items returned by `numpy.lib.format.read_header`
+            (``version``, ``shape``, ``fortran_order``, ``dtype`` and
+            ``offset``), and the size of the ``.npy`` file in the archive,
+            ``size``, and once compressed, ``compressed_size``.
+
+        """
+        info = {}
+        for key, name in zip(self._files, self.files):
+            bytes = self.zip.open(key)
+            magic = bytes.read(len(format.MAGIC_PREFIX))
+            bytes.close()
+            if magic != format.MAGIC_PREFIX:
+                continue
+            bytes = self.zip.open(key)
+            try:
+                header = format.read_header(bytes)
+            finally:
+                bytes.close()
+            zinfo = self.zip.getinfo(key)
+            header['size'] = zinfo.file_size
+            header['compressed_size'] = zinfo.compress_size
+            info[name] = header
+        return info
+
     def __iter__(self):
         return iter(self.files)
 
@@ -255,7 +349,7 @@ class NpzFile(object):
 
 
 def load(file, mmap_mode=None, allow_pickle=True, fix_imports=True,
-         encoding='ASCII'):
+         encoding='ASCII', rows=None, fields=None, cache=None):
     """
     Load arrays or pickled objects from ``.npy``, ``.npz`` or pickled files.
 
@@ -271,7 +365,9 @@ def load(file, mmap_mode=None, allow_pickle=True, fix_imports=True,
         memory-mapped array is kept on disk. However, it can be accessed
         and sliced like any ndarray.  Memory mapping is especially useful
         for accessing small fragments of large files without reading the
-        entire file into memory.
+        entire file into memory.  For ``.npz`` files, only the arrays
+        stored without compression are memory-mapped, and only with the
+        modes 'r' and 'c', other modes read them into memory, see `NpzFile`.
     allow_pickle : bool, optional
         Allow loading pickled object arrays stored in npy files. Reasons for
         disallowing pickles include security, as loading pickled data can
@@ -289,6 +385,24 @@ def load(file, mmap_mode=None, allow_pickle=True, fix_imports=True,
         npy/npz files containing object arrays. Values other than 'latin1',
         'ASCII', and 'bytes' are not allowed, as they can corrupt numerical
         data. Default: 'ASCII'
+    rows : int, slice or sequence of ints, optional
+        Only load these items along the first axis of a ``.npy`` file, as
+        if the array was indexed with ``array[rows]``.  Without
+        `mmap_mode`, only the parts of the file holding the requested rows
+        are read, see `numpy.lib.format.read_array`.
+
+        .. versionadded:: 1.12.0
+    fields : str or sequence of str, optional
+        Only load these fields of a ``.npy`` file with a structured dtype.
+
+        .. versionadded:: 1.12.0
+    cache : DecompressedCache, optional
+        If given, a filename ending in ``.gz`` or ``.bz2`` is decompressed
+        into this cache, and the decompressed copy is loaded (or
+        memory-mapped, with the modes 'r' and 'c' only).  Without a cache,
+        such files are not supported.
+
+        .. versionadded:: 1.12.0
 
     Returns
     -------
@@ -301,7 +415,9 @@ def load(file, mmap_mode=None, allow_pickle=True, fix_imports=True,
     IOError
         If the input file does not exist or cannot be read.
     ValueError
-        The file contains an object array, but allow_pickle=False given.
+        The file contains an object array, but allow_pickle=False given,
+        or `rows` or `fields` are given for a file that is not a ``.npy``
+        file.
 
     See Also
     --------
@@ -354,12 +470,26 @@ def load(file, mmap_mode=None, allow_pickle=True, fix_imports=True,
     >>> X[1, :]
     memmap([4, 5, 6])
 
+    Read only the second row from disk, without memory-mapping:
+
+    >>> np.load('/tmp/123.npy', rows=slice(1, 2))
+    array([[4, 5, 6]])
+
     """
     import gzip
 
     own_fid = False
+    cached = False
     if isinstance(file, basestring):
-        fid = open(file, "rb")
+        if cache is None:
+            fid = open(file, "rb")
+        else:
+            if mmap_mode in ('r+', 'w+', 'readwrite', 'write'):
+                raise ValueError("the copies of a cache can only be "
+                                 "memory-mapped with the modes 'r' and 'c'")
+            fid = cache.open(file, "rb")
+            file = fid.name
+            cached = True
         own_fid = True
     else:
         fid = file
@@ -390,20 +520,43 @@ def load(file, mmap_mode=None, allow_pickle=True, fix_imports=True,
         N = len(format.MAGIC_PREFIX)
         magic = fid.read(N)
         fid.seek(-N, 1)  # back-up
+        if (rows is not None or fields is not None) and \
+                magic != format.MAGIC_PREFIX:
+            raise ValueError("rows and fields can only be given for .npy "
+                             "files")
         if magic.startswith(_ZIP_PREFIX):
             # zip-file (assume .npz)
             # Transfer file ownership to NpzFile
             tmp = own_fid
             own_fid = False
             return NpzFile(fid, own_fid=tmp, allow_pickle=allow_pickle,
-                           pickle_kwargs=pickle_kwargs)
+                           pickle_kwargs=pickle_kwargs, mmap_mode=mmap_mode)
         elif magic == format.MAGIC_PREFIX:
             # .npy file
             if mmap_mode:
-                return format.open_memmap(file, mode=mmap_mode)
+                if cached:
+                    # Map the entry already opened, another process may
+                    # have evicted it from the cache in the meantime
+                    header = format.read_header(fid)
+                    if header['dtype'].hasobject:
+                        raise ValueError("Array can't be memory-mapped: "
+                                         "Python objects in dtype.")
+                    order = 'F' if header['fortran_order'] else 'C'
+                    array = np.memmap(fid, dtype=header['dtype'],
+                                      shape=header['shape'], order=order,
+                                      mode=mmap_mode,
+                                      offset=header['offset'])
+                else:
+                    array = format.open_memmap(file, mode=mmap_mode)
+                if rows is not None:
+                    array = array[rows]
+                if fields is not None:
+                    array = array[fields]
+                return array
             else:
                 return format.read_array(fid, allow_pickle=allow_pickle,
-                                         pickle_kwargs=pickle_kwargs)
+                                         pickle_kwargs=pickle_kwargs,
+                                         rows=rows, fields=fields)
         else:
             # Try a pickle
             if not allow_pickle:
@@ -590,6 +743,16 @@ def savez_compressed(file, *args, **kwds):
         Function arguments.
     kwds : Keyword arguments
         Keywords.
+    workers : int, optional
+        Number of threads used to compress the arrays.  If larger than one,
+        the arrays, and blocks of ``_savez_chunksize`` bytes of the large
+        ones, are compressed concurrently, the archive still being a standard
+        zip file.  This is ignored with the versions of Python whose zipfile
+        module is not known to support it.  Default: None, compress on the
+        calling thread.  Saving an array that is not an integer under the
+        name ``workers`` is deprecated.
+
+        .. versionadded:: 1.12.0
 
     See Also
     --------
@@ -597,15 +760,157 @@ def savez_compressed(file, *args, **kwds):
     numpy.load : Load the files created by savez_compressed.
 
     """
-    _savez(file, args, kwds, True)
+    workers = kwds.pop('workers', None)
+    is_count = (isinstance(workers, (int, long, np.integer)) and
+                not isinstance(workers, (bool, np.bool_)))
+    if workers is not None and not is_count:
+        # 2026-10-16, 1.12
+        warnings.warn(
+            "saving an array under the name 'workers' with savez_compressed "
+            "is deprecated, in the future this keyword will only give the "
+            "number of compression threads", DeprecationWarning, stacklevel=2)
+        kwds['workers'] = workers
+        workers = None
+    _savez(file, args, kwds, True, workers=workers)
+
+
+# Size of the blocks of data compressed concurrently by savez_compressed
+_savez_chunksize = 16 * 1024 ** 2
+
+# The threaded compression of savez_compressed writes the internal state of
+# zipfile.ZipFile, which is only known for these versions of Python; the
+# others compress on the calling thread.
+_savez_threads_supported = (sys.version_info[:2] == (2, 7) or
+                            (3, 4) <= sys.version_info[:2] <= (3, 12))
+
+
+def _npy_blocks(array, allow_pickle, pickle_kwargs):
+    """
+    Generate the ``.npy`` representation of an array in blocks of bytes.
+
+    The blocks are views of the data of C- or Fortran-contiguous arrays,
+    and are copied from the rows of other arrays one block at a time.
+    Arrays holding Python objects are pickled at once.
+
+    """
+    from io import BytesIO
 
+    fp = BytesIO()
+    if array.dtype.hasobject:
+        format.write_array(fp, array, allow_pickle=allow_pickle,
+                           pickle_kwargs=pickle_kwargs)
+        data = fp.getvalue()
+        for i in range(0, len(data), _savez_chunksize):
+            yield data[i:i + _savez_chunksize]
+        return
+
+    format._write_array_header(fp, format.header_data_from_array_1_0(array))
+    yield fp.getvalue()
+    if array.flags.f_contiguous and not array.flags.c_contiguous:
+        array = array.T
+    if array.flags.c_contiguous:
+        data = array.reshape(-1).view(np.uint8)
+        for i in range(0, len(data), _savez_chunksize):
+            yield data[i:i + _savez_chunksize]
+    else:
+        rows = max(1, _savez_chunksize // max(1, array[0].nbytes))
+        for i in range(0, len(array), rows):
+            block = np.ascontiguousarray(array[i:i + rows])
+            yield block.reshape(-1).view(np.uint8)
+
+
+def _deflate_block(task):
+    """Compress a block of a member as a part of its deflate stream."""
+    import zlib
 
-def _savez(file, args, kwds, compress, allow_pickle=True, pickle_kwargs=None):
+    block, last = task
+    compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED,
+                                  -zlib.MAX_WBITS)
+    # All but the last block are flushed to a byte boundary without being
+    # marked final, so that their concatenation is a valid deflate stream.
+    if last:
+        return compressor.compress(block) + compressor.flush()
+    return compressor.compress(block) + compressor.flush(zlib.Z_SYNC_FLUSH)
+
+
+def _write_deflated_member(zipf, fname, blocks, pool, workers):
+    """
+    Compress the blocks of a member with `_deflate_block` on `pool`, and
+    add the member to `zipf`.
+
+    At most ``2 * workers`` blocks are compressed at a time.  Only the
+    compressed data of this member is kept until it is written, as the
+    local header holding its size comes first.
+
+    """
+    import collections
+    import zipfile
+    import zlib
+    import time
+
+    crc = 0
+    file_size = 0
+    compressed = []
+    pending = collections.deque()
+
+    def collect():
+        block, result = pending.popleft()
+        compressed.append(result.get())
+        return zlib.crc32(block, crc), file_size + len(block)
+
+    blocks = iter(blocks)
+    block = next(blocks, None)
+    while block is not None:
+        following = next(blocks, None)
+        task = (block, following is None)
+        pending.append((block, pool.apply_async(_deflate_block, (task,))))
+        if len(pending) >= 2 * workers:
+            crc, file_size = collect()
+        block = following
+    while pending:
+        crc, file_size = collect()
+
+    zinfo = zipfile.ZipInfo(fname, date_time=time.localtime(time.time())[:6])
+    zinfo.compress_type = zipfile.ZIP_DEFLATED
+    zinfo.external_attr = 0o600 << 16
+    zinfo.file_size = file_size
+    zinfo.compress_size = sum(len(chunk) for chunk in compressed)
+    zinfo.CRC = crc & 0xffffffff
+    zip64 = (zinfo.file_size > zipfile.ZIP64_LIMIT or
+             zinfo.compress_size > zipfile.ZIP64_LIMIT)
+    if zip64 and not zipf._allowZip64:
+        raise zipfile.LargeZipFile("Filesize would require ZIP64 extensions")
+
+    # zipfile has no public way of adding already compressed data, so do
+    # what ZipFile.writestr does once the data is compressed, with the same
+    # locking and checks.  The lock only exists since Python 3.5.
+    lock = getattr(zipf, '_lock', None)
+    if lock is not None:
+        lock.acquire()
+    try:
+        if getattr(zipf, '_writing', False):
+            raise ValueError("Can't write to ZIP archive while an open "
+                             "writing handle exists.")
+        if getattr(zipf, '_seekable', False):
+            zipf.fp.seek(zipf.start_dir)
+        zinfo.header_offset = zipf.fp.tell()
+        zipf.fp.write(zinfo.FileHeader(zip64))
+        for chunk in compressed:
+            zipf.fp.write(chunk)
+        zipf.filelist.append(zinfo)
+        zipf.NameToInfo[zinfo.filename] = zinfo
+        zipf.start_dir = zipf.fp.tell()
+        zipf._didModify = True
+    finally:
+        if lock is not None:
+            lock.release()
+
+
+def _savez(file, args, kwds, compress, allow_pickle=True, pickle_kwargs=None,
+           workers=None):
     # Import is postponed to here since zipfile depends on gzip, an optional
     # component of the so-called standard library.
     import zipfile
-    # Import deferred for startup time improvement
-    import tempfile
 
     if isinstance(file, basestring):
         if not file.endswith('.npz'):
@@ -626,31 +931,66 @@ def _savez(file, args, kwds, compress, allow_pickle=True, pickle_kwargs=None):
 
     zipf = zipfile_factory(file, mode="w", compression=compression)
 
-    # Stage arrays in a temporary file on disk, before writing to zip.
+    if (compress and workers is not None and workers > 1 and
+            _savez_threads_supported):
+        # Compress blocks of each member on a pool of threads, zlib
+        # releases the GIL while compressing.
+        from multiprocessing.pool import ThreadPool
 
-    # Since target file might be big enough to exceed capacity of a global
-    # temporary directory, create temp file side-by-side with the target file.
-    file_dir, file_prefix = os.path.split(file) if _is_string_like(file) else (None, 'tmp')
-    fd, tmpfile = tempfile.mkstemp(prefix=file_prefix, dir=file_dir, suffix='-numpy.npy')
-    os.close(fd)
-    try:
+        pool = ThreadPool(workers)
+        try:
+            for key, val in namedict.items():
+                blocks = _npy_blocks(np.asanyarray(val), allow_pickle,
+                                     pickle_kwargs)
+                _write_deflated_member(zipf, key + '.npy', blocks, pool,
+                                       workers)
+        finally:
+            pool.close()
+            pool.join()
+    elif sys.version_info >= (3, 6):
+        # Since Python 3.6 it is possible to write directly to a ZIP file.
         for key, val in namedict.items():
             fname = key + '.npy'
-            fid = open(tmpfile, 'wb')
-            try:
-                format.write_array(fid, np.asanyarray(val),
+            val = np.asanyarray(val)
+            # The size of a member is only known once it is written, so
+            # zip64 extensions must be requested up front for large ones,
+            # and for object arrays whose pickled size nbytes does not tell.
+            force_zip64 = val.nbytes >= 2**30 or val.dtype.hasobject
+            with zipf.open(fname, 'w', force_zip64=force_zip64) as fid:
+                format.write_array(fid, val,
                                    allow_pickle=allow_pickle,
                                    pickle_kwargs=pickle_kwargs)
-                fid.close()
-                fid = None
-                zipf.write(tmpfile, arcname=fname)
-            except IOError as exc:
-                raise IOError("Failed to write to %s: %s" % (tmpfile, exc))
-            finally:
-                if fid:
+    else:
+        # Stage arrays in a temporary file on disk, before writing to zip.
+
+        # Import deferred for startup time improvement
+        import tempfile
+        # Since target file might be big enough to exceed capacity of a
+        # global temporary directory, create temp file side-by-side with
+        # the target file.
+        file_dir, file_prefix = (os.path.split(file)
+                                 if _is_string_like(file) else (None, 'tmp'))
+        fd, tmpfile = tempfile.mkstemp(prefix=file_prefix, dir=file_dir,
+                                       suffix='-numpy.npy')
+        os.close(fd)
+        try:
+            for key, val in namedict.items():
+                fname = key + '.npy'
+                fid = open(tmpfile, 'wb')
+                try:
+                    format.write_array(fid, np.asanyarray(val),
+                                       allow_pickle=allow_pickle,
+                                       pickle_kwargs=pickle_kwargs)
                     fid.close()
-    finally:
-        os.remove(tmpfile)
+                    fid = None
+                    zipf.write(tmpfile, arcname=fname)
+                except IOError as exc:
+                    raise IOError("Failed to write to %s: %s" % (tmpfile, exc))
+                finally:
+                    if fid:
+                        fid.close()
+        finally:
+            os.remove(tmpfile)
 
     zipf.close()
 
@@ -685,106 +1025,69 @@ def _getconv(dtype):
         return str
 
 
-def loadtxt(fname, dtype=float, comments='#', delimiter=None,
-            converters=None, skiprows=0, usecols=None, unpack=False,
-            ndmin=0):
-    """
-    Load data from a text file.
-
-    Each row in the text file must have the same number of values.
-
-    Parameters
-    ----------
-    fname : file or str
-        File, filename, or generator to read.  If the filename extension is
-        ``.gz`` or ``.bz2``, the file is first decompressed. Note that
-        generators should return byte strings for Python 3k.
-    dtype : data-type, optional
-        Data-type of the resulting array; default: float.  If this is a
-        structured data-type, the resulting array will be 1-dimensional, and
-        each row will be interpreted as an element of the array.  In this
-        case, the number of columns used must match the number of fields in
-        the data-type.
-    comments : str or sequence, optional
-        The characters or list of characters used to indicate the start of a
-        comment;
-        default: '#'.
-    delimiter : str, optional
-        The string used to separate values.  By default, this is any
-        whitespace.
-    converters : dict, optional
-        A dictionary mapping column number to a function that will convert
-        that column to a float.  E.g., if column 0 is a date string:
-        ``converters = {0: datestr2num}``.  Converters can also be used to
-        provide a default value for missing data (but see also `genfromtxt`):
-        ``converters = {3: lambda s: float(s.strip() or 0)}``.  Default: None.
-    skiprows : int, optional
-        Skip the first `skiprows` lines; default: 0.
+# Number of lines loadtxt converts at a time
+_loadtxt_chunksize = 50000
 
-    usecols : int or sequence, optional
-        Which columns to read, with 0 being the first. For example, 
-        usecols = (1,4,5) will extract the 2nd, 5th and 6th columns.
-        The default, None, results in all columns being read.
-        
-        .. versionadded:: 1.11.0
-        
-        Also when a single column has to be read it is possible to use
-        an integer instead of a tuple. E.g ``usecols = 3`` reads the
-        third column the same way as `usecols = (3,)`` would.
 
-    unpack : bool, optional
-        If True, the returned array is transposed, so that arguments may be
-        unpacked using ``x, y, z = loadtxt(...)``.  When used with a structured
-        data-type, arrays are returned for each field.  Default is False.
-    ndmin : int, optional
-        The returned array will have at least `ndmin` dimensions.
-        Otherwise mono-dimensional axes will be squeezed.
-        Legal values: 0 (default), 1 or 2.
-
-        .. versionadded:: 1.6.0
-
-    Returns
-    -------
-    out : ndarray
-        Data read from the text file.
-
-    See Also
-    --------
-    load, fromstring, fromregex
-    genfromtxt : Load data with missing values handled as specified.
-    scipy.io.loadmat : reads MATLAB data files
-
-    Notes
-    -----
-    This function aims to be a fast reader for simply formatted files.  The
-    `genfromtxt` function provides more sophisticated handling of, e.g.,
-    lines with missing values.
-
-    .. versionadded:: 1.10.0
-
-    The strings produced by the Python float.hex method can be used as
-    input for floats.
+def _loadtxt_flatten_dtype_internal(dt):
+    """Unpack a structured data-type, and produce re-packing info."""
+    if dt.names is None:
+        # If the dtype is flattened, return.
+        # If the dtype has a shape, the dtype occurs
+        # in the list more than once.
+        shape = dt.shape
+        if len(shape) == 0:
+            return ([dt.base], None)
+        else:
+            packing = [(shape[-1], list)]
+            if len(shape) > 1:
+                for dim in dt.shape[-2::-1]:
+                    packing = [(dim*packing[0][0], packing*dim)]
+            return ([dt.base] * int(np.prod(dt.shape)), packing)
+    else:
+        types = []
+        packing = []
+        for field in dt.names:
+            tp, bytes = dt.fields[field]
+            flat_dt, flat_packing = _loadtxt_flatten_dtype_internal(tp)
+            types.extend(flat_dt)
+            # Avoid extra nesting for subarrays
+            if len(tp.shape) > 0:
+                packing.extend(flat_packing)
+            else:
+                packing.append((len(flat_dt), flat_packing))
+        return (types, packing)
+
+
+def _loadtxt_pack_items(items, packing):
+    """Pack items into nested lists based on re-packing info."""
+    if packing is None:
+        return items[0]
+    elif packing is tuple:
+        return tuple(items)
+    elif packing is list:
+        return list(items)
+    else:
+        start = 0
+        ret = []
+        for length, subpacking in packing:
+            ret.append(_loadtxt_pack_items(items[start:start+length],
+                                           subpacking))
+            start += length
+        return tuple(ret)
 
-    Examples
-    --------
-    >>> from io import StringIO   # StringIO behaves like a file object
-    >>> c = StringIO("0 1\\n2 3")
-    >>> np.loadtxt(c)
-    array([[ 0.,  1.],
-           [ 2.,  3.]])
 
-    >>> d = StringIO("M 21 72\\nF 35 58")
-    >>> np.loadtxt(d, dtype={'names': ('gender', 'age', 'weight'),
-    ...                      'formats': ('S1', 'i4', 'f4')})
-    array([('M', 21, 72.0), ('F', 35, 58.0)],
-          dtype=[('gender', '|S1'), ('age', '<i4'), ('weight', '<f4')])
+def _loadtxt_chunks(fname, dtype, comments, delimiter, converters, skiprows,
+                    usecols, chunksize, cache=None):
+    """
+    Generator yielding the data of a text file as arrays of rows.
 
-    >>> c = StringIO("1,0,2\\n3,0,4")
-    >>> x, y = np.loadtxt(c, delimiter=',', usecols=(0, 2), unpack=True)
-    >>> x
-    array([ 1.,  3.])
-    >>> y
-    array([ 2.,  4.])
+    This is the parsing engine shared by `loadtxt` and `iter_loadtxt`.
+    Lines are split in blocks of rows which are then converted column by
+    column.  If `chunksize` is None, blocks of ``_loadtxt_chunksize`` rows
+    are used, except for flexible types without a size that are converted
+    in a single block.  Otherwise, blocks of `chunksize` rows are yielded
+    and the size of such flexible types is locked after the first one.
 
     """
     # Type conversions for Py3 convenience
@@ -824,7 +1127,10 @@ def loadtxt(fname, dtype=float, comments='#', delimiter=None,
     try:
         if _is_string_like(fname):
             fown = True
-            if fname.endswith('.gz'):
+            if cache is not None:
+                mode = 'U' if sys.version_info[0] == 2 else 'r'
+                fh = iter(cache.open(fname, mode))
+            elif fname.endswith('.gz'):
                 import gzip
                 fh = iter(gzip.GzipFile(fname))
             elif fname.endswith('.bz2'):
@@ -838,52 +1144,6 @@ def loadtxt(fname, dtype=float, comments='#', delimiter=None,
             fh = iter(fname)
     except TypeError:
         raise ValueError('fname must be a string, file handle, or generator')
-    X = []
-
-    def flatten_dtype(dt):
-        """Unpack a structured data-type, and produce re-packing info."""
-        if dt.names is None:
-            # If the dtype is flattened, return.
-            # If the dtype has a shape, the dtype occurs
-            # in the list more than once.
-            shape = dt.shape
-            if len(shape) == 0:
-                return ([dt.base], None)
-            else:
-                packing = [(shape[-1], list)]
-                if len(shape) > 1:
-                    for dim in dt.shape[-2::-1]:
-                        packing = [(dim*packing[0][0], packing*dim)]
-                return ([dt.base] * int(np.prod(dt.shape)), packing)
-        else:
-            types = []
-            packing = []
-            for field in dt.names:
-                tp, bytes = dt.fields[field]
-                flat_dt, flat_packing = flatten_dtype(tp)
-                types.extend(flat_dt)
-                # Avoid extra nesting for subarrays
-                if len(tp.shape) > 0:
-                    packing.extend(flat_packing)
-                else:
-                    packing.append((len(flat_dt), flat_packing))
-            return (types, packing)
-
-    def pack_items(items, packing):
-        """Pack items into nested lists based on re-packing info."""
-        if packing is None:
-            return items[0]
-        elif packing is tuple:
-            return tuple(items)
-        elif packing is list:
-            return list(items)
-        else:
-            start = 0
-            ret = []
-            for length, subpacking in packing:
-                ret.append(pack_items(items[start:start+length], subpacking))
-                start += length
-            return tuple(ret)
 
     def split_line(line):
         """Chop off comments, strip, and split at delimiter.
@@ -901,6 +1161,54 @@ def loadtxt(fname, dtype=float, comments='#', delimiter=None,
         else:
             return []
 
+    def read_data(chunk_size):
+        """Split lines, including the first, into blocks of rows.
+
+        Yields lists of at most `chunk_size` rows (all of them if
+        `chunk_size` is None), each row being the list of raw values of
+        the used columns.  The file read, `fh`, is the one opened above.
+
+        """
+        rows = []
+        for i, line in enumerate(itertools.chain([first_line], fh)):
+            vals = split_line(line)
+            if len(vals) == 0:
+                continue
+            if usecols:
+                vals = [vals[j] for j in usecols]
+            if len(vals) != N:
+                line_num = i + skiprows + 1
+                raise ValueError("Wrong number of columns at line %d"
+                                 % line_num)
+            rows.append(vals)
+            if len(rows) == chunk_size:
+                yield rows
+                rows = []
+        if rows:
+            yield rows
+
+    def convert_block(rows):
+        """Convert a block of rows to an array of type `dtype`."""
+        if layout is None:
+            # Nested or object dtypes: convert and pack row by row
+            items = [_loadtxt_pack_items([conv(val) for (conv, val)
+                                          in zip(converters, vals)], packing)
+                     for vals in rows]
+            return np.array(items, dtype)
+        # Convert each column in bulk straight into the output block
+        block = np.empty((len(rows),) + layout, dtype)
+        columns = zip(converters, zip(*rows))
+        if dtype.names is not None:
+            for name, (conv, col) in zip(dtype.names, columns):
+                block[name] = [conv(val) for val in col]
+        elif layout:
+            for i, (conv, col) in enumerate(columns):
+                block[:, i] = [conv(val) for val in col]
+        else:
+            for conv, col in columns:
+                block[...] = [conv(val) for val in col]
+        return block
+
     try:
         # Make sure we're dealing with a proper dtype
         dtype = np.dtype(dtype)
@@ -924,7 +1232,7 @@ def loadtxt(fname, dtype=float, comments='#', delimiter=None,
             warnings.warn('loadtxt: Empty input file: "%s"' % fname)
         N = len(usecols or first_vals)
 
-        dtype_types, packing = flatten_dtype(dtype)
+        dtype_types, packing = _loadtxt_flatten_dtype_internal(dtype)
         if len(dtype_types) > 1:
             # We're dealing with a structured array, each field of
             # the dtype matches a column
@@ -945,28 +1253,167 @@ def loadtxt(fname, dtype=float, comments='#', delimiter=None,
                     continue
             converters[i] = conv
 
-        # Parse each line, including the first
-        for i, line in enumerate(itertools.chain([first_line], fh)):
-            vals = split_line(line)
-            if len(vals) == 0:
-                continue
-            if usecols:
-                vals = [vals[i] for i in usecols]
-            if len(vals) != N:
-                line_num = i + skiprows + 1
-                raise ValueError("Wrong number of columns at line %d"
-                                 % line_num)
-
-            # Convert each value according to its column and store
-            items = [conv(val) for (conv, val) in zip(converters, vals)]
-            # Then pack it according to the dtype's nesting
-            items = pack_items(items, packing)
-            X.append(items)
+        # Columns can be converted in bulk when each of them maps to one
+        # scalar item of the output, otherwise rows are packed one by one.
+        chunk_size = chunksize or _loadtxt_chunksize
+        unsized = any(dt.itemsize == 0 for dt in dtype_types)
+        layout = None
+        if unsized:
+            # Flexible types get their size from all of the data at once
+            if chunksize is None:
+                chunk_size = None
+        elif dtype.hasobject or dtype.shape:
+            pass
+        elif dtype.names is None:
+            layout = (N,) if N > 1 else ()
+        elif (len(dtype.names) == N and
+                all(dtype.fields[name][0].names is None and
+                    not dtype.fields[name][0].shape
+                    for name in dtype.names)):
+            layout = ()
+
+        for rows in read_data(chunk_size):
+            block = convert_block(rows)
+            if unsized and not dtype.shape:
+                # Lock the size found in the first block
+                dtype = block.dtype
+                unsized = False
+            yield block
     finally:
         if fown:
             fh.close()
 
-    X = np.array(X, dtype)
+
+def loadtxt(fname, dtype=float, comments='#', delimiter=None,
+            converters=None, skiprows=0, usecols=None, unpack=False,
+            ndmin=0, cache=None):
+    """
+    Load data from a text file.
+
+    Each row in the text file must have the same number of values.
+
+    Parameters
+    ----------
+    fname : file or str
+        File, filename, or generator to read.  If the filename extension is
+        ``.gz`` or ``.bz2``, the file is first decompressed. Note that
+        generators should return byte strings for Python 3k.
+    dtype : data-type, optional
+        Data-type of the resulting array; default: float.  If this is a
+        structured data-type, the resulting array will be 1-dimensional, and
+        each row will be interpreted as an element of the array.  In this
+        case, the number of columns used must match the number of fields in
+        the data-type.
+    comments : str or sequence, optional
+        The characters or list of characters used to indicate the start of a
+        comment;
+        default: '#'.
+    delimiter : str, optional
+        The string used to separate values.  By default, this is any
+        whitespace.
+    converters : dict, optional
+        A dictionary mapping column number to a function that will convert
+        that column to a float.  E.g., if column 0 is a date string:
+        ``converters = {0: datestr2num}``.  Converters can also be used to
+        provide a default value for missing data (but see also `genfromtxt`):
+        ``converters = {3: lambda s: float(s.strip() or 0)}``.  Default: None.
+    skiprows : int, optional
+        Skip the first `skiprows` lines; default: 0.
+
+    usecols : int or sequence, optional
+        Which columns to read, with 0 being the first. For example, 
+        usecols = (1,4,5) will extract the 2nd, 5th and 6th columns.
+        The default, None, results in all columns being read.
+        
+        .. versionadded:: 1.11.0
+        
+        Also when a single column has to be read it is possible to use
+        an integer instead of a tuple. E.g ``usecols = 3`` reads the
+        third column the same way as `usecols = (3,)`` would.
+
+    unpack : bool, optional
+        If True, the returned array is transposed, so that arguments may be
+        unpacked using ``x, y, z = loadtxt(...)``.  When used with a structured
+        data-type, arrays are returned for each field.  Default is False.
+    ndmin : int, optional
+        The returned array will have at least `ndmin` dimensions.
+        Otherwise mono-dimensional axes will be squeezed.
+        Legal values: 0 (default), 1 or 2.
+
+        .. versionadded:: 1.6.0
+    cache : DecompressedCache, optional
+        If given, a filename ending in ``.gz`` or ``.bz2`` is decompressed
+        into this cache once, and later calls read the decompressed copy.
+
+        .. versionadded:: 1.12.0
+
+    Returns
+    -------
+    out : ndarray
+        Data read from the text file.
+
+    See Also
+    --------
+    load, fromstring, fromregex
+    genfromtxt : Load data with missing values handled as specified.
+    scipy.io.loadmat : reads MATLAB data files
+
+    Notes
+    -----
+    This function aims to be a fast reader for simply formatted files.  The
+    `genfromtxt` function provides more sophisticated handling of, e.g.,
+    lines with missing values.
+
+    .. versionadded:: 1.10.0
+
+    The strings produced by the Python float.hex method can be used as
+    input for floats.
+
+    Examples
+    --------
+    >>> from io import StringIO   # StringIO behaves like a file object
+    >>> c = StringIO("0 1\\n2 3")
+    >>> np.loadtxt(c)
+    array([[ 0.,  1.],
+           [ 2.,  3.]])
+
+    >>> d = StringIO("M 21 72\\nF 35 58")
+    >>> np.loadtxt(d, dtype={'names': ('gender', 'age', 'weight'),
+    ...                      'formats': ('S1', 'i4', 'f4')})
+    array([('M', 21, 72.0), ('F', 35, 58.0)],
+          dtype=[('gender', '|S1'), ('age', '<i4'), ('weight', '<f4')])
+
+    >>> c = StringIO("1,0,2\\n3,0,4")
+    >>> x, y = np.loadtxt(c, delimiter=',', usecols=(0, 2), unpack=True)
+    >>> x
+    array([ 1.,  3.])
+    >>> y
+    array([ 2.,  4.])
+
+    """
+    dtype = np.dtype(dtype)
+
+    # Fill a preallocated array block by block instead of collecting
+    # the converted rows in a list of tuples.
+    X = None
+    nrows = 0
+    for block in _loadtxt_chunks(fname, dtype, comments, delimiter,
+                                 converters, skiprows, usecols, None, cache):
+        if X is None:
+            # The first block owns its data and becomes the buffer
+            X = block
+        else:
+            if nrows + len(block) > len(X):
+                # Grow geometrically to keep the number of copies low
+                capacity = max(2 * len(X), nrows + len(block))
+                X.resize((capacity,) + X.shape[1:], refcheck=False)
+            X[nrows:nrows + len(block)] = block
+        nrows += len(block)
+
+    if X is None:
+        X = np.array([], dtype)
+    elif nrows < len(X):
+        X.resize((nrows,) + X.shape[1:], refcheck=False)
     # Multicolumn data are returned with shape (1, N, M), i.e.
     # (1, 1, M) for a single row - remove the singleton dimension there
     if X.ndim == 3 and X.shape[:2] == (1, 1):
@@ -988,7 +1435,7 @@ def loadtxt(fname, dtype=float, comments='#', delimiter=None,
             X = np.atleast_2d(X).T
 
     if unpack:
-        if len(dtype_types) > 1:
+        if len(_loadtxt_flatten_dtype_internal(dtype)[0]) > 1:
             # For structured arrays, return an array for each field.
             return [X[field] for field in dtype.names]
         else:
@@ -997,6 +1444,79 @@ def loadtxt(fname, dtype=float, comments='#', delimiter=None,
         return X
 
 
+def iter_loadtxt(fname, dtype=float, comments='#', delimiter=None,
+                 converters=None, skiprows=0, usecols=None, unpack=False,
+                 chunksize=50000, cache=None):
+    """
+    Iterate over the data of a text file in chunks of rows.
+
+    This is a generator version of `loadtxt` that never holds more than
+    `chunksize` rows of the file in memory, so that arbitrarily large files
+    can be streamed through reductions or written out chunk by chunk.
+
+    .. versionadded:: 1.12.0
+
+    Parameters
+    ----------
+    fname, dtype, comments, delimiter, converters, skiprows, usecols, cache
+        See `loadtxt`.
+    unpack : bool, optional
+        If True, each chunk is transposed, or split in an array per field
+        for structured data-types, as in `loadtxt`.  Default is False.
+    chunksize : int, optional
+        Maximum number of rows of each chunk.  Default: 50000.
+
+    Yields
+    ------
+    out : ndarray
+        The converted data of the next at most `chunksize` rows of the file.
+
+    See Also
+    --------
+    loadtxt, iter_genfromtxt
+
+    Notes
+    -----
+    Unlike `loadtxt`, the chunks are never squeezed: their first axis is
+    always the row axis, so that all of them have the same layout.  When
+    `dtype` is a flexible type without a size (e.g. ``'S'``), the size is
+    taken from the first chunk and used for all the following ones, longer
+    values being truncated.
+
+    Examples
+    --------
+    >>> from io import StringIO
+    >>> c = StringIO(u"0 1\\n2 3\\n4 5")
+    >>> for chunk in np.iter_loadtxt(c, chunksize=2):
+    ...     print(chunk)
+    [[ 0.  1.]
+     [ 2.  3.]]
+    [[ 4.  5.]]
+
+    """
+    if chunksize < 1:
+        raise ValueError("'chunksize' must be at least 1.")
+    dtype = np.dtype(dtype)
+    structured = len(_loadtxt_flatten_dtype_internal(dtype)[0]) > 1
+    for X in _loadtxt_chunks(fname, dtype, comments, delimiter, converters,
+                             skiprows, usecols, chunksize, cache):
+        if not unpack:
+            yield X
+        elif structured:
+            yield [X[field] for field in X.dtype.names]
+        else:
+            yield X.T
+
+
+# Number of values savetxt formats at a time
+_savetxt_chunksize = 2 ** 16
+
+# Conversion specifiers giving the same output for numpy scalars and for the
+# Python numbers returned by `tolist`, which are much faster to format.
+_savetxt_numeric_spec = re.compile(
+    r'%[-+ #0]*\d*(\.\d*)?[hlL]?[diouxXeEfFgG%]')
+
+
 def savetxt(fname, X, fmt='%.18e', delimiter=' ', newline='\n', header='',
             footer='', comments='# '):
     """
@@ -1176,21 +1696,44 @@ def savetxt(fname, X, fmt='%.18e', delimiter=' ', newline='\n', header='',
         if len(header) > 0:
             header = header.replace('\n', '\n' + comments)
             fh.write(asbytes(comments + header + newline))
+        dtype = X.dtype
         if iscomplex_X:
-            for row in X:
-                row2 = []
-                for number in row:
-                    row2.append(number.real)
-                    row2.append(number.imag)
-                fh.write(asbytes(format % tuple(row2) + newline))
+            # Interleave the real and imaginary parts of the columns
+            X = np.ascontiguousarray(X)
+            X = X.view(X.real.dtype).reshape(len(X), 2 * ncol)
+
+        # Format blocks of rows with a single string operation and write
+        # them at once. When only numeric conversions are used, the values
+        # are converted to Python numbers in bulk with `tolist`.
+        if X.dtype.names is None:
+            kinds = X.dtype.kind
+            fast = X.ndim == 2
         else:
-            for row in X:
-                try:
-                    fh.write(asbytes(format % tuple(row) + newline))
-                except TypeError:
-                    raise TypeError("Mismatch between array dtype ('%s') and "
-                                    "format specifier ('%s')"
-                                    % (str(X.dtype), format))
+            kinds = [X.dtype.fields[name][0] for name in X.dtype.names]
+            fast = X.ndim == 1 and all(dt.shape == () for dt in kinds)
+            kinds = ''.join(dt.kind for dt in kinds)
+        fast = (fast and all(k in 'biuf' for k in kinds) and
+                '%' not in _savetxt_numeric_spec.sub('', format))
+        block_format = format + newline.replace('%', '%%')
+        blocksize = max(1, _savetxt_chunksize // max(ncol, 1))
+        for i in range(0, len(X), blocksize):
+            block = X[i:i + blocksize]
+            try:
+                if fast:
+                    if block.dtype.names is None:
+                        values = block.ravel().tolist()
+                    else:
+                        values = list(itertools.chain.from_iterable(
+                            block.tolist()))
+                    text = (block_format * len(block)) % tuple(values)
+                else:
+                    text = ''.join([block_format % tuple(row)
+                                    for row in block])
+            except TypeError:
+                raise TypeError("Mismatch between array dtype ('%s') and "
+                                "format specifier ('%s')"
+                                % (str(dtype), format))
+            fh.write(asbytes(text))
         if len(footer) > 0:
             footer = footer.replace('\n', '\n' + comments)
             fh.write(asbytes(comments + footer + newline))
@@ -1199,7 +1742,7 @@ def savetxt(fname, X, fmt='%.18e', delimiter=' ', newline='\n', header='',
             fh.close()
 
 
-def fromregex(file, regexp, dtype):
+def fromregex(file, regexp, dtype, blocksize=None):
     """
     Construct an array from a text file, using regular expression parsing.
 
@@ -1216,6 +1759,15 @@ def fromregex(file, regexp, dtype):
         Groups in the regular expression correspond to fields in the dtype.
     dtype : dtype or list of dtypes
         Dtype for the structured array.
+    blocksize : int, optional
+        If given, the file is read and matched in blocks of about
+        `blocksize` characters, cut at the end of a line, and the matches
+        are stored in an array grown as needed, so that neither the whole
+        file nor the list of all the matches are held in memory.  Matches
+        must then not span several lines.  Default is to read the whole
+        file at once.
+
+        .. versionadded:: 1.12.0
 
     Returns
     -------
@@ -1230,7 +1782,7 @@ def fromregex(file, regexp, dtype):
 
     See Also
     --------
-    fromstring, loadtxt
+    fromstring, loadtxt, iter_fromregex
 
     Notes
     -----
@@ -1253,6 +1805,107 @@ def fromregex(file, regexp, dtype):
     >>> output['num']
     array([1312, 1534,  444], dtype=int64)
 
+    """
+    if blocksize is not None and blocksize < 1:
+        raise ValueError("'blocksize' must be at least 1.")
+    output = None
+    nrows = 0
+    for block in _fromregex_blocks(file, regexp, dtype, blocksize):
+        if output is None:
+            output = block
+        else:
+            if nrows + len(block) > len(output):
+                # Grow geometrically to keep the number of copies low
+                capacity = max(2 * len(output), nrows + len(block))
+                output.resize(capacity, refcheck=False)
+            output[nrows:nrows + len(block)] = block
+        nrows += len(block)
+
+    if output is None:
+        output = np.array([], dtype=dtype)
+    elif nrows < len(output):
+        output.resize(nrows, refcheck=False)
+    return output
+
+
+def iter_fromregex(file, regexp, dtype, blocksize=2 ** 20):
+    """
+    Iterate over the matches of a regular expression in a text file.
+
+    This is a generator version of `fromregex` that reads the file in
+    blocks of about `blocksize` characters, cut at the end of a line, and
+    yields the matches of each block, so that arbitrarily large files can
+    be parsed with bounded memory.
+
+    .. versionadded:: 1.12.0
+
+    Parameters
+    ----------
+    file, regexp, dtype
+        See `fromregex`.
+    blocksize : int, optional
+        Number of characters read from the file at a time, extended to the
+        end of the last line.  Default: 1 MiB.
+
+    Yields
+    ------
+    output : ndarray
+        The structured array of the matches in the next block of the file
+        that contains any.
+
+    See Also
+    --------
+    fromregex, iter_loadtxt
+
+    Notes
+    -----
+    The regular expression is applied to each block separately, so that
+    its matches must not span several lines, and anchors such as ``^``
+    match at the beginning of each block.
+
+    Examples
+    --------
+    >>> from io import BytesIO
+    >>> f = BytesIO(b"1312 foo\\n1534  bar\\n444   qux\\n")
+    >>> for chunk in np.iter_fromregex(f, r"(\\d+)\\s+(...)",
+    ...                                [('num', np.int64), ('key', 'S3')],
+    ...                                blocksize=10):
+    ...     print(chunk)
+    [(1312, 'foo')]
+    [(1534, 'bar')]
+    [(444, 'qux')]
+
+    """
+    if blocksize < 1:
+        raise ValueError("'blocksize' must be at least 1.")
+    for block in _fromregex_blocks(file, regexp, dtype, blocksize):
+        if len(block):
+            yield block
+
+
+def _fromregex_convert(seq, dtype):
+    """Convert the list returned by `findall` to a structured array."""
+    if seq and not isinstance(seq[0], tuple):
+        # Only one group is in the regexp.
+        # Create the new array as a single data-type and then
+        #   re-interpret as a single-field structured array.
+        newdtype = np.dtype(dtype[dtype.names[0]])
+        output = np.array(seq, dtype=newdtype)
+        output.dtype = dtype
+    else:
+        output = np.array(seq, dtype=dtype)
+    return output
+
+
+def _fromregex_blocks(file, regexp, dtype, blocksize=None):
+    """
+    Generator yielding the arrays of the matches of `regexp` in consecutive
+    blocks of `file`.
+
+    This is the engine shared by `fromregex` and `iter_fromregex`. The
+    blocks hold about `blocksize` characters, extended to the end of a
+    line, or the whole file if `blocksize` is None.
+
     """
     own_fh = False
     if not hasattr(file, "read"):
@@ -1265,18 +1918,25 @@ def fromregex(file, regexp, dtype):
         if not isinstance(dtype, np.dtype):
             dtype = np.dtype(dtype)
 
-        seq = regexp.findall(file.read())
-        if seq and not isinstance(seq[0], tuple):
-            # Only one group is in the regexp.
-            # Create the new array as a single data-type and then
-            #   re-interpret as a single-field structured array.
-            newdtype = np.dtype(dtype[dtype.names[0]])
-            output = np.array(seq, dtype=newdtype)
-            output.dtype = dtype
-        else:
-            output = np.array(seq, dtype=dtype)
-
-        return output
+        if blocksize is None:
+            yield _fromregex_convert(regexp.findall(file.read()), dtype)
+            return
+
+        tail = None
+        while True:
+            data = file.read(blocksize)
+            eof = not data
+            if tail is not None:
+                data = tail + data
+            if not eof:
+                # Keep the last, possibly incomplete, line for the next block
+                newline = asbytes('\n') if isinstance(data, bytes) else '\n'
+                end = data.rfind(newline) + 1
+                data, tail = data[:end], data[end:]
+            if data:
+                yield _fromregex_convert(regexp.findall(data), dtype)
+            if eof:
+                break
     finally:
         if own_fh:
             file.close()
@@ -1293,7 +1953,8 @@ def genfromtxt(fname, dtype=float, comments='#', delimiter=None,
                names=None, excludelist=None, deletechars=None,
                replace_space='_', autostrip=False, case_sensitive=True,
                defaultfmt="f%i", unpack=None, usemask=False, loose=True,
-               invalid_raise=True, max_rows=None):
+               invalid_raise=True, max_rows=None, infer_rows=None,
+               cache=None):
     """
     Load data from a text file, with missing values handled as specified.
 
@@ -1380,6 +2041,18 @@ def genfromtxt(fname, dtype=float, comments='#', delimiter=None,
         to read the entire file.
 
         .. versionadded:: 1.10.0
+    infer_rows : int, optional
+        When `dtype` is None, the number of rows used to infer the type of
+        each column.  The other rows are converted with the inferred types,
+        the values that do not fit being handled according to `loose`.
+        Default is to use all the rows.
+
+        .. versionadded:: 1.12.0
+    cache : DecompressedCache, optional
+        If given, a filename ending in ``.gz`` or ``.bz2`` is decompressed
+        into this cache once, and later calls read the decompressed copy.
+
+        .. versionadded:: 1.12.0
 
     Returns
     -------
@@ -1456,6 +2129,106 @@ def genfromtxt(fname, dtype=float, comments='#', delimiter=None,
         if max_rows < 1:
             raise ValueError("'max_rows' must be at least 1.")
 
+    chunks = _genfromtxt_chunks(fname, dtype, comments, delimiter,
+                                skip_header, skip_footer, converters,
+                                missing_values, filling_values, usecols,
+                                names, excludelist, deletechars,
+                                replace_space, autostrip, case_sensitive,
+                                defaultfmt, usemask, loose, invalid_raise,
+                                max_rows, infer_rows, cache)
+    try:
+        output = next(chunks)
+    finally:
+        chunks.close()
+    if unpack:
+        return output.squeeze().T
+    return output.squeeze()
+
+
+def iter_genfromtxt(fname, chunksize=50000, **kwargs):
+    """
+    Iterate over the data of a text file in chunks of rows.
+
+    This is a generator version of `genfromtxt` that never holds more than
+    `chunksize` rows of the file in memory, so that arbitrarily large files
+    can be streamed through reductions or written out chunk by chunk.
+
+    .. versionadded:: 1.12.0
+
+    Parameters
+    ----------
+    fname : file, str, list of str, generator
+        File, filename, list, or generator to read, see `genfromtxt`.
+    chunksize : int, optional
+        Maximum number of rows of each chunk.  Default: 50000.
+    kwargs : dict
+        Other keyword arguments passed to `genfromtxt`, except `skip_footer`
+        and `max_rows` that can not be used when iterating over chunks.
+
+    Yields
+    ------
+    out : ndarray
+        The data of the next at most `chunksize` rows of the file. If
+        `usemask` is True, this is a masked array.
+
+    See Also
+    --------
+    genfromtxt, iter_loadtxt
+
+    Notes
+    -----
+    The names, the data-type and the column types inferred when `dtype` is
+    None are determined from the first chunk and then locked, so that all
+    the chunks have the same layout.  Values of the following chunks that
+    do not fit these types are handled as by `genfromtxt` for a locked
+    converter, and strings longer than the ones of the first chunk are
+    truncated.  Unlike `genfromtxt`, the chunks are never squeezed.
+
+    Examples
+    --------
+    >>> from io import BytesIO
+    >>> s = BytesIO(b"a,b\\n1,2.5\\n3,4.5\\n5,6.5")
+    >>> for chunk in np.iter_genfromtxt(s, chunksize=2, delimiter=",",
+    ...                                 dtype=None, names=True):
+    ...     print(chunk)
+    [(1, 2.5) (3, 4.5)]
+    [(5, 6.5)]
+
+    """
+    if chunksize < 1:
+        raise ValueError("'chunksize' must be at least 1.")
+    for key in ('skip_footer', 'max_rows'):
+        if kwargs.pop(key, None):
+            raise ValueError(
+                "The keyword '%s' can not be used when iterating over "
+                "chunks." % key)
+    unpack = kwargs.pop('unpack', None)
+    for output in _genfromtxt_chunks(fname, chunksize=chunksize, **kwargs):
+        if unpack:
+            yield output.T
+        else:
+            yield output
+
+
+def _genfromtxt_chunks(fname, dtype=float, comments='#', delimiter=None,
+                       skip_header=0, skip_footer=0, converters=None,
+                       missing_values=None, filling_values=None,
+                       usecols=None, names=None, excludelist=None,
+                       deletechars=None, replace_space='_', autostrip=False,
+                       case_sensitive=True, defaultfmt="f%i", usemask=False,
+                       loose=True, invalid_raise=True, chunksize=None,
+                       infer_rows=None, cache=None):
+    """
+    Generator yielding the data of a text file as arrays of rows.
+
+    This is the engine shared by `genfromtxt` and `iter_genfromtxt`. The
+    file is read in chunks of at most `chunksize` rows (in a single chunk if
+    `chunksize` is None). The first chunk is always yielded, even if empty.
+
+    """
+    if infer_rows is not None and infer_rows < 1:
+        raise ValueError("'infer_rows' must be at least 1.")
+
     # Py3 data conversions to bytes, for convenience
     if comments is not None:
         comments = asbytes(comments)
@@ -1479,9 +2252,11 @@ def genfromtxt(fname, dtype=float, comments='#', delimiter=None,
     try:
         if isinstance(fname, basestring):
             if sys.version_info[0] == 2:
-                fhd = iter(np.lib._datasource.open(fname, 'rbU'))
+                fhd = iter(np.lib._datasource.open(fname, 'rbU',
+                                                   cache=cache))
             else:
-                fhd = iter(np.lib._datasource.open(fname, 'rb'))
+                fhd = iter(np.lib._datasource.open(fname, 'rb',
+                                                   cache=cache))
             own_fhd = True
         else:
             fhd = iter(fname)
@@ -1716,210 +2491,236 @@ def genfromtxt(fname, dtype=float, comments='#', delimiter=None,
     # Fixme: possible error as following variable never used.
     #miss_chars = [_.missing_values for _ in converters]
 
-    # Initialize the output lists ...
-    # ... rows
-    rows = []
-    append_to_rows = rows.append
-    # ... masks
-    if usemask:
-        masks = []
-        append_to_masks = masks.append
-    # ... invalid
-    invalid = []
-    append_to_invalid = invalid.append
-
-    # Parse each line
-    for (i, line) in enumerate(itertools.chain([first_line, ], fhd)):
-        values = split_line(line)
-        nbvalues = len(values)
-        # Skip an empty line
-        if nbvalues == 0:
-            continue
-        if usecols:
-            # Select only the columns we need
-            try:
-                values = [values[_] for _ in usecols]
-            except IndexError:
-                append_to_invalid((i + skip_header + 1, nbvalues))
-                continue
-        elif nbvalues != nbcols:
-            append_to_invalid((i + skip_header + 1, nbvalues))
-            continue
-        # Store the values
-        append_to_rows(tuple(values))
-        if usemask:
-            append_to_masks(tuple([v.strip() in m
-                                   for (v, m) in zip(values,
-                                                     missing_values)]))
-        if len(rows) == max_rows:
-            break
-
-    if own_fhd:
-        fhd.close()
-
-    # Upgrade the converters (if needed)
-    if dtype is None:
-        for (i, converter) in enumerate(converters):
-            current_column = [itemgetter(i)(_m) for _m in rows]
-            try:
-                converter.iterupgrade(current_column)
-            except ConverterLockError:
-                errmsg = "Converter #%i is locked and cannot be upgraded: " % i
-                current_column = map(itemgetter(i), rows)
-                for (j, value) in enumerate(current_column):
+    try:
+        # Parse the lines in chunks of at most `chunksize` rows. The
+        # enumeration is shared by all the chunks so that line numbers are
+        # counted from the beginning of the file.
+        lines = enumerate(itertools.chain([first_line, ], fhd))
+        first_chunk = True
+        while True:
+            # Initialize the output lists ...
+            # ... rows
+            rows = []
+            append_to_rows = rows.append
+            # ... masks
+            if usemask:
+                masks = []
+                append_to_masks = masks.append
+            # ... invalid
+            invalid = []
+            append_to_invalid = invalid.append
+
+            # Parse each line
+            exhausted = True
+            for (i, line) in lines:
+                values = split_line(line)
+                nbvalues = len(values)
+                # Skip an empty line
+                if nbvalues == 0:
+                    continue
+                if usecols:
+                    # Select only the columns we need
                     try:
-                        converter.upgrade(value)
-                    except (ConverterError, ValueError):
-                        errmsg += "(occurred line #%i for value '%s')"
-                        errmsg %= (j + 1 + skip_header, value)
-                        raise ConverterError(errmsg)
-
-    # Check that we don't have invalid values
-    nbinvalid = len(invalid)
-    if nbinvalid > 0:
-        nbrows = len(rows) + nbinvalid - skip_footer
-        # Construct the error message
-        template = "    Line #%%i (got %%i columns instead of %i)" % nbcols
-        if skip_footer > 0:
-            nbinvalid_skipped = len([_ for _ in invalid
-                                     if _[0] > nbrows + skip_header])
-            invalid = invalid[:nbinvalid - nbinvalid_skipped]
-            skip_footer -= nbinvalid_skipped
+                        values = [values[_] for _ in usecols]
+                    except IndexError:
+                        append_to_invalid((i + skip_header + 1, nbvalues))
+                        continue
+                elif nbvalues != nbcols:
+                    append_to_invalid((i + skip_header + 1, nbvalues))
+                    continue
+                # Store the values
+                append_to_rows(tuple(values))
+                if usemask:
+                    append_to_masks(tuple([v.strip() in m
+                                           for (v, m) in zip(values,
+                                                             missing_values)]))
+                if len(rows) == chunksize:
+                    exhausted = False
+                    break
+
+            # Upgrade the converters (if needed), the types inferred from
+            # the first `infer_rows` rows are kept for all the others
+            if dtype is None and first_chunk:
+                sample = rows[:infer_rows]
+                for (i, converter) in enumerate(converters):
+                    current_column = [itemgetter(i)(_m) for _m in sample]
+                    try:
+                        converter.iterupgrade(current_column)
+                    except ConverterLockError:
+                        errmsg = ("Converter #%i is locked and cannot be "
+                                  "upgraded: " % i)
+                        current_column = map(itemgetter(i), sample)
+                        for (j, value) in enumerate(current_column):
+                            try:
+                                converter.upgrade(value)
+                            except (ConverterError, ValueError):
+                                errmsg += "(occurred line #%i for value '%s')"
+                                errmsg %= (j + 1 + skip_header, value)
+                                raise ConverterError(errmsg)
+
+            # Check that we don't have invalid values
+            nbinvalid = len(invalid)
+            if nbinvalid > 0:
+                nbrows = len(rows) + nbinvalid - skip_footer
+                # Construct the error message
+                template = ("    Line #%%i (got %%i columns instead of %i)"
+                            % nbcols)
+                if skip_footer > 0:
+                    nbinvalid_skipped = len([_ for _ in invalid
+                                             if _[0] > nbrows + skip_header])
+                    invalid = invalid[:nbinvalid - nbinvalid_skipped]
+                    skip_footer -= nbinvalid_skipped
 #
-#            nbrows -= skip_footer
-#            errmsg = [template % (i, nb)
-#                      for (i, nb) in invalid if i < nbrows]
-#        else:
-        errmsg = [template % (i, nb)
-                  for (i, nb) in invalid]
-        if len(errmsg):
-            errmsg.insert(0, "Some errors were detected !")
-            errmsg = "\n".join(errmsg)
-            # Raise an exception ?
-            if invalid_raise:
-                raise ValueError(errmsg)
-            # Issue a warning ?
-            else:
-                warnings.warn(errmsg, ConversionWarning)
-
-    # Strip the last skip_footer data
-    if skip_footer > 0:
-        rows = rows[:-skip_footer]
-        if usemask:
-            masks = masks[:-skip_footer]
-
-    # Convert each value according to the converter:
-    # We want to modify the list in place to avoid creating a new one...
-    if loose:
-        rows = list(
-            zip(*[[conv._loose_call(_r) for _r in map(itemgetter(i), rows)]
-                  for (i, conv) in enumerate(converters)]))
-    else:
-        rows = list(
-            zip(*[[conv._strict_call(_r) for _r in map(itemgetter(i), rows)]
-                  for (i, conv) in enumerate(converters)]))
+#                    nbrows -= skip_footer
+#                    errmsg = [template % (i, nb)
+#                              for (i, nb) in invalid if i < nbrows]
+#                else:
+                errmsg = [template % (i, nb)
+                          for (i, nb) in invalid]
+                if len(errmsg):
+                    errmsg.insert(0, "Some errors were detected !")
+                    errmsg = "\n".join(errmsg)
+                    # Raise an exception ?
+                    if invalid_raise:
+                        raise ValueError(errmsg)
+                    # Issue a warning ?
+                    else:
+                        warnings.warn(errmsg, ConversionWarning)
 
-    # Reset the dtype
-    data = rows
-    if dtype is None:
-        # Get the dtypes from the types of the converters
-        column_types = [conv.type for conv in converters]
-        # Find the columns with strings...
-        strcolidx = [i for (i, v) in enumerate(column_types)
-                     if v in (type('S'), np.string_)]
-        # ... and take the largest number of chars.
-        for i in strcolidx:
-            column_types[i] = "|S%i" % max(len(row[i]) for row in data)
-        #
-        if names is None:
-            # If the dtype is uniform, don't define names, else use ''
-            base = set([c.type for c in converters if c._checked])
-            if len(base) == 1:
-                (ddtype, mdtype) = (list(base)[0], np.bool)
-            else:
-                ddtype = [(defaultfmt % i, dt)
-                          for (i, dt) in enumerate(column_types)]
+            # Only the first chunk may be empty
+            if not rows and not first_chunk:
+                break
+
+            # Strip the last skip_footer data
+            if skip_footer > 0:
+                rows = rows[:-skip_footer]
                 if usemask:
-                    mdtype = [(defaultfmt % i, np.bool)
-                              for (i, dt) in enumerate(column_types)]
-        else:
-            ddtype = list(zip(names, column_types))
-            mdtype = list(zip(names, [np.bool] * len(column_types)))
-        output = np.array(data, dtype=ddtype)
-        if usemask:
-            outputmask = np.array(masks, dtype=mdtype)
-    else:
-        # Overwrite the initial dtype names if needed
-        if names and dtype.names:
-            dtype.names = names
-        # Case 1. We have a structured type
-        if len(dtype_flat) > 1:
-            # Nested dtype, eg [('a', int), ('b', [('b0', int), ('b1', 'f4')])]
-            # First, create the array using a flattened dtype:
-            # [('a', int), ('b1', int), ('b2', float)]
-            # Then, view the array using the specified dtype.
-            if 'O' in (_.char for _ in dtype_flat):
-                if has_nested_fields(dtype):
-                    raise NotImplementedError(
-                        "Nested fields involving objects are not supported...")
-                else:
-                    output = np.array(data, dtype=dtype)
-            else:
-                rows = np.array(data, dtype=[('', _) for _ in dtype_flat])
-                output = rows.view(dtype)
-            # Now, process the rowmasks the same way
-            if usemask:
-                rowmasks = np.array(
-                    masks, dtype=np.dtype([('', np.bool) for t in dtype_flat]))
-                # Construct the new dtype
-                mdtype = make_mask_descr(dtype)
-                outputmask = rowmasks.view(mdtype)
-        # Case #2. We have a basic dtype
-        else:
-            # We used some user-defined converters
-            if user_converters:
-                ishomogeneous = True
-                descr = []
-                for i, ttype in enumerate([conv.type for conv in converters]):
-                    # Keep the dtype of the current converter
-                    if i in user_converters:
-                        ishomogeneous &= (ttype == dtype.type)
-                        if ttype == np.string_:
-                            ttype = "|S%i" % max(len(row[i]) for row in data)
-                        descr.append(('', ttype))
+                    masks = masks[:-skip_footer]
+
+            # Convert the values column by column
+            rows = list(
+                zip(*[conv.iterconvert(map(itemgetter(i), rows), loose=loose)
+                      for (i, conv) in enumerate(converters)]))
+
+            # Reset the dtype
+            data = rows
+            if dtype is None:
+                if first_chunk:
+                    # Get the dtypes from the types of the converters
+                    column_types = [conv.type for conv in converters]
+                    # Find the columns with strings...
+                    strcolidx = [i for (i, v) in enumerate(column_types)
+                                 if v in (type('S'), np.string_)]
+                    # ... and take the largest number of chars.
+                    for i in strcolidx:
+                        column_types[i] = "|S%i" % max(len(row[i])
+                                                       for row in data)
+                    #
+                    if names is None:
+                        # If the dtype is uniform, don't define names,
+                        # else use ''
+                        base = set([c.type for c in converters
+                                    if c._checked])
+                        if len(base) == 1:
+                            (ddtype, mdtype) = (list(base)[0], np.bool)
+                        else:
+                            ddtype = [(defaultfmt % i, dt)
+                                      for (i, dt) in enumerate(column_types)]
+                            if usemask:
+                                mdtype = [(defaultfmt % i, np.bool)
+                                          for (i, dt)
+                                          in enumerate(column_types)]
                     else:
-                        descr.append(('', dtype))
-                # So we changed the dtype ?
-                if not ishomogeneous:
-                    # We have more than one field
-                    if len(descr) > 1:
-                        dtype = np.dtype(descr)
-                    # We have only one field: drop the name if not needed.
+                        ddtype = list(zip(names, column_types))
+                        mdtype = list(zip(names,
+                                          [np.bool] * len(column_types)))
+                output = np.array(data, dtype=ddtype)
+                if usemask:
+                    outputmask = np.array(masks, dtype=mdtype)
+            else:
+                # Overwrite the initial dtype names if needed
+                if first_chunk and names and dtype.names:
+                    dtype.names = names
+                # Case 1. We have a structured type
+                if len(dtype_flat) > 1:
+                    # Nested dtype, eg [('a', int), ('b', [('b0', int),
+                    #                                      ('b1', 'f4')])]
+                    # First, create the array using a flattened dtype:
+                    # [('a', int), ('b1', int), ('b2', float)]
+                    # Then, view the array using the specified dtype.
+                    if 'O' in (_.char for _ in dtype_flat):
+                        if has_nested_fields(dtype):
+                            raise NotImplementedError(
+                                "Nested fields involving objects are not "
+                                "supported...")
+                        else:
+                            output = np.array(data, dtype=dtype)
                     else:
-                        dtype = np.dtype(ttype)
-            #
-            output = np.array(data, dtype)
-            if usemask:
-                if dtype.names:
-                    mdtype = [(_, np.bool) for _ in dtype.names]
+                        rows = np.array(data,
+                                        dtype=[('', _) for _ in dtype_flat])
+                        output = rows.view(dtype)
+                    # Now, process the rowmasks the same way
+                    if usemask:
+                        rowmasks = np.array(
+                            masks, dtype=np.dtype([('', np.bool)
+                                                   for t in dtype_flat]))
+                        # Construct the new dtype
+                        mdtype = make_mask_descr(dtype)
+                        outputmask = rowmasks.view(mdtype)
+                # Case #2. We have a basic dtype
                 else:
-                    mdtype = np.bool
-                outputmask = np.array(masks, dtype=mdtype)
-    # Try to take care of the missing data we missed
-    names = output.dtype.names
-    if usemask and names:
-        for (name, conv) in zip(names or (), converters):
-            missing_values = [conv(_) for _ in conv.missing_values
-                              if _ != asbytes('')]
-            for mval in missing_values:
-                outputmask[name] |= (output[name] == mval)
-    # Construct the final array
-    if usemask:
-        output = output.view(MaskedArray)
-        output._mask = outputmask
-    if unpack:
-        return output.squeeze().T
-    return output.squeeze()
+                    # We used some user-defined converters, the dtype
+                    # found with the first chunk is kept for the others
+                    if user_converters and first_chunk:
+                        ishomogeneous = True
+                        descr = []
+                        for i, ttype in enumerate([conv.type
+                                                   for conv in converters]):
+                            # Keep the dtype of the current converter
+                            if i in user_converters:
+                                ishomogeneous &= (ttype == dtype.type)
+                                if ttype == np.string_:
+                                    ttype = "|S%i" % max(len(row[i])
+                                                         for row in data)
+                                descr.append(('', ttype))
+                            else:
+                                descr.append(('', dtype))
+                        # So we changed the dtype ?
+                        if not ishomogeneous:
+                            # We have more than one field
+                            if len(descr) > 1:
+                                dtype = np.dtype(descr)
+                            # We have only one field: drop the name if not
+                            # needed.
+                            else:
+                                dtype = np.dtype(ttype)
+                    #
+                    output = np.array(data, dtype)
+                    if usemask:
+                        if dtype.names:
+                            mdtype = [(_, np.bool) for _ in dtype.names]
+                        else:
+                            mdtype = np.bool
+                        outputmask = np.array(masks, dtype=mdtype)
+            # Try to take care of the missing data we missed
+            if usemask and output.dtype.names:
+                for (name, conv) in zip(output.dtype.names, converters):
+                    missing = [conv(_) for _ in conv.missing_values
+                               if _ != asbytes('')]
+                    for mval in missing:
+                        outputmask[name] |= (output[name] == mval)
+            # Construct the final array
+            if usemask:
+                output = output.view(MaskedArray)
+                output._mask = outputmask
+            yield output
+
+            if exhausted:
+                break
+            first_chunk = False
+    finally:
+        if own_fhd:
+            fhd.close()
 
 
 def ndfromtxt(fname, **kwargs):
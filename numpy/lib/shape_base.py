@@ -4,10 +4,11 @@ import warnings
 
 import numpy.core.numeric as _nx
 from numpy.core.numeric import (
-    asarray, zeros, outer, concatenate, isscalar, array, asanyarray
+    asarray, zeros, outer, concatenate, array, asanyarray
     )
-from numpy.core.fromnumeric import product, reshape
+from numpy.core.fromnumeric import reshape, transpose
 from numpy.core import vstack, atleast_3d
+from numpy.lib.index_tricks import ndindex
 
 
 __all__ = [
@@ -49,6 +50,10 @@ def apply_along_axis(func1d, axis, arr, *args, **kwargs):
         is equal to the size of the return value of `func1d`.  If `func1d`
         returns a scalar `outarr` will have one fewer dimensions than `arr`.
 
+        .. versionchanged:: 1.12.0
+           More generally, the `axis` dimension is replaced by the
+           dimensions of the return value of `func1d`.
+
     See Also
     --------
     apply_over_axes : Apply a function repeatedly over multiple axes.
@@ -81,54 +86,37 @@ def apply_along_axis(func1d, axis, arr, *args, **kwargs):
     if (axis >= nd):
         raise ValueError("axis must be less than arr.ndim; axis=%d, rank=%d."
             % (axis, nd))
-    ind = [0]*(nd-1)
-    i = zeros(nd, 'O')
-    indlist = list(range(nd))
-    indlist.remove(axis)
-    i[axis] = slice(None, None)
-    outshape = asarray(arr.shape).take(indlist)
-    i.put(indlist, ind)
-    res = func1d(arr[tuple(i.tolist())], *args, **kwargs)
-    #  if res is a number, then we have a smaller output array
-    if isscalar(res):
-        outarr = zeros(outshape, asarray(res).dtype)
-        outarr[tuple(ind)] = res
-        Ntot = product(outshape)
-        k = 1
-        while k < Ntot:
-            # increment the index
-            ind[-1] += 1
-            n = -1
-            while (ind[n] >= outshape[n]) and (n > (1-nd)):
-                ind[n-1] += 1
-                ind[n] = 0
-                n -= 1
-            i.put(indlist, ind)
-            res = func1d(arr[tuple(i.tolist())], *args, **kwargs)
-            outarr[tuple(ind)] = res
-            k += 1
-        return outarr
-    else:
-        Ntot = product(outshape)
-        holdshape = outshape
-        outshape = list(arr.shape)
-        outshape[axis] = len(res)
-        outarr = zeros(outshape, asarray(res).dtype)
-        outarr[tuple(i.tolist())] = res
-        k = 1
-        while k < Ntot:
-            # increment the index
-            ind[-1] += 1
-            n = -1
-            while (ind[n] >= holdshape[n]) and (n > (1-nd)):
-                ind[n-1] += 1
-                ind[n] = 0
-                n -= 1
-            i.put(indlist, ind)
-            res = func1d(arr[tuple(i.tolist())], *args, **kwargs)
-            outarr[tuple(i.tolist())] = res
-            k += 1
-        return outarr
+
+    # Move the axis to the end, so that the slices are indexed by the
+    # indices of the other axes, and iterate over those.
+    inarr_view = transpose(arr, _apply_axes_order(nd, axis, 1))
+    inds = ndindex(inarr_view.shape[:-1])
+    try:
+        ind0 = next(inds)
+    except StopIteration:
+        raise ValueError(
+            'Cannot apply_along_axis when any iteration dimensions are 0')
+    res = asanyarray(func1d(inarr_view[ind0], *args, **kwargs))
+
+    # The results are written in place of the slices, at the end of the
+    # output, and their axes are moved back to `axis` at the end.
+    buff = zeros(inarr_view.shape[:-1] + res.shape, res.dtype)
+    buff[ind0] = res
+    for ind in inds:
+        buff[ind] = func1d(inarr_view[ind], *args, **kwargs)
+    return transpose(buff, _apply_axes_order(buff.ndim, axis, res.ndim,
+                                             inverse=True))
+
+
+def _apply_axes_order(nd, axis, n, inverse=False):
+    """
+    Return the order of the axes of an array of `nd` dimensions that moves
+    the `n` axes from `axis` on to the end, or back if `inverse`.
+    """
+    axes = list(range(nd))
+    if inverse:
+        return axes[:axis] + axes[nd - n:] + axes[axis:nd - n]
+    return axes[:axis] + axes[axis + n:] + axes[axis:axis + n]
 
 
 def apply_over_axes(func, a, axes):
@@ -345,5 +345,77 @@ class TestOpenFunc(TestCase):
         fp.close()
 
 
+class TestDecompressedCache(TestCase):
+    def setUp(self):
+        self.tmpdir = mkdtemp()
+        self.cache = datasource.DecompressedCache(
+            os.path.join(self.tmpdir, 'cache'), maxsize=2500)
+
+    def tearDown(self):
+        rmtree(self.tmpdir)
+        del self.cache
+
+    def make_gzip(self, i):
+        import gzip
+        filepath = os.path.join(self.tmpdir, 'foobar%d.txt.gz' % i)
+        fp = gzip.open(filepath, 'wb')
+        fp.write(asbytes('%d' % i) * 1000)
+        fp.close()
+        return filepath
+
+    def entries(self):
+        return [name for name in os.listdir(self.cache.cachedir)
+                if name.endswith('.data')]
+
+    def test_open(self):
+        filepath = self.make_gzip(1)
+        for i in range(2):
+            fp = self.cache.open(filepath, 'rb')
+            self.assertEqual(fp.read(), asbytes('1') * 1000)
+            fp.close()
+            self.assertEqual(len(self.entries()), 1)
+        self.assertEqual(open(self.cache.path(filepath), 'rb').read(),
+                         asbytes('1') * 1000)
+
+        # Uncompressed files are not cached
+        local_file = valid_textfile(self.tmpdir)
+        self.assertEqual(self.cache.path(local_file), local_file)
+        self.assertRaises(ValueError, self.cache.open, filepath, 'w')
+
+        # Through a DataSource
+        ds = datasource.DataSource(self.tmpdir)
+        fp = ds.open(filepath, 'rb', cache=self.cache)
+        self.assertEqual(fp.name, self.cache.path(filepath))
+        fp.close()
+
+        self.cache.clear()
+        self.assertEqual(self.entries(), [])
+
+    def test_eviction(self):
+        paths = [self.make_gzip(i) for i in range(4)]
+        for i, filepath in enumerate(paths):
+            self.cache.open(filepath, 'rb').close()
+            # Do not depend on the resolution of the file times
+            os.utime(self.cache.path(filepath), (1000 + i, 1000 + i))
+        # Only the two most recently used entries fit
+        entries = sorted(self.entries())
+        self.assertEqual(len(entries), 2)
+        self.assertEqual(
+            entries, sorted(os.path.basename(self.cache.path(filepath))
+                            for filepath in paths[2:]))
+
+        # A modified file gets a new entry
+        os.utime(paths[3], (0, 0))
+        self.assertTrue(os.path.basename(self.cache.path(paths[3]))
+                        not in entries)
+
+        # A stale lock left over by a dead process is broken
+        lock = os.path.join(self.cache.cachedir, '.lock')
+        open(lock, 'w').close()
+        os.utime(lock, (0, 0))
+        self.cache.clear()
+        self.assertEqual(self.entries(), [])
+
+
 if __name__ == "__main__":
     run_module_suite()
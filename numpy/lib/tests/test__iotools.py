@@ -195,6 +195,22 @@ class TestStringConverter(TestCase):
         except ValueError:
             pass
 
+    def test_iterconvert(self):
+        "Tests the conversion of sequences of strings."
+        converter = StringConverter(float, default=-1.,
+                                    missing_values=asbytes_nested(['N/A',
+                                                                   '99']))
+        values = asbytes_nested(['1.5', ' N/A', '', '99', '2e3'])
+        expected = [converter._strict_call(v) for v in values]
+        assert_equal(expected, [1.5, -1., -1., 99., 2e3])
+        assert_equal(converter.iterconvert(values, loose=False), expected)
+        assert_equal(converter.iterconvert(values), expected)
+        assert_equal(converter.iterconvert([]), [])
+        # Invalid values
+        values = asbytes_nested(['1.5', 'x', 'N/A'])
+        assert_equal(converter.iterconvert(values), [1.5, -1., -1.])
+        assert_raises(ValueError, converter.iterconvert, values, loose=False)
+
     def test_upgrademapper(self):
         "Tests updatemapper"
         dateparser = _bytes_to_date
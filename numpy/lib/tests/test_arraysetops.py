@@ -5,7 +5,8 @@ from __future__ import division, absolute_import, print_function
 
 import numpy as np
 from numpy.testing import (
-    run_module_suite, TestCase, assert_array_equal, assert_equal
+    run_module_suite, TestCase, assert_array_equal, assert_equal,
+    assert_raises
     )
 from numpy.lib.arraysetops import (
     ediff1d, intersect1d, setxor1d, union1d, setdiff1d, unique, in1d
@@ -115,6 +116,74 @@ class TestSetOps(TestCase):
         a2, a2_inv = np.unique(a, return_inverse=True)
         assert_array_equal(a2_inv, np.zeros(5))
 
+    def test_unique_counting(self):
+        # Integer arrays with a small range of values are counted; compare
+        # with sorting object arrays, also for values at the ends of the
+        # range of the types
+        rng = np.random.RandomState(0)
+        for dt in np.typecodes['AllInteger']:
+            info = np.iinfo(dt)
+            for lo in [info.min, info.max - 20, 0]:
+                a = rng.randint(0, 21, 100).astype(dt) + np.array(lo, dt)
+                for flags in [(0, 0, 0), (1, 1, 1), (1, 0, 1), (0, 1, 0)]:
+                    result = unique(a, *flags)
+                    expected = unique(a.astype(object), *flags)
+                    if not any(flags):
+                        result, expected = (result,), (expected,)
+                    assert_equal(result[0].dtype, a.dtype)
+                    for r, e in zip(result, expected):
+                        assert_array_equal(r, e)
+
+        a = np.array([-128, 127, 0, 127], dtype=np.int8)
+        v, j1, j2, j3 = unique(a, 1, 1, 1)
+        assert_array_equal(v, [-128, 0, 127])
+        assert_array_equal(j1, [0, 2, 1])
+        assert_array_equal(j2, [0, 2, 1, 2])
+        assert_array_equal(j3, [1, 1, 2])
+
+    def test_unique_axis(self):
+        a = np.array([[0, 1, 0], [1, 0, 1], [0, 1, 0], [1, 1, 1]])
+        for dt in ['i1', 'u8', '>i4', 'f8', 'b']:
+            aa = a.astype(dt)
+            v, j1, j2, j3 = unique(aa, True, True, True, axis=0)
+            assert_equal(v.dtype, aa.dtype)
+            assert_array_equal(v, aa[[0, 1, 3]])
+            assert_array_equal(j1, [0, 1, 3])
+            assert_array_equal(j2, [0, 1, 0, 2])
+            assert_array_equal(j3, [2, 1, 1])
+            v, j1, j2, j3 = unique(aa, True, True, True, axis=-1)
+            assert_array_equal(v, aa[:, [0, 1]])
+            assert_array_equal(j1, [0, 1])
+            assert_array_equal(j2, [0, 1, 0])
+            assert_array_equal(j3, [2, 1])
+
+        # Integers too large to be packed in a single key, and a 3-D array
+        rng = np.random.RandomState(0)
+        a = rng.randint(-2**62, 2**62, (50, 2, 2))
+        a = np.concatenate((a, a[::-2]), axis=0)
+        rows = [tuple(row.ravel()) for row in a]
+        expected = sorted(set(rows))
+        v, j1, j2 = unique(a, return_index=True, return_inverse=True, axis=0)
+        assert_array_equal([tuple(row.ravel()) for row in v], expected)
+        assert_array_equal(a[j1], v)
+        assert_array_equal(v[j2], a)
+        assert_array_equal(j1, [rows.index(row) for row in expected])
+        assert_array_equal(unique(a.swapaxes(0, 2), axis=2),
+                           v.swapaxes(0, 2))
+
+        assert_array_equal(unique(np.zeros((3, 0)), axis=0), np.zeros((1, 0)))
+        assert_array_equal(unique(np.zeros((0, 3)), axis=0), np.zeros((0, 3)))
+        assert_raises(ValueError, unique, [1, 2], axis=1)
+
+    def test_unique_structured_fields(self):
+        dt = [('a', 'i4'), ('b', 'f8')]
+        a = np.array([(1, 0.5), (0, 2.), (1, 0.5), (1, -1.)], dt)
+        v, j1, j2, j3 = unique(a, True, True, True)
+        assert_array_equal(v, a[[1, 3, 0]])
+        assert_array_equal(j1, [1, 3, 0])
+        assert_array_equal(j2, [2, 0, 2, 1])
+        assert_array_equal(j3, [1, 1, 2])
+
     def test_intersect1d(self):
         # unique inputs
         a = np.array([5, 7, 1, 2])
@@ -230,6 +299,75 @@ class TestSetOps(TestCase):
 
         assert_array_equal(in1d([], []), [])
 
+    def test_in1d_kind(self):
+        rng = np.random.RandomState(0)
+        for dtype in [np.bool_, np.int8, np.uint8, np.int16, np.int32,
+                      np.uint32, np.int64, np.uint64, np.float16, np.float32,
+                      np.float64, '>i4', '>f8']:
+            # Spans selecting the direct-address and the open addressing
+            # tables
+            for span in [50, 2**62]:
+                a = rng.randint(-50, 50, 1000).astype(np.int64)
+                b = rng.randint(-50, 50, 300).astype(np.int64)
+                if span > 50 and np.dtype(dtype).itemsize == 8:
+                    a *= span // 50
+                    b *= span // 50
+                a = a.astype(dtype)
+                b = b.astype(dtype)
+                for invert in [False, True]:
+                    expected = in1d(a, b, invert=invert, kind='sort')
+                    assert_array_equal(in1d(a, b, invert=invert, kind='hash'),
+                                       expected)
+                    assert_array_equal(in1d(a, b, invert=invert), expected)
+
+        # Values are compared as with ==
+        a = np.array([0., -0., np.nan, 1., np.inf, 2.])
+        b = np.array([-0., np.nan, 1, np.inf])
+        ec = [True, True, False, True, True, False]
+        assert_array_equal(in1d(a, b, kind='hash'), ec)
+        assert_array_equal(in1d(a, [0], kind='hash'),
+                           [True, True, False, False, False, False])
+        assert_array_equal(in1d(a.astype(np.float32), b, kind='hash'), ec)
+        assert_array_equal(in1d([1, 2], [np.nan], kind='hash'), [0, 0])
+        assert_array_equal(in1d([1, 2], [], kind='hash'), [0, 0])
+        assert_array_equal(in1d([], [1, 2], kind='hash', invert=True), [])
+
+        assert_raises(ValueError, in1d, a, b, kind='loop')
+        assert_raises(TypeError, in1d, ['a'], ['a', 'b'], kind='hash')
+
+        # The set operations built on in1d
+        a = rng.randint(0, 2**40, 500)
+        b = np.concatenate((a[::3], rng.randint(0, 2**40, 500)))
+        assert_array_equal(intersect1d(a, b),
+                           sorted(set(a.tolist()) & set(b.tolist())))
+        assert_array_equal(intersect1d(a[::2], a[::3], assume_unique=True),
+                           sorted(set(a[::6].tolist())))
+        assert_array_equal(setdiff1d(a, b),
+                           sorted(set(a.tolist()) - set(b.tolist())))
+        assert_equal(intersect1d(a.astype(np.int32), b).dtype, np.int64)
+
+    def test_assume_sorted(self):
+        rng = np.random.RandomState(0)
+        for n1, n2 in [(0, 0), (0, 5), (5, 0), (10, 1000), (1000, 10),
+                       (500, 500)]:
+            for dt1, dt2 in [(np.int64, np.int64), (np.int32, np.float64),
+                             (np.uint8, np.int16)]:
+                a = np.sort(rng.randint(0, 100, n1)).astype(dt1)
+                b = np.sort(rng.randint(0, 100, n2)).astype(dt2)
+                for func in [intersect1d, setxor1d, setdiff1d]:
+                    for assume_unique in [False, True]:
+                        if assume_unique:
+                            a, b = unique(a), unique(b)
+                        expected = func(a, b, assume_unique=assume_unique)
+                        result = func(a, b, assume_unique=assume_unique,
+                                      assume_sorted=True)
+                        assert_equal(result.dtype, expected.dtype)
+                        assert_array_equal(result, expected)
+                expected = union1d(a, b)
+                result = union1d(a, b, assume_sorted=True)
+                assert_equal(result.dtype, expected.dtype)
+                assert_array_equal(result, expected)
+
     def test_in1d_char_array(self):
         a = np.array(['a', 'b', 'c', 'd', 'e', 'c', 'e', 'b'])
         b = np.array(['a', 'c'])
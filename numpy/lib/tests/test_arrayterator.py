@@ -6,7 +6,9 @@ from functools import reduce
 import numpy as np
 from numpy.random import randint
 from numpy.lib import Arrayterator
-from numpy.testing import assert_
+from numpy.testing import (
+    assert_, assert_equal, assert_array_equal, assert_raises
+    )
 
 
 def test():
@@ -47,6 +49,45 @@ def test():
     # Check that all elements are iterated correctly
     assert_(list(c.flat) == list(d.flat))
 
+
+def test_prefetch_order():
+    a = np.arange(3 * 4 * 5).reshape(3, 4, 5)
+    for buf_size in [None, 1, 7, 20, 59]:
+        blocks = list(Arrayterator(a, buf_size))
+        b = Arrayterator(a, buf_size, prefetch=2)
+        prefetched = list(b)
+        assert_equal(len(prefetched), len(blocks))
+        for block, expected in zip(prefetched, blocks):
+            assert_array_equal(block, expected)
+            assert_(block.flags.owndata)
+        assert_equal(b.bytes_read, a.nbytes)
+        assert_(b.wait_time >= 0)
+
+        f = np.asfortranarray(a)
+        for prefetch in [0, 3]:
+            c = Arrayterator(f, buf_size, prefetch=prefetch, order='A')
+            assert_equal(c.order, 'F')
+            for block in c:
+                assert_(block.size <= (buf_size or a.size))
+                assert_(block.flags.f_contiguous)
+            assert_equal(list(c.flat), list(f.ravel(order='F')))
+            assert_equal(list(c[1:, ::2].flat),
+                         list(f[1:, ::2].ravel(order='F')))
+
+    # Stop iterating before the end
+    for block in Arrayterator(a, 2, prefetch=1):
+        break
+
+    # Errors of the reading thread are raised by the iterator
+    class BadVar(object):
+        shape = (10,)
+
+        def __getitem__(self, index):
+            raise IOError("cannot read")
+
+    assert_raises(IOError, list, Arrayterator(BadVar(), 2, prefetch=1))
+    assert_raises(ValueError, Arrayterator, a, order='X')
+
 if __name__ == '__main__':
     from numpy.testing import run_module_suite
     run_module_suite()
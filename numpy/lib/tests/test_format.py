@@ -286,8 +286,8 @@ from io import BytesIO
 import numpy as np
 from numpy.compat import asbytes, asbytes_nested, sixu
 from numpy.testing import (
-    run_module_suite, assert_, assert_array_equal, assert_raises, raises,
-    dec, SkipTest
+    run_module_suite, assert_, assert_array_equal, assert_equal, assert_raises,
+    raises, dec, SkipTest
     )
 from numpy.lib import format
 
@@ -784,6 +784,141 @@ def test_read_array_header_2_0():
     assert_((shape, fortran, dtype) == ((3, 6), False, float))
 
 
+def test_read_header():
+    arr = np.ones((3, 6), dtype='>i4', order='F')
+    for version in [(1, 0), (2, 0)]:
+        s = BytesIO()
+        format.write_array(s, arr, version=version)
+        s.seek(0)
+        header = format.read_header(s)
+        assert_equal(header['version'], version)
+        assert_equal(header['shape'], (3, 6))
+        assert_(header['fortran_order'])
+        assert_equal(header['dtype'], np.dtype('>i4'))
+        assert_equal(header['offset'], s.tell())
+        assert_equal(len(s.getvalue()) - header['offset'], arr.nbytes)
+
+    fname = os.path.join(tempdir, 'header.npy')
+    np.save(fname, arr)
+    header = format.read_header(fname)
+    assert_equal(header['shape'], (3, 6))
+    assert_equal(os.path.getsize(fname) - header['offset'], arr.nbytes)
+
+    assert_raises(ValueError, format.read_header, BytesIO(b'not a npy file'))
+
+
+class CountingBytesIO(BytesIO):
+    def __init__(self, *args, **kwargs):
+        BytesIO.__init__(self, *args, **kwargs)
+        self.nbytes_read = 0
+
+    def read(self, *args):
+        data = BytesIO.read(self, *args)
+        self.nbytes_read += len(data)
+        return data
+
+
+def test_read_array_rows():
+    a = np.arange(60, dtype='<i8').reshape(10, 3, 2)
+    indices = [slice(None), slice(2, 7), slice(8, 1, -3), slice(5, 5),
+               [0, 1, 2, 7, 8, 3, 3], np.arange(10) % 3 == 0, [-1, -10],
+               4, -2, []]
+    for arr in [a, np.asfortranarray(a), a[:, 0, 0]]:
+        s = BytesIO()
+        format.write_array(s, arr)
+        for rows in indices:
+            s.seek(0)
+            out = format.read_array(s, rows=rows)
+            assert_array_equal(out, arr[rows])
+            assert_equal(out.dtype, arr.dtype)
+
+        s.seek(0)
+        assert_raises(IndexError, format.read_array, s, rows=[10])
+        s.seek(0)
+        assert_raises(IndexError, format.read_array, s, rows=-11)
+
+    # Only the requested rows are read
+    s = CountingBytesIO()
+    format.write_array(s, a)
+    s.seek(0)
+    s.nbytes_read = 0
+    format.read_array(s, rows=[1, 2, 7])
+    header_size = len(s.getvalue()) - a.nbytes
+    assert_equal(s.nbytes_read, header_size + 3 * 6 * 8)
+
+    s = BytesIO()
+    format.write_array(s, np.ones(()))
+    s.seek(0)
+    assert_raises(ValueError, format.read_array, s, rows=0)
+
+
+def test_read_array_fields():
+    dt = np.dtype([('x', '<i4'), ('y', '<f8', (2,)), ('z', 'S3')])
+    arr = np.zeros(5, dtype=dt)
+    arr['x'] = np.arange(5)
+    arr['y'] = np.arange(10.).reshape(5, 2)
+    arr['z'] = [b'a', b'bb', b'ccc', b'd', b'e']
+    s = BytesIO()
+    format.write_array(s, arr)
+
+    s.seek(0)
+    out = format.read_array(s, fields='y', rows=slice(1, 3))
+    assert_array_equal(out, arr['y'][1:3])
+    s.seek(0)
+    out = format.read_array(s, fields=['z', 'x'])
+    assert_equal(out.dtype.names, ('z', 'x'))
+    assert_array_equal(out['x'], arr['x'])
+    assert_array_equal(out['z'], arr['z'])
+
+    s.seek(0)
+    assert_raises(ValueError, format.read_array, s, fields=['w'])
+    s = BytesIO()
+    format.write_array(s, np.ones(3))
+    s.seek(0)
+    assert_raises(ValueError, format.read_array, s, fields=['x'])
+
+
+def test_npy_appender():
+    fname = os.path.join(tempdir, 'appender.npy')
+    a = np.arange(30, dtype='<i4').reshape(10, 3)
+    with format.NpyAppender(fname, dtype='<i4', shape=(3,)) as f:
+        assert_equal(f.shape, (0, 3))
+        assert_equal(np.load(fname).shape, (0, 3))
+        f.append(a[:4])
+        f.append(a[4])
+        f.flush()
+        assert_equal(np.load(fname), a[:5])
+        # Rows appended after the last flush are not visible yet
+        f.append(a[5:7])
+        assert_equal(np.load(fname), a[:5])
+        assert_raises(ValueError, f.append, np.zeros((2, 4)))
+        assert_equal(f.shape, (7, 3))
+    assert_equal(np.load(fname), a[:7])
+
+    with format.NpyAppender(fname, mode='a') as f:
+        assert_equal(f.dtype, np.dtype('<i4'))
+        f.append(a[7:])
+    assert_equal(np.load(fname), a)
+    assert_equal(np.load(fname, mmap_mode='r'), a)
+
+    # An interrupted writer leaves the flushed rows, and the rows written
+    # after the last flush are dropped when appending again.
+    f = format.NpyAppender(fname, mode='a')
+    f.append(a)
+    f._fp.flush()
+    f._fp.close()
+    assert_equal(np.load(fname), a)
+    with format.NpyAppender(fname, mode='a') as f:
+        f.append(a[:2])
+    assert_equal(np.load(fname), np.concatenate((a, a[:2])))
+
+    # Files without room in the header cannot be appended to
+    np.save(fname, a)
+    assert_raises(ValueError, format.NpyAppender, fname, mode='a')
+    np.save(fname, np.asfortranarray(a))
+    assert_raises(ValueError, format.NpyAppender, fname, mode='a')
+
+
 def test_bad_header():
     # header of length less than 2 should fail
     s = BytesIO()
@@ -15,9 +15,9 @@ from numpy.random import rand
 from numpy.lib import (
     add_newdoc_ufunc, angle, average, bartlett, blackman, corrcoef, cov,
     delete, diff, digitize, extract, flipud, gradient, hamming, hanning,
-    histogram, histogramdd, i0, insert, interp, kaiser, meshgrid, msort,
-    piecewise, place, select, setxor1d, sinc, split, trapz, trim_zeros,
-    unwrap, unique, vectorize,
+    histogram, histogramdd, HistogramAccumulator, i0, insert, interp, kaiser,
+    meshgrid, msort, piecewise, place, select, setxor1d, sinc, split, trapz,
+    trim_zeros, unwrap, unique, vectorize,
 )
 
 from numpy.compat import long
@@ -910,6 +910,115 @@ class TestVectorize(TestCase):
         x = np.arange(5)
         assert_array_equal(f(x), x)
 
+    def test_otypes_numeric(self):
+        # Numeric arguments are converted by the ufunc as it iterates.
+        def f(x, y):
+            return x - y if x > y else x + y
+
+        x = np.arange(12, dtype=np.int8).reshape(3, 4)
+        y = np.arange(0, 8, 2.)
+        for otypes in ['d', 'f', 'l', '?', 'O']:
+            res = vectorize(f, otypes=otypes)(x, y)
+            assert_equal(res.dtype, np.dtype(otypes))
+            expected = np.where(x > y, x - y, x + y).astype(otypes)
+            assert_array_equal(res, expected)
+        res = vectorize(f, otypes='d')(3, 1)
+        assert_equal(res.shape, ())
+        assert_equal(res, 2)
+        res = vectorize(lambda x: (x, -x), otypes='ld')(np.arange(3))
+        assert_array_equal(res[0], [0, 1, 2])
+        assert_array_equal(res[1], [0, -1, -2])
+        assert_equal(res[1].dtype, np.float64)
+        res = vectorize(f, otypes='d')(np.ones((0, 2)), 1)
+        assert_equal(res.shape, (0, 2))
+
+    def test_signature_simple(self):
+        def addsubtract(a, b):
+            if a > b:
+                return a - b
+            else:
+                return a + b
+
+        f = vectorize(addsubtract, signature='(),()->()')
+        r = f([0, 3, 6, 9], [1, 3, 5, 7])
+        assert_array_equal(r, [1, 6, 1, 2])
+
+    def test_signature_mean_last(self):
+        def mean(a):
+            return a.mean()
+
+        f = vectorize(mean, signature='(n)->()')
+        r = f([[1, 3], [2, 4]])
+        assert_array_equal(r, [2, 3])
+
+    def test_signature_center(self):
+        def center(a):
+            return a - a.mean()
+
+        f = vectorize(center, signature='(n)->(n)')
+        r = f([[1, 3], [2, 4]])
+        assert_array_equal(r, [[-1, 1], [-1, 1]])
+
+    def test_signature_two_outputs(self):
+        f = vectorize(lambda x: (x, x), signature='()->(),()')
+        r = f([1, 2, 3])
+        assert_(isinstance(r, tuple) and len(r) == 2)
+        assert_array_equal(r[0], [1, 2, 3])
+        assert_array_equal(r[1], [1, 2, 3])
+
+    def test_signature_outer(self):
+        f = vectorize(np.outer, signature='(a),(b)->(a,b)')
+        r = f([1, 2], [1, 2, 3])
+        assert_array_equal(r, [[1, 2, 3], [2, 4, 6]])
+
+        r = f([[[1, 2]]], [1, 2, 3])
+        assert_array_equal(r, [[[[1, 2, 3], [2, 4, 6]]]])
+
+        r = f([[1, 0], [2, 0]], [1, 2, 3])
+        assert_array_equal(r, [[[1, 2, 3], [0, 0, 0]],
+                               [[2, 4, 6], [0, 0, 0]]])
+
+        r = f([1, 2], [[1, 2, 3], [0, 0, 0]])
+        assert_array_equal(r, [[[1, 2, 3], [2, 4, 6]],
+                               [[0, 0, 0], [0, 0, 0]]])
+
+    def test_signature_computed_size(self):
+        f = vectorize(lambda x: x[:-1], signature='(n)->(m)')
+        r = f([1, 2, 3])
+        assert_array_equal(r, [1, 2])
+
+        r = f([[1, 2, 3], [2, 3, 4]])
+        assert_array_equal(r, [[1, 2], [2, 3]])
+
+    def test_signature_otypes(self):
+        f = vectorize(lambda x: x, signature='(n)->(n)', otypes=['float64'])
+        r = f([1, 2, 3])
+        assert_equal(r.dtype, np.dtype('float64'))
+        assert_array_equal(r, [1, 2, 3])
+
+    def test_signature_size_zero(self):
+        f = vectorize(lambda x: x.sum(), otypes=[float],
+                      signature='(n)->()')
+        assert_equal(f(np.zeros((0, 3))).shape, (0,))
+        assert_raises(ValueError, vectorize(np.sum, signature='(n)->()'),
+                      np.zeros((0, 3)))
+        f = vectorize(lambda x: x, otypes=[float], signature='(n)->(m)')
+        assert_raises(ValueError, f, np.zeros((0, 3)))
+
+    def test_signature_invalid(self):
+        assert_raises(ValueError, vectorize, None, signature='(n)->')
+        assert_raises(ValueError, vectorize, None, signature='(n)(m)->()')
+        assert_raises(ValueError, vectorize, None, signature='()->()',
+                      otypes='dd')
+
+        f = vectorize(lambda x: x, signature='(n)->(n)')
+        assert_raises(ValueError, f, 1)
+        f = vectorize(np.dot, signature='(n),(n)->()')
+        assert_raises(ValueError, f, [1, 2], [1, 2, 3])
+        assert_raises(TypeError, f, [1, 2])
+        f = vectorize(lambda x: x, signature='()->(),()')
+        assert_raises(ValueError, f, [1, 2])
+
 
 class TestDigitize(TestCase):
 
@@ -1303,6 +1412,25 @@ class TestHistogram(TestCase):
         assert_array_equal(a, np.array([0]))
         assert_array_equal(b, np.array([0, 1]))
 
+    def test_bin_edges(self):
+        # Few edges are searched for each value, while the values are
+        # sorted if there are more edges than values in a block.
+        rng = np.random.RandomState(0)
+        for nbins in [10, 100000]:
+            v = (rng.randint(0, nbins, 200000) + 0.5) / nbins
+            v[:10] = 1
+            v[10:20] = 2
+            v[20:30] = np.nan
+            w = rng.rand(v.size)
+            edges = np.linspace(0, 1, nbins + 1)
+            for weights in [None, w, w.astype(np.complex), w.astype(int)]:
+                h, e = histogram(v, edges, weights=weights)
+                with np.errstate(invalid='ignore'):
+                    h0, e0 = histogram(v, nbins, (0, 1), weights=weights)
+                assert_equal(h.dtype, h0.dtype)
+                assert_allclose(h, h0)
+                assert_array_equal(e, e0)
+
     def test_finite_range(self):
         # Normal ranges should be fine
         vals = np.linspace(0.0, 1.0, num=100)
@@ -1311,6 +1439,65 @@ class TestHistogram(TestCase):
         assert_raises(ValueError, histogram, vals, range=[0.25,np.inf])
         
 
+class TestHistogramAccumulator(TestCase):
+
+    def test_update(self):
+        rng = np.random.RandomState(1)
+        v = rng.lognormal(size=200000)
+        w = rng.rand(200000)
+        for bins, range in [(10, (0, 5)), (np.logspace(-2, 1, 30), None)]:
+            for weights in [None, w, (w * 10).astype(int)]:
+                dt = None if weights is None else weights.dtype
+                acc = HistogramAccumulator(bins, range, dt)
+                for i in np.arange(0, len(v), 70000):
+                    if weights is None:
+                        acc.update(v[i:i + 70000])
+                    else:
+                        acc.update(v[i:i + 70000], weights[i:i + 70000])
+                h, e = acc.result()
+                h0, e0 = histogram(v, bins, range, weights=weights)
+                assert_equal(h.dtype, h0.dtype)
+                assert_allclose(h, h0)
+                assert_array_equal(e, e0)
+                d, e = acc.result(density=True)
+                assert_allclose(d, histogram(v, bins, range, density=True,
+                                             weights=weights)[0])
+
+    def test_merge(self):
+        acc = HistogramAccumulator(4, (0, 4))
+        acc.update([0, 1, 1])
+        acc.update(np.array([3.5, 2, 7]))
+        assert_array_equal(acc.result()[0], [1, 2, 1, 1])
+        other = HistogramAccumulator(4, (0, 4))
+        other.update([[3, 3]])
+        acc.merge(other)
+        assert_array_equal(acc.result()[0], [1, 2, 1, 3])
+        assert_array_equal(other.result()[0], [0, 0, 0, 2])
+
+        acc = HistogramAccumulator([0, 1, 3], weights_dtype=float)
+        acc.update([0.5, 2, 3], [1, 2, 3])
+        other = HistogramAccumulator([0, 1, 3], weights_dtype=float)
+        other.update([0.5], [0.5])
+        acc.merge(other)
+        assert_array_equal(acc.result()[0], [1.5, 5])
+
+        assert_raises(ValueError, acc.merge, HistogramAccumulator([0, 1, 2]))
+        assert_raises(ValueError, acc.merge, HistogramAccumulator([0, 1, 3]))
+        assert_raises(TypeError, acc.merge, histogram([1, 2]))
+
+    def test_errors(self):
+        assert_raises(ValueError, HistogramAccumulator, 4)
+        assert_raises(ValueError, HistogramAccumulator, 0, (0, 1))
+        assert_raises(ValueError, HistogramAccumulator, 4, (1, 0))
+        assert_raises(ValueError, HistogramAccumulator, 4, (0, np.inf))
+        assert_raises(ValueError, HistogramAccumulator, [1, 0])
+        assert_raises(TypeError, HistogramAccumulator, 'auto', (0, 1))
+        acc = HistogramAccumulator(4, (0, 4))
+        assert_raises(ValueError, acc.update, [1, 2], [1, 2])
+        acc = HistogramAccumulator(4, (0, 4), float)
+        assert_raises(ValueError, acc.update, [1, 2], [1, 2, 3])
+
+
 class TestHistogramOptimBinNums(TestCase):
     """
     Provide test coverage when using provided estimators for optimal number of
@@ -1529,6 +1716,10 @@ class TestHistogramdd(TestCase):
         assert_array_max_ulp(a, np.array([[0.]]))
         a, b = np.histogramdd([[], [], []], bins=2)
         assert_array_max_ulp(a, np.zeros((2, 2, 2)))
+        # Normalizing an empty histogram gives zeros, not NaN
+        a, b = assert_no_warnings(np.histogramdd, np.zeros((0, 2)), bins=3,
+                                  normed=True)
+        assert_array_equal(a, np.zeros((3, 3)))
 
     def test_bins_errors(self):
         # There are two ways to specify bins. Check for the right errors
@@ -1577,6 +1768,30 @@ class TestHistogramdd(TestCase):
         assert_(hist[0] == 0.0)
         assert_(hist[1] == 0.0)
 
+    def test_uniform_bins(self):
+        # The bin indices of equal-width bins are computed, those of other
+        # bins are searched, and the samples are counted by blocks.
+        rng = np.random.RandomState(0)
+        x = rng.uniform(-3, 3, (200000, 2))
+        x[:10] = 3
+        x[10:20] = [3 + 1e-12, -3]
+        x[20:30] = np.nan
+        w = rng.rand(len(x))
+        edges = [np.linspace(-3, 3, 31), np.linspace(-3, 3, 61)]
+        for weights in [None, w]:
+            h, e = histogramdd(x, (30, 60), [(-3, 3), (-3, 3)],
+                               weights=weights)
+            h0, e0 = histogramdd(x, edges, weights=weights)
+            assert_allclose(h, h0)
+            assert_array_equal(e[0], e0[0])
+            assert_array_equal(e[1], e0[1])
+            h1, e1 = histogramdd([x[:, 0], x[:, 1]], (30, 60),
+                                 [(-3, 3), (-3, 3)], weights=weights)
+            assert_array_equal(h, h1)
+            if weights is None:
+                # Only the nan are outliers
+                assert_equal(h.sum(), 199990)
+
     def test_finite_range(self):
         vals = np.random.random((100, 3))
         histogramdd(vals, range=[[0.0, 1.0], [0.25, 0.75], [0.25, 0.5]])
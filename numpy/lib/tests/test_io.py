@@ -173,6 +173,22 @@ class TestSaveLoad(RoundtripTest, TestCase):
         assert_equal(self.arr[0].dtype, self.arr_reloaded.dtype)
         assert_equal(self.arr[0].flags.fnc, self.arr_reloaded.flags.fnc)
 
+    def test_rows_fields(self):
+        a = np.zeros((20, 3), dtype=[('x', 'i4'), ('y', 'f8')])
+        a['x'] = np.arange(60).reshape(20, 3)
+        a['y'] = -a['x']
+        rows = [3, 4, 5, 19, 0]
+        with temppath(suffix='.npy') as tmp:
+            np.save(tmp, a)
+            assert_equal(np.load(tmp, rows=slice(2, 9)), a[2:9])
+            assert_equal(np.load(tmp, rows=rows, fields='y'), a[rows]['y'])
+            assert_equal(np.load(tmp, mmap_mode='r', rows=rows, fields='x'),
+                         a[rows]['x'])
+        c = BytesIO()
+        np.savez(c, a=a)
+        c.seek(0)
+        assert_raises(ValueError, np.load, c, rows=rows)
+
 
 class TestSavezLoad(RoundtripTest, TestCase):
     def roundtrip(self, *args, **kwargs):
@@ -228,6 +244,123 @@ class TestSavezLoad(RoundtripTest, TestCase):
         assert_equal(a, l.f.file_a)
         assert_equal(b, l.f.file_b)
 
+    @np.testing.dec.knownfailureif(sys.platform == 'win32', "Fail on Win32")
+    def test_mmap_members(self):
+        a = np.arange(12.).reshape(3, 4)
+        b = np.asfortranarray(a)
+        c = np.array([None, 1], dtype=object)
+        with temppath(suffix='.npz') as tmp:
+            np.savez(tmp, a=a, b=b, c=c)
+            with np.load(tmp, mmap_mode='r') as l:
+                assert_(isinstance(l['a'], np.memmap))
+                assert_equal(l['a'], a)
+                assert_(isinstance(l['b'], np.memmap))
+                assert_(l['b'].flags.f_contiguous)
+                assert_equal(l['b'], b)
+                # Object arrays can not be memory-mapped
+                assert_(not isinstance(l['c'], np.memmap))
+                assert_equal(l['c'], c)
+                assert_raises(ValueError, l['a'].__setitem__, 0, 1.)
+
+            with np.load(tmp, mmap_mode='c') as l:
+                x = l['a']
+                x[0] = -1
+            with np.load(tmp) as l:
+                assert_equal(l['a'], a)
+
+            # Writable modes fall back to reading the arrays
+            for mode in ['r+', 'w+']:
+                with warnings.catch_warnings(record=True) as w:
+                    warnings.simplefilter('always')
+                    with np.load(tmp, mmap_mode=mode) as l:
+                        assert_(not isinstance(l['a'], np.memmap))
+                        assert_equal(l['a'], a)
+                assert_equal(len(w), 1)
+
+            # Compressed members are read into memory
+            np.savez_compressed(tmp, a=a)
+            with np.load(tmp, mmap_mode='r') as l:
+                assert_(not isinstance(l['a'], np.memmap))
+                assert_equal(l['a'], a)
+
+    def test_info(self):
+        a = np.arange(12.).reshape(3, 4)
+        b = np.asfortranarray(a.astype('<i2'))
+        for savez in [np.savez, np.savez_compressed]:
+            c = BytesIO()
+            savez(c, a=a, b=b)
+            c.seek(0)
+            with np.load(c) as l:
+                info = l.info()
+                assert_equal(sorted(info), ['a', 'b'])
+                assert_equal(info['a']['shape'], (3, 4))
+                assert_equal(info['a']['dtype'], a.dtype)
+                assert_(not info['a']['fortran_order'])
+                assert_equal(info['b']['dtype'], np.dtype('<i2'))
+                assert_(info['b']['fortran_order'])
+                for name, arr in [('a', a), ('b', b)]:
+                    item = info[name]
+                    assert_equal(item['size'] - item['offset'], arr.nbytes)
+                    if savez is np.savez:
+                        assert_equal(item['compressed_size'], item['size'])
+
+    def test_savez_compressed_workers(self):
+        import zipfile
+        a = np.arange(1000.).reshape(10, 100)
+        b = np.asfortranarray(a)
+        c = a[:, ::3]
+        d = np.array([None, 'obj', 1], dtype=object)
+        e = np.zeros((0, 4))
+        old_chunksize = np.lib.npyio._savez_chunksize
+        np.lib.npyio._savez_chunksize = 1000
+        try:
+            f = BytesIO()
+            np.savez_compressed(f, a, b=b, c=c, d=d, e=e, workers=3)
+        finally:
+            np.lib.npyio._savez_chunksize = old_chunksize
+        f.seek(0)
+        zipf = zipfile.ZipFile(f)
+        assert_(zipf.testzip() is None)
+        assert_(all(info.compress_type == zipfile.ZIP_DEFLATED
+                    for info in zipf.infolist()))
+        f.seek(0)
+        l = np.load(f)
+        assert_equal(sorted(l.files), ['arr_0', 'b', 'c', 'd', 'e'])
+        assert_equal(l['arr_0'], a)
+        assert_equal(l['b'], b)
+        assert_(l['b'].flags.f_contiguous)
+        assert_equal(l['c'], c)
+        assert_equal(l['d'], d)
+        assert_equal(l['e'].shape, (0, 4))
+
+    def test_savez_compressed_workers_fallback(self):
+        # Where the zipfile internals are not known, compress serially
+        import zipfile
+        a = np.arange(1000.).reshape(10, 100)
+        old_supported = np.lib.npyio._savez_threads_supported
+        np.lib.npyio._savez_threads_supported = False
+        try:
+            f = BytesIO()
+            np.savez_compressed(f, a, b=a[:, ::3], workers=3)
+        finally:
+            np.lib.npyio._savez_threads_supported = old_supported
+        f.seek(0)
+        assert_(zipfile.ZipFile(f).testzip() is None)
+        f.seek(0)
+        l = np.load(f)
+        assert_equal(l['arr_0'], a)
+        assert_equal(l['b'], a[:, ::3])
+
+    def test_savez_compressed_workers_array(self):
+        # Arrays named 'workers' are still saved, with a deprecation
+        a = np.arange(3)
+        f = BytesIO()
+        assert_warns(DeprecationWarning, np.savez_compressed, f, workers=a)
+        f.seek(0)
+        l = np.load(f)
+        assert_equal(l.files, ['workers'])
+        assert_equal(l['workers'], a)
+
     def test_savez_filename_clashes(self):
         # Test that issue #852 is fixed
         # and savez functions in multithreaded environment
@@ -448,6 +581,31 @@ class TestSaveTxt(TestCase):
             [b'(3.142e+00+2.718e+00j) (3.142e+00+2.718e+00j)\n',
              b'(3.142e+00+2.718e+00j) (3.142e+00+2.718e+00j)\n'])
 
+    def test_blocks(self):
+        # The output does not depend on how the rows are split in blocks,
+        # nor on whether the values are formatted as Python numbers
+        a = np.arange(-20, 40).reshape(20, 3) / 7.
+        b = np.zeros(20, dtype=[('x', 'i8'), ('y', 'f4')])
+        b['x'] = np.arange(20) ** 3
+        b['y'] = np.arange(20) / 3.
+        tests = [(a, '%.18e', '%.18e %.18e %.18e\n'),
+                 (a.astype(np.float32), '%10.3f', '%10.3f %10.3f %10.3f\n'),
+                 (a, '%s', '%s %s %s\n'),
+                 (a * 1000, '%d', '%d %d %d\n'),
+                 (b, ['%d', '%.6e'], '%d %.6e\n'),
+                 (b, '%s', '%s %s\n')]
+        old_chunksize = np.lib.npyio._savetxt_chunksize
+        try:
+            for chunksize in [1, 7, old_chunksize]:
+                np.lib.npyio._savetxt_chunksize = chunksize
+                for arr, fmt, row_fmt in tests:
+                    c = BytesIO()
+                    np.savetxt(c, arr, fmt=fmt)
+                    expected = ''.join([row_fmt % tuple(row) for row in arr])
+                    assert_equal(c.getvalue(), asbytes(expected))
+        finally:
+            np.lib.npyio._savetxt_chunksize = old_chunksize
+
     def test_custom_writer(self):
 
         class CustomWriter(list):
@@ -856,6 +1014,69 @@ class TestLoadTxt(TestCase):
         dt = np.dtype([('x', int), ('a', 'S10'), ('y', int)])
         np.loadtxt(c, delimiter=',', dtype=dt, comments=None)  # Should succeed
 
+    def test_multiple_blocks(self):
+        # Data spanning several conversion blocks is assembled in order
+        old_chunksize = np.lib.npyio._loadtxt_chunksize
+        np.lib.npyio._loadtxt_chunksize = 3
+        try:
+            data = '\n'.join('%d %d.5' % (i, i) for i in range(10))
+            x = np.loadtxt(TextIO(data))
+            assert_array_equal(x, [[i, i + 0.5] for i in range(10)])
+
+            x = np.loadtxt(TextIO(data), usecols=0, dtype=int)
+            assert_array_equal(x, np.arange(10))
+
+            dt = np.dtype([('x', int), ('y', float)])
+            x = np.loadtxt(TextIO(data), dtype=dt)
+            assert_array_equal(x['x'], np.arange(10))
+            assert_array_equal(x['y'], np.arange(10) + 0.5)
+
+            dt = np.dtype([('x', int), ('y', [('t', float)])])
+            x = np.loadtxt(TextIO(data), dtype=dt)
+            assert_array_equal(x['y']['t'], np.arange(10) + 0.5)
+
+            x = np.loadtxt(TextIO(data), dtype='S')
+            assert_(x.dtype == np.dtype('S3'))
+            assert_equal(x.shape, (10, 2))
+
+            # Line numbers are counted across blocks
+            c = TextIO(data + '\n\n1 2 3')
+            assert_raises_regex(ValueError, "line 12", np.loadtxt, c)
+        finally:
+            np.lib.npyio._loadtxt_chunksize = old_chunksize
+
+    def test_iter_loadtxt(self):
+        data = '\n'.join('%d %d' % (i, 2 * i) for i in range(7))
+        chunks = list(np.iter_loadtxt(TextIO(data), dtype=int, chunksize=3))
+        assert_equal([len(c) for c in chunks], [3, 3, 1])
+        # Chunks are not squeezed
+        assert_equal(chunks[-1].shape, (1, 2))
+        assert_array_equal(np.concatenate(chunks),
+                           np.loadtxt(TextIO(data), dtype=int))
+
+        chunks = np.iter_loadtxt(TextIO(data), usecols=1, chunksize=3)
+        assert_array_equal(next(chunks), [0, 2, 4])
+
+        dt = np.dtype([('a', int), ('b', float)])
+        chunks = np.iter_loadtxt(TextIO(data), dtype=dt, chunksize=5,
+                                 unpack=True)
+        a, b = next(chunks)
+        assert_array_equal(a, [0, 1, 2, 3, 4])
+        assert_(b.dtype == np.float)
+
+        # The size of flexible types is locked after the first chunk
+        chunks = list(np.iter_loadtxt(TextIO('a\nb\ncc'), dtype='S',
+                                      chunksize=2))
+        assert_array_equal(chunks[1], [b'c'])
+        assert_(chunks[1].dtype == np.dtype('S1'))
+
+        # Line numbers are counted from the beginning of the file
+        chunks = np.iter_loadtxt(TextIO(data + '\n1 2 3'), chunksize=3)
+        assert_raises_regex(ValueError, "line 8", list, chunks)
+
+        assert_raises(ValueError, next,
+                      np.iter_loadtxt(TextIO(data), chunksize=0))
+
 
 class Testfromregex(TestCase):
     # np.fromregex expects files opened in binary mode.
@@ -891,6 +1112,31 @@ class Testfromregex(TestCase):
         a = np.array([(1312,), (1534,), (4444,)], dtype=dt)
         assert_array_equal(x, a)
 
+    def test_blocksize(self):
+        data = ''.join(['%d key%d\n' % (i, i % 7) for i in range(100)])
+        data += 'no match\n12 last'
+        for dt, regexp in [([('num', np.int64), ('key', 'S4')],
+                            r"(\d+)\s+(key\d)"),
+                           ([('num', np.int64)], r"(\d+)\s+(?:key|last)")]:
+            control = np.fromregex(TextIO(data), regexp, dt)
+            assert_equal(len(control), 100 + (len(dt) == 1))
+            for blocksize in [1, 5, 64, 10000]:
+                test = np.fromregex(TextIO(data), regexp, dt,
+                                    blocksize=blocksize)
+                assert_equal(test.dtype, control.dtype)
+                assert_array_equal(test, control)
+
+                chunks = list(np.iter_fromregex(TextIO(data), regexp, dt,
+                                                blocksize=blocksize))
+                assert_(all(len(chunk) for chunk in chunks))
+                assert_array_equal(np.concatenate(chunks), control)
+
+        test = np.fromregex(TextIO('nothing'), r"(\d+)", [('num', int)],
+                            blocksize=3)
+        assert_equal(test.shape, (0,))
+        assert_raises(ValueError, np.fromregex, TextIO(data), r"(\d+)",
+                      [('num', int)], blocksize=0)
+
 
 #####--------------------------------------------------------------------------
 
@@ -1723,6 +1969,25 @@ M   33  21.99
         self.assertTrue(isinstance(test, np.recarray))
         assert_equal(test, control)
 
+    def test_infer_rows(self):
+        # Test the `infer_rows` keyword argument.
+        data = '1,a,1\n2,b,2\n3.5,cc,N/A\nx,ddd,4\n'
+        test = np.genfromtxt(TextIO(data), dtype=None, delimiter=',',
+                             missing_values='N/A', infer_rows=2)
+        control = np.array([(1, b'a', 1), (2, b'b', 2), (-1, b'cc', -1),
+                            (-1, b'ddd', 4)],
+                           dtype=[('f0', int), ('f1', 'S3'), ('f2', int)])
+        assert_equal(test, control)
+
+        test = np.genfromtxt(TextIO(data), dtype=None, delimiter=',',
+                             missing_values='N/A')
+        assert_equal(test.dtype, np.dtype([('f0', 'S3'), ('f1', 'S3'),
+                                           ('f2', int)]))
+
+        assert_raises(ValueError, np.genfromtxt, TextIO(data), dtype=None,
+                      delimiter=',', infer_rows=2, loose=False)
+        assert_raises(ValueError, np.genfromtxt, TextIO(data), infer_rows=0)
+
     def test_max_rows(self):
         # Test the `max_rows` keyword argument.
         data = '1 2\n3 4\n5 6\n7 8\n9 10\n'
@@ -1777,6 +2042,45 @@ M   33  21.99
                       dtype=[('c', '<f8'), ('d', '<f8')])
         assert_equal(test, control)
 
+    def test_iter_genfromtxt(self):
+        data = 'a,b\n1,x\n2,y\n3,zz\n4,w\n5,v\n'
+        chunks = list(np.iter_genfromtxt(TextIO(data), chunksize=2,
+                                         delimiter=',', dtype=None,
+                                         names=True))
+        assert_equal([len(c) for c in chunks], [2, 2, 1])
+        # Names and types are inferred from the first chunk only
+        for chunk in chunks:
+            assert_(chunk.dtype == np.dtype([('a', int), ('b', 'S1')]))
+        assert_equal(chunks[1]['b'], [b'z', b'w'])
+        assert_equal(chunks[2]['a'], [5])
+
+        # Chunks are not squeezed
+        data = '1 2\n3 4\n5 6\n'
+        chunks = list(np.iter_genfromtxt(TextIO(data), chunksize=2))
+        assert_equal(chunks[0], [[1, 2], [3, 4]])
+        assert_equal(chunks[1], [[5, 6]])
+        chunks = list(np.iter_genfromtxt(TextIO(data), chunksize=2,
+                                         unpack=True))
+        assert_equal(chunks[1], [[5], [6]])
+
+        # Masked chunks
+        data = '1,2\n,4\n5,\n'
+        chunks = list(np.iter_genfromtxt(TextIO(data), chunksize=2,
+                                         delimiter=',', usemask=True))
+        assert_equal(chunks[0].mask, [[False, False], [True, False]])
+        assert_equal(chunks[1].mask, [[False, True]])
+
+        # Invalid lines are reported with their line in the file
+        data = '1 1\n2 2\n3 3\n4\n'
+        chunks = np.iter_genfromtxt(TextIO(data), chunksize=2)
+        next(chunks)
+        assert_raises_regex(ValueError, "Line #4", next, chunks)
+
+        assert_raises(ValueError, next,
+                      np.iter_genfromtxt(TextIO(data), skip_footer=1))
+        assert_raises(ValueError, next,
+                      np.iter_genfromtxt(TextIO(data), chunksize=0))
+
     def test_gft_using_filename(self):
         # Test that we can load data from a filename as well as a file
         # object
@@ -1875,6 +2179,55 @@ def test_gzip_loadtxt_from_string():
     assert_array_equal(np.loadtxt(f), [1, 2, 3])
 
 
+def test_gzip_cache():
+    a = np.arange(12.).reshape(4, 3)
+    with tempdir() as tmpdir:
+        cache = np.DecompressedCache(os.path.join(tmpdir, 'cache'))
+        name = os.path.join(tmpdir, 'a.txt.gz')
+        g = gzip.open(name, 'wb')
+        np.savetxt(g, a)
+        g.close()
+        for i in range(2):
+            assert_array_equal(np.loadtxt(name, cache=cache), a)
+            assert_array_equal(np.genfromtxt(name, cache=cache), a)
+        chunks = list(np.iter_loadtxt(name, chunksize=3, cache=cache))
+        assert_array_equal(np.concatenate(chunks), a)
+        assert_equal(len(os.listdir(cache.cachedir)), 1)
+
+        name = os.path.join(tmpdir, 'a.npy.gz')
+        g = gzip.open(name, 'wb')
+        np.save(g, a)
+        g.close()
+        assert_array_equal(np.load(name, cache=cache), a)
+        b = np.load(name, mmap_mode='r', cache=cache)
+        assert_(isinstance(b, np.memmap))
+        assert_array_equal(b, a)
+        del b
+        b = np.load(name, mmap_mode='c', cache=cache)
+        b[0] = -1
+        del b
+        assert_array_equal(np.load(name, cache=cache), a)
+        assert_raises(ValueError, np.load, name, mmap_mode='r+', cache=cache)
+
+        # An entry evicted by another process between finding and opening
+        # it is decompressed again
+        path = cache.path
+        evicted = []
+
+        def evicting_path(fname):
+            entry = path(fname)
+            if not evicted:
+                os.remove(entry)
+                evicted.append(entry)
+            return entry
+
+        cache.path = evicting_path
+        assert_array_equal(np.load(name, mmap_mode='r', cache=cache), a)
+        del evicted[:]
+        assert_array_equal(np.loadtxt(name[:-7] + '.txt.gz', cache=cache), a)
+        assert_equal(len(evicted), 1)
+
+
 def test_npzfile_dict():
     s = BytesIO()
     x = np.zeros((3, 3))
@@ -27,6 +27,29 @@ class TestApplyAlongAxis(TestCase):
         assert_array_equal(apply_along_axis(np.sum, 0, a),
                            [[27, 30, 33], [36, 39, 42], [45, 48, 51]])
 
+    def test_axis(self):
+        a = np.arange(24).reshape(2, 3, 4)
+        for axis in range(-3, 3):
+            assert_array_equal(apply_along_axis(np.sum, axis, a),
+                               a.sum(axis))
+            assert_array_equal(apply_along_axis(np.cumsum, axis, a),
+                               np.cumsum(a, axis))
+        assert_raises(ValueError, apply_along_axis, np.sum, 3, a)
+
+    def test_result_shape(self):
+        a = np.arange(6).reshape(2, 3)
+        res = apply_along_axis(lambda x: x[:2], 1, a)
+        assert_array_equal(res, a[:, :2])
+        res = apply_along_axis(lambda x: np.outer(x, x), 0, a)
+        assert_equal(res.shape, (2, 2, 3))
+        assert_array_equal(res[:, :, 2], np.outer(a[:, 2], a[:, 2]))
+        assert_equal(apply_along_axis(np.sum, 0, np.arange(4)), 6)
+
+    def test_empty(self):
+        a = np.ones((0, 3))
+        assert_array_equal(apply_along_axis(len, 0, a), [0, 0, 0])
+        assert_raises(ValueError, apply_along_axis, len, 1, a)
+
 
 class TestApplyOverAxes(TestCase):
     def test_simple(self):
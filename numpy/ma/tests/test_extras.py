@@ -639,6 +639,15 @@ class TestApplyAlongAxis(TestCase):
         xa = apply_along_axis(myfunc, 2, a, offset=1)
         assert_equal(xa, [[2, 5], [8, 11]])
 
+    def test_axis_masked(self):
+        a = masked_array([[1, 2, 3], [4, 5, 6]],
+                         mask=[[0, 1, 0], [0, 0, 0]])
+        xa = apply_along_axis(lambda b: b[::-1], 0, a)
+        assert_equal(xa, [[4, 5, 6], [1, 2, 3]])
+        assert_equal(xa.mask, [[0, 0, 0], [0, 1, 0]])
+        xa = apply_along_axis(lambda b: b.count(), 1, a)
+        assert_equal(xa, [2, 3])
+
 
 class TestApplyOverAxes(TestCase):
     # Tests apply_over_axes